@@ -0,0 +1,173 @@
+"""
+사용자별 일일 메모 활동 집계 (MemoDailyActivity)
+
+메모가 저장/삭제될 때마다 해당 날짜의 집계 행을 증분 갱신하므로
+통계 화면은 memos_memo 전체를 다시 읽지 않고 집계 테이블만 조회합니다.
+"""
+from collections import Counter, defaultdict
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from .models import Memo, MemoDailyActivity
+
+
+PRIORITY_FIELDS = {
+    'low': 'low_count',
+    'normal': 'normal_count',
+    'high': 'high_count',
+    'urgent': 'urgent_count',
+}
+
+
+def record_activity(user_id, date, **deltas):
+    """(user, date) 집계 행의 카운터들을 deltas 만큼 증가시킵니다."""
+    deltas = {field: value for field, value in deltas.items() if value}
+    if not deltas:
+        return
+    with transaction.atomic():
+        updated = MemoDailyActivity.objects.filter(user_id=user_id, date=date).update(
+            **{field: F(field) + value for field, value in deltas.items()}
+        )
+        if updated:
+            return
+        try:
+            with transaction.atomic():
+                MemoDailyActivity.objects.create(user_id=user_id, date=date, **deltas)
+        except IntegrityError:
+            # 동시에 같은 행이 만들어진 경우 다시 증가
+            MemoDailyActivity.objects.filter(user_id=user_id, date=date).update(
+                **{field: F(field) + value for field, value in deltas.items()}
+            )
+
+
+def memo_saved(memo, created):
+    loaded = getattr(memo, '_loaded_values', {})
+    if created:
+        record_activity(
+            memo.author_id,
+            timezone.localdate(memo.created_at),
+            created_count=1,
+            words_added=memo.word_count,
+            **{PRIORITY_FIELDS.get(memo.priority, 'normal_count'): 1},
+        )
+    else:
+        old_word_count = loaded.get('word_count', memo.word_count)
+        old_author_id = loaded.get('author_id', memo.author_id)
+        if old_author_id != memo.author_id:
+            # 작성자가 바뀌면 작성 집계를 이전 작성자에서 새 작성자로 옮김
+            created_date = timezone.localdate(memo.created_at)
+            old_priority = loaded.get('priority', memo.priority)
+            record_activity(
+                old_author_id,
+                created_date,
+                created_count=-1,
+                words_added=-old_word_count,
+                **{PRIORITY_FIELDS.get(old_priority, 'normal_count'): -1},
+            )
+            record_activity(
+                memo.author_id,
+                created_date,
+                created_count=1,
+                words_added=memo.word_count,
+                **{PRIORITY_FIELDS.get(memo.priority, 'normal_count'): 1},
+            )
+            record_activity(memo.author_id, timezone.localdate(), updated_count=1)
+            return
+        record_activity(
+            memo.author_id,
+            timezone.localdate(),
+            updated_count=1,
+            words_added=memo.word_count - old_word_count,
+        )
+
+
+def memo_deleted(memo):
+    record_activity(
+        memo.author_id,
+        timezone.localdate(),
+        deleted_count=1,
+        words_added=-memo.word_count,
+    )
+
+
+def memos_created(memos):
+    """bulk_create 로 작성된 메모들을 (작성자, 날짜) 별로 묶어 한 번에 반영"""
+    totals = defaultdict(Counter)
+    for memo in memos:
+        deltas = totals[memo.author_id, timezone.localdate(memo.created_at)]
+        deltas['created_count'] += 1
+        deltas['words_added'] += memo.word_count
+        deltas[PRIORITY_FIELDS.get(memo.priority, 'normal_count')] += 1
+    for (user_id, date), deltas in totals.items():
+        record_activity(user_id, date, **deltas)
+
+
+def memos_updated(memos):
+    """bulk_update 로 수정된 메모들을 작성자별로 묶어 한 번에 반영"""
+    totals = defaultdict(Counter)
+    for memo in memos:
+        old_word_count = getattr(memo, '_loaded_values', {}).get('word_count', memo.word_count)
+        deltas = totals[memo.author_id]
+        deltas['updated_count'] += 1
+        deltas['words_added'] += memo.word_count - old_word_count
+    today = timezone.localdate()
+    for user_id, deltas in totals.items():
+        record_activity(user_id, today, **deltas)
+
+
+def memos_deleted(rows):
+    """QuerySet.delete() 로 삭제된 메모들을 반영 (rows: author_id, count, words)"""
+    today = timezone.localdate()
+    for row in rows:
+        record_activity(
+            row['author_id'],
+            today,
+            deleted_count=row['count'],
+            words_added=-(row['words'] or 0),
+        )
+
+
+def rebuild_activity(users=None, memo_model=Memo, activity_model=MemoDailyActivity):
+    """memos_memo 로부터 집계 테이블을 다시 만듭니다.
+
+    과거의 수정/삭제 이력은 남아 있지 않으므로 작성 수, 단어 수,
+    중요도별 작성 수만 복원되며 처리한 집계 행 수를 반환합니다.
+    마이그레이션에서는 memo_model, activity_model 에 과거 모델을 넘깁니다.
+    """
+    memos = memo_model.objects.all()
+    activities = activity_model.objects.all()
+    if users is not None:
+        memos = memos.filter(author__in=users)
+        activities = activities.filter(user__in=users)
+
+    rows = (
+        memos.annotate(date=TruncDate('created_at'))
+        .values('author_id', 'date')
+        .annotate(
+            created_count=Count('id'),
+            words_added=Sum('word_count'),
+            **{
+                field: Count('id', filter=Q(priority=priority))
+                for priority, field in PRIORITY_FIELDS.items()
+            },
+        )
+        .order_by()
+    )
+    count = 0
+    batch = []
+    with transaction.atomic():
+        activities.delete()
+        for row in rows.iterator(chunk_size=2000):
+            user_id = row.pop('author_id')
+            row['words_added'] = row['words_added'] or 0
+            batch.append(activity_model(user_id=user_id, **row))
+            if len(batch) >= 1000:
+                activity_model.objects.bulk_create(batch)
+                count += len(batch)
+                batch = []
+        activity_model.objects.bulk_create(batch)
+        count += len(batch)
+    return count
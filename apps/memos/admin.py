@@ -10,7 +10,7 @@ class MemoAdmin(admin.ModelAdmin):
     list_display = ['title', 'author', 'priority_display', 'is_pinned', 'word_count', 'created_at', 'updated_at']
     list_filter = ['priority', 'is_pinned', 'created_at', 'updated_at', 'author']
     search_fields = ['title', 'content', 'author__username']
-    readonly_fields = ['created_at', 'updated_at', 'word_count', 'character_count']
+    readonly_fields = ['created_at', 'updated_at', 'word_count', 'char_count']
     list_per_page = 25
     date_hierarchy = 'created_at'
     ordering = ['-is_pinned', '-updated_at']
@@ -24,7 +24,7 @@ class MemoAdmin(admin.ModelAdmin):
             'classes': ('collapse',)
         }),
         ('통계', {
-            'fields': ('word_count', 'character_count'),
+            'fields': ('word_count', 'char_count'),
             'classes': ('collapse',)
         }),
         ('시간 정보', {
@@ -53,16 +53,6 @@ class MemoAdmin(admin.ModelAdmin):
     priority_display.short_description = '중요도'
     priority_display.admin_order_field = 'priority'
     
-    def word_count(self, obj):
-        """단어 수 계산"""
-        return len(obj.content.split())
-    word_count.short_description = '단어 수'
-    
-    def character_count(self, obj):
-        """글자 수 계산"""
-        return len(obj.content)
-    character_count.short_description = '글자 수'
-    
     # 관리자 액션들
     def make_pinned(self, request, queryset):
         """선택된 메모들을 상단에 고정"""
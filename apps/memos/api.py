@@ -0,0 +1,238 @@
+"""
+메모 JSON API (일괄 작성/수정/삭제)
+
+연동 스크립트가 HTML 폼을 한 건씩 POST 하지 않고 요청 한 번에 수백 건의 메모를
+처리할 수 있도록 합니다. 요청마다 하나의 트랜잭션에서 bulk_create/bulk_update 로
+저장하고, 항목별 결과(생성된 id 또는 검증 오류)를 입력 순서대로 반환합니다.
+
+인증은 세션(CSRF 토큰 필요) 또는 HTTP Basic 인증을 사용합니다.
+"""
+import base64
+import binascii
+import json
+from collections import Counter
+from functools import wraps
+
+from django.conf import settings
+from django.contrib.auth import authenticate
+from django.core.exceptions import RequestDataTooBig
+from django.db import transaction
+from django.forms.models import model_to_dict
+from django.http import JsonResponse
+from django.middleware.csrf import CsrfViewMiddleware
+from django.utils import timezone
+from django.views.decorators.csrf import csrf_exempt
+from django.views.decorators.http import require_POST
+
+from memojjang.query_budget import query_budget
+
+from . import activity, ngram
+from .forms import MemoForm
+from .models import Memo
+
+
+FORM_FIELDS = MemoForm._meta.fields
+INDEXED_FIELDS = {'title', 'content'}
+DERIVED_FIELDS = {'word_count', 'preview', 'char_count'}
+
+
+class ApiError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.message = message
+        self.status = status
+
+
+def _basic_auth_user(request):
+    scheme, _, credentials = request.META.get('HTTP_AUTHORIZATION', '').partition(' ')
+    if scheme.lower() != 'basic':
+        return None
+    try:
+        username, _, password = base64.b64decode(credentials).decode().partition(':')
+    except (binascii.Error, UnicodeDecodeError):
+        raise ApiError('인증 헤더 형식이 올바르지 않습니다.', 401)
+    user = authenticate(request, username=username, password=password)
+    if user is None:
+        raise ApiError('아이디 또는 비밀번호가 올바르지 않습니다.', 401)
+    return user
+
+
+def _authenticate(request):
+    user = _basic_auth_user(request)
+    if user is not None:
+        return user
+    if not request.user.is_authenticated:
+        raise ApiError('로그인이 필요합니다.', 401)
+    # 세션 쿠키는 브라우저가 자동으로 보내므로 세션 인증에는 CSRF 검사를 적용
+    if CsrfViewMiddleware(lambda request: None).process_view(request, None, (), {}) is not None:
+        raise ApiError('CSRF 검증에 실패했습니다.', 403)
+    return request.user
+
+
+def api_view(view):
+    """JSON 오류 응답과 인증(세션 + CSRF 또는 HTTP Basic)을 처리하는 데코레이터"""
+    @csrf_exempt
+    @require_POST
+    @wraps(view)
+    def wrapped(request, *args, **kwargs):
+        try:
+            request.user = _authenticate(request)
+            return view(request, *args, **kwargs)
+        except ApiError as e:
+            response = JsonResponse({'error': e.message}, status=e.status)
+            if e.status == 401:
+                response['WWW-Authenticate'] = 'Basic realm="memojjang"'
+            return response
+    return wrapped
+
+
+def _load_items(request, key):
+    """요청 본문 {"<key>": [...]} 에서 항목 목록을 꺼냅니다."""
+    try:
+        payload = json.loads(request.body)
+    except RequestDataTooBig:
+        raise ApiError('요청 본문이 너무 큽니다.', 413)
+    except ValueError:
+        raise ApiError('JSON 형식이 올바르지 않습니다.')
+    items = payload.get(key) if isinstance(payload, dict) else None
+    if not isinstance(items, list):
+        raise ApiError(f'"{key}" 목록이 필요합니다.')
+    if len(items) > settings.MEMO_API_BULK_LIMIT:
+        raise ApiError(f'한 번에 최대 {settings.MEMO_API_BULK_LIMIT}개까지 처리할 수 있습니다.')
+    return items
+
+
+def _error(index, errors):
+    return {'index': index, 'status': 'error', 'errors': errors}
+
+
+def _valid_id(value):
+    # JSON 의 true/false 는 파이썬에서 int 의 하위 타입이므로 제외
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+INVALID_ID = {'id': ['id 는 정수여야 합니다.']}
+
+
+def _form_errors(form):
+    if form is None:
+        return {'__all__': ['메모는 JSON 객체여야 합니다.']}
+    return {field: [str(message) for message in messages] for field, messages in form.errors.items()}
+
+
+def _response(results):
+    return JsonResponse({
+        'results': results,
+        'summary': Counter(result['status'] for result in results),
+    })
+
+
+# 항목 수와 관계없이 거의 일정 (내용이 길면 n-gram 색인 저장 배치만 늘어남)
+@query_budget(30)
+@api_view
+def memo_bulk_create(request):
+    """메모 일괄 작성 API"""
+    items = _load_items(request, 'memos')
+    results = []
+    created = []
+    for index, item in enumerate(items):
+        form = None
+        if isinstance(item, dict):
+            # 생략한 필드는 모델 기본값 사용
+            form = MemoForm(data={**model_to_dict(Memo(), fields=FORM_FIELDS), **item})
+        if form is None or not form.is_valid():
+            results.append(_error(index, _form_errors(form)))
+            continue
+        memo = form.save(commit=False)
+        memo.author = request.user
+        # bulk_create 는 save() 를 거치지 않으므로 파생 필드를 직접 계산
+        memo.update_content_stats()
+        result = {'index': index, 'status': 'created'}
+        results.append(result)
+        created.append((result, memo))
+
+    memos = [memo for _, memo in created]
+    if memos:
+        with transaction.atomic():
+            Memo.objects.bulk_create(memos)
+            ngram.index_memos(memos)
+            activity.memos_created(memos)
+    for result, memo in created:
+        result.update(id=memo.pk, url=memo.get_absolute_url())
+    return _response(results)
+
+
+@query_budget(30)
+@api_view
+def memo_bulk_update(request):
+    """메모 일괄 수정 API (항목에 포함된 필드만 변경)"""
+    items = _load_items(request, 'memos')
+    ids = {item['id'] for item in items if isinstance(item, dict) and _valid_id(item.get('id'))}
+    results = []
+    with transaction.atomic():
+        memos = Memo.objects.select_for_update().filter(author=request.user, pk__in=ids).in_bulk()
+        seen = set()
+        changed = {}
+        fields = set()
+        now = timezone.now()
+        for index, item in enumerate(items):
+            if not isinstance(item, dict):
+                results.append(_error(index, _form_errors(None)))
+                continue
+            if not _valid_id(item.get('id')):
+                results.append(_error(index, INVALID_ID))
+                continue
+            memo = memos.get(item['id'])
+            if memo is None:
+                results.append(_error(index, {'id': ['메모를 찾을 수 없습니다.']}))
+                continue
+            if memo.pk in seen:
+                results.append(_error(index, {'id': ['같은 메모가 여러 번 포함되어 있습니다.']}))
+                continue
+            seen.add(memo.pk)
+            form = MemoForm(data={**model_to_dict(memo, fields=FORM_FIELDS), **item}, instance=memo)
+            if not form.is_valid():
+                results.append(_error(index, _form_errors(form)))
+                continue
+            if not form.changed_data:
+                results.append({'index': index, 'status': 'unchanged', 'id': memo.pk})
+                continue
+            fields.update(form.changed_data)
+            if 'content' in form.changed_data:
+                memo.update_content_stats()
+                fields.update(DERIVED_FIELDS)
+            # bulk_update 는 auto_now 를 적용하지 않음
+            memo.updated_at = now
+            changed[memo.pk] = (memo, set(form.changed_data))
+            results.append({'index': index, 'status': 'updated', 'id': memo.pk})
+
+        if changed:
+            Memo.objects.bulk_update([memo for memo, _ in changed.values()], [*fields, 'updated_at'])
+            ngram.index_memos(
+                memo for memo, memo_fields in changed.values() if memo_fields & INDEXED_FIELDS
+            )
+            activity.memos_updated(memo for memo, _ in changed.values())
+    return _response(results)
+
+
+@query_budget(30)
+@api_view
+def memo_bulk_delete(request):
+    """메모 일괄 삭제 API"""
+    ids = _load_items(request, 'ids')
+    with transaction.atomic():
+        found = set(
+            Memo.objects.filter(
+                author=request.user, pk__in=[pk for pk in ids if _valid_id(pk)]
+            ).values_list('pk', flat=True)
+        )
+        Memo.objects.filter(pk__in=found).delete()
+    results = []
+    for index, pk in enumerate(ids):
+        if not _valid_id(pk):
+            results.append(_error(index, INVALID_ID))
+        elif pk in found:
+            results.append({'index': index, 'status': 'deleted', 'id': pk})
+        else:
+            results.append(_error(index, {'id': ['메모를 찾을 수 없습니다.']}))
+    return _response(results)
@@ -1,6 +1,26 @@
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class MemosConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.memos'
+
+    def ready(self):
+        from memojjang.sqlite import configure_sqlite
+
+        from . import signals
+        from .models import Memo
+
+        # 관리 명령에서도 적용되도록 웹 요청과 관계없이 연결
+        connection_created.connect(configure_sqlite, dispatch_uid='memojjang_configure_sqlite')
+        post_migrate.connect(signals.sync_search_index_after_migrate, sender=self)
+        post_save.connect(signals.update_ngram_index, sender=Memo)
+        post_save.connect(signals.record_memo_saved, sender=Memo)
+        post_delete.connect(signals.record_memo_deleted, sender=Memo)
+        post_save.connect(signals.invalidate_user_cache, sender=Memo)
+        post_delete.connect(signals.invalidate_user_cache, sender=Memo)
+        # 캐시 버전을 올린 뒤에 이벤트를 보내도록 invalidate_user_cache 다음에 연결
+        post_save.connect(signals.publish_memo_saved, sender=Memo)
+        post_delete.connect(signals.publish_memo_deleted, sender=Memo)
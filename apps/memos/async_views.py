@@ -0,0 +1,222 @@
+"""
+메모 조회 뷰의 비동기(ASGI) 버전과 메모 변경 이벤트 스트림(SSE)
+
+동기 뷰는 ASGI 에서 요청마다 스레드(sync_to_async)에서 실행됩니다. 여기의 뷰는
+비동기 ORM(aiterator, acount, aget)과 비동기 캐시 API 를 사용하므로 느린 클라이언트
+연결이 많아도 요청마다 스레드를 점유하지 않습니다.
+memojjang/urls_asgi.py 에서 동기 뷰 대신 연결됩니다 (memojjang/asgi.py 참고).
+"""
+import asyncio
+import hashlib
+import json
+from functools import wraps
+
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
+from django.contrib.auth.views import redirect_to_login
+from django.core.paginator import InvalidPage, Page, Paginator
+from django.db import close_old_connections
+from django.db.models import Count, Max
+from django.http import Http404, JsonResponse, StreamingHttpResponse
+from django.shortcuts import render
+from django.views.decorators.http import require_GET, require_safe
+
+from memojjang.db_router import replica_reads
+from memojjang.query_budget import query_budget
+
+from .cache import aget_or_set_for_user
+from .conditional import (
+    acondition, adetail_etag, adetail_last_modified, amemos_etag, amemos_last_modified,
+)
+from .events import broker
+from .export import aexport_memos
+from .models import Memo
+from .pagination import InvalidCursor, KeysetPage, KeysetPaginator
+from .views import (
+    MemoDetailView, MemoListView, _export_response, _list_queryset, _search_queryset, _search_result, revalidate,
+)
+
+
+def login_required_async(view):
+    """비동기 뷰용 로그인 확인
+
+    사용자를 비동기로 읽어 request.user 에 넣어 두므로, 이후 템플릿이나 메시지 처리 같은
+    동기 코드가 request.user 를 평가하며 DB 에 접근하지 않습니다.
+    """
+    @wraps(view)
+    async def wrapped(request, *args, **kwargs):
+        request.user = await request.auser()
+        if not request.user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+        return await view(request, *args, **kwargs)
+    return wrapped
+
+
+async def _keyset_page(request, queryset, per_page):
+    paginator = KeysetPaginator(queryset, per_page, MemoListView.keyset_ordering)
+    cursor = request.GET.get('cursor')
+
+    async def load_page():
+        page = await paginator.apage(cursor)
+        return page.object_list, page.has_next(), page.has_previous()
+
+    try:
+        object_list, has_next, has_previous = await aget_or_set_for_user(
+            request.user.pk, 'list', (request.GET.get('search', ''), cursor or '', per_page), load_page,
+        )
+    except InvalidCursor:
+        raise Http404('잘못된 페이지 커서입니다.')
+    return paginator, KeysetPage(object_list, paginator, has_next, has_previous)
+
+
+async def _offset_page(request, queryset, per_page):
+    paginator = Paginator(queryset, per_page)
+    paginator.count = await queryset.acount()
+    page_number = request.GET.get('page') or 1
+    try:
+        number = paginator.num_pages if page_number == 'last' else paginator.validate_number(page_number)
+    except InvalidPage as e:
+        raise Http404(f'잘못된 페이지입니다: {e}')
+    bottom = (number - 1) * per_page
+    object_list = [memo async for memo in queryset[bottom:bottom + per_page].aiterator()]
+    return paginator, Page(object_list, number, paginator)
+
+
+@query_budget(MemoListView.query_budget)
+@replica_reads
+@login_required_async
+@require_safe
+@revalidate
+@acondition(etag_func=amemos_etag, last_modified_func=amemos_last_modified)
+async def memo_list(request):
+    """메모 목록 (MemoListView 와 같은 템플릿과 컨텍스트)"""
+    search_query = request.GET.get('search', '')
+    queryset = _list_queryset(request.user, search_query)
+    per_page = MemoListView.paginate_by
+    cursor_pagination = settings.MEMO_LIST_PAGINATION == 'cursor'
+    if cursor_pagination:
+        paginator, page = await _keyset_page(request, queryset, per_page)
+    else:
+        paginator, page = await _offset_page(request, queryset, per_page)
+
+    return render(request, MemoListView.template_name, {
+        'paginator': paginator,
+        'page_obj': page,
+        'is_paginated': page.has_other_pages(),
+        'object_list': page.object_list,
+        'memos': page.object_list,
+        'search_query': search_query,
+        'cursor_pagination': cursor_pagination,
+    })
+
+
+@query_budget(MemoDetailView.query_budget)
+@replica_reads
+@login_required_async
+@require_safe
+@revalidate
+@acondition(etag_func=adetail_etag, last_modified_func=adetail_last_modified)
+async def memo_detail(request, pk):
+    """메모 상세"""
+    try:
+        memo = await Memo.objects.filter(author=request.user).aget(pk=pk)
+    except Memo.DoesNotExist:
+        raise Http404('메모를 찾을 수 없습니다.')
+    # 템플릿에서 작성자를 다시 조회하지 않도록 이미 읽은 사용자를 연결
+    memo.author = request.user
+    return render(request, 'memos/memo_detail.html', {'memo': memo, 'object': memo})
+
+
+@query_budget(4)
+@replica_reads
+@login_required_async
+@require_GET
+@revalidate
+@acondition(etag_func=amemos_etag, last_modified_func=amemos_last_modified)
+async def memo_search_ajax(request):
+    """AJAX 검색 API"""
+    query = request.GET.get('q', '').strip()
+
+    if not query:
+        return JsonResponse({'results': [], 'count': 0})
+
+    async def load_payload():
+        results = [
+            _search_result(memo)
+            async for memo in _search_queryset(request.user, query).aiterator()
+        ]
+        return {'results': results, 'count': len(results), 'query': query}
+
+    return JsonResponse(await aget_or_set_for_user(request.user.pk, 'search', (query,), load_payload))
+
+
+def _sse(event, event_id):
+    data = json.dumps(event, ensure_ascii=False)
+    return f"id: {event_id}\nevent: {event['type']}\ndata: {data}\n\n"
+
+
+async def _memo_state(user_id):
+    """사용자 메모의 최종 수정 시각과 개수로 만든 상태 값
+
+    워커마다 캐시가 달라도(locmem) 다른 워커의 변경이 보이도록 DB 에서 읽습니다.
+    """
+    state = await Memo.objects.filter(author_id=user_id).aaggregate(
+        last_modified=Max('updated_at'), count=Count('id'),
+    )
+    # 다음 확인까지 연결을 붙잡아 두지 않도록 (요청이 끝날 때와 같은 처리)
+    await sync_to_async(close_old_connections)()
+    return hashlib.md5(repr(sorted(state.items())).encode(), usedforsecurity=False).hexdigest()
+
+
+async def _event_stream(user_id, last_event_id):
+    """사용자 메모 변경 이벤트를 SSE 형식으로 내보냅니다.
+
+    이벤트 id 로 사용자 메모의 상태 값을 보내므로, 재연결 시 Last-Event-ID 와 현재 상태가
+    다르면 놓친 변경이 있다는 뜻이라 resync 를 보냅니다.
+    """
+    subscription = broker.subscribe(user_id)
+    try:
+        state = await _memo_state(user_id)
+        yield f'retry: {settings.MEMO_EVENTS_HEARTBEAT * 1000}\n\n'
+        if last_event_id and last_event_id != state:
+            yield _sse({'type': 'resync'}, state)
+        while True:
+            try:
+                event = await asyncio.wait_for(subscription.queue.get(), settings.MEMO_EVENTS_HEARTBEAT)
+            except asyncio.TimeoutError:
+                current = await _memo_state(user_id)
+                if current == state:
+                    yield ': ping\n\n'
+                else:
+                    # 다른 프로세스나 일괄 변경으로 바뀐 경우 (개별 이벤트 없음)
+                    state = current
+                    yield _sse({'type': 'resync'}, state)
+                continue
+            state = await _memo_state(user_id)
+            yield _sse(event, state)
+    finally:
+        broker.unsubscribe(user_id, subscription)
+
+
+@query_budget(2)
+@login_required_async
+@require_GET
+async def memo_events(request):
+    """로그인한 사용자의 메모 작성/수정/삭제 이벤트 스트림 (text/event-stream)"""
+    response = StreamingHttpResponse(
+        _event_stream(request.user.pk, request.headers.get('Last-Event-ID')),
+        content_type='text/event-stream',
+    )
+    response['Cache-Control'] = 'no-cache'
+    # nginx 가 응답을 버퍼링하지 않고 바로 전달하도록
+    response['X-Accel-Buffering'] = 'no'
+    return response
+
+
+@query_budget(2)
+@login_required_async
+@require_GET
+async def memo_export(request):
+    """메모 내보내기 (aiterator 로 읽으며 스트리밍, 응답 전체를 메모리에 모으지 않음)"""
+    return _export_response(request, aexport_memos)
@@ -0,0 +1,119 @@
+"""
+메모 제목 자동완성
+
+사용자별로 (정규화된 제목 키, 메모 id) 정렬 배열을 메모리에 만들어 두고
+bisect 로 접두어 범위를 찾습니다. 색인은 처음 요청될 때 만들어지며,
+사용자 캐시 버전(cache.py)이 바뀌거나 MEMO_AUTOCOMPLETE_TTL 초가 지나면 다시 만들어집니다.
+워커마다 캐시가 달라(locmem) 다른 워커의 변경으로 버전이 바뀌지 않아도 TTL 이 지나면 반영됩니다.
+프로세스 메모리를 제한하기 위해 최근에 사용한 사용자 색인만 LRU 로 유지합니다.
+"""
+import threading
+import time
+from bisect import bisect_left
+from collections import OrderedDict
+
+from django.conf import settings
+from django.urls import reverse
+
+from .cache import get_user_version
+from .models import Memo
+
+
+def normalize(text):
+    return ' '.join(text.lower().split())
+
+
+def title_keys(title):
+    """제목 전체와 각 단어로 시작하는 부분을 접두어 검색 키로 사용합니다.
+
+    예) "주간 회의록" -> "주간 회의록", "회의록"
+    """
+    words = normalize(title).split(' ')
+    return {' '.join(words[i:]) for i in range(len(words)) if words[i]}
+
+
+class TitleIndex:
+    def __init__(self, version, memos):
+        self.version = version
+        self.built_at = time.monotonic()
+        self.titles = dict(memos)
+        self.keys = sorted(
+            (key, memo_id) for memo_id, title in self.titles.items() for key in title_keys(title)
+        )
+
+    def expired(self, ttl):
+        return time.monotonic() - self.built_at >= ttl
+
+    def suggest(self, prefix, limit):
+        prefix = normalize(prefix)
+        results = []
+        seen = set()
+        # 슬라이스는 배열 뒷부분 전체를 복사하므로 시작 위치부터 인덱스로 순회
+        for i in range(bisect_left(self.keys, (prefix,)), len(self.keys)):
+            key, memo_id = self.keys[i]
+            if not key.startswith(prefix) or len(results) >= limit:
+                break
+            if memo_id not in seen:
+                seen.add(memo_id)
+                results.append((memo_id, self.titles[memo_id]))
+        return results
+
+
+class TitleIndexCache:
+    """사용자별 TitleIndex 를 최대 max_users 개까지 보관하는 LRU 캐시"""
+
+    def __init__(self, max_users):
+        self.max_users = max_users
+        self._indexes = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id):
+        with self._lock:
+            index = self._indexes.get(user_id)
+            if index is not None:
+                self._indexes.move_to_end(user_id)
+            return index
+
+    def put(self, user_id, index):
+        with self._lock:
+            self._indexes[user_id] = index
+            self._indexes.move_to_end(user_id)
+            while len(self._indexes) > self.max_users:
+                self._indexes.popitem(last=False)
+
+    def invalidate(self, user_id):
+        with self._lock:
+            self._indexes.pop(user_id, None)
+
+    def clear(self):
+        with self._lock:
+            self._indexes.clear()
+
+    def __len__(self):
+        return len(self._indexes)
+
+
+title_indexes = TitleIndexCache(settings.MEMO_AUTOCOMPLETE_MAX_USERS)
+
+
+def get_title_index(user_id):
+    # 색인을 만드는 동안 메모가 바뀌어도 다음 요청에서 다시 만들도록 버전을 먼저 읽음
+    version = get_user_version(user_id)
+    index = title_indexes.get(user_id)
+    if index is None or index.version != version or index.expired(settings.MEMO_AUTOCOMPLETE_TTL):
+        memos = Memo.objects.filter(author_id=user_id).order_by().values_list('id', 'title')
+        index = TitleIndex(version, memos)
+        title_indexes.put(user_id, index)
+    return index
+
+
+def suggest_titles(user_id, prefix, limit=10):
+    """제목이 prefix 로 시작하는 (또는 제목 중간 단어가 prefix 로 시작하는) 메모 목록"""
+    return [
+        {
+            'id': memo_id,
+            'title': title,
+            'url': reverse('memos:detail', kwargs={'pk': memo_id}),
+        }
+        for memo_id, title in get_title_index(user_id).suggest(prefix, limit)
+    ]
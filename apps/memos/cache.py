@@ -0,0 +1,68 @@
+"""
+사용자별 버전 기반 캐시
+
+사용자마다 버전 번호를 두고 캐시 키에 포함시킵니다. 메모가 작성/수정/삭제되면
+(queryset.update() 같은 일괄 변경 포함) 해당 사용자의 버전만 올리므로,
+그 사용자의 목록/검색 캐시만 한 번에 무효화되고 다른 사용자의 캐시는 유지됩니다.
+
+버전은 캐시에 저장되므로 워커끼리 캐시를 공유할 때(MEMO_CACHE_ENABLED)만 목록/검색
+결과를 캐시합니다. 그렇지 않으면 get_or_set_for_user() 는 매번 default() 를 호출합니다.
+"""
+import hashlib
+
+from django.conf import settings
+from django.core.cache import cache
+
+from memojjang.cache_versions import aget_version, bump_versions, get_version
+
+
+def _version_key(user_id):
+    return f'memos:user:{user_id}:version'
+
+
+def get_user_version(user_id):
+    """사용자의 현재 캐시 버전을 반환합니다."""
+    return get_version(_version_key(user_id))
+
+
+async def aget_user_version(user_id):
+    """get_user_version() 의 비동기 버전"""
+    return await aget_version(_version_key(user_id))
+
+
+def bump_user_versions(user_ids):
+    """사용자들의 캐시 버전을 올려 기존 캐시를 무효화합니다."""
+    bump_versions(_version_key(user_id) for user_id in user_ids if user_id is not None)
+
+
+def _cache_key(user_id, version, name, parts):
+    digest = hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+    return f'memos:user:{user_id}:v{version}:{name}:{digest}'
+
+
+def user_cache_key(user_id, name, *parts):
+    return _cache_key(user_id, get_user_version(user_id), name, parts)
+
+
+def get_or_set_for_user(user_id, name, parts, default):
+    """사용자 버전이 포함된 키로 캐시를 조회하고, 없으면 default() 결과를 저장합니다."""
+    if not settings.MEMO_CACHE_ENABLED:
+        return default()
+    key = user_cache_key(user_id, name, *parts)
+    value = cache.get(key)
+    if value is None:
+        value = default()
+        cache.set(key, value, settings.MEMO_CACHE_TIMEOUT)
+    return value
+
+
+async def aget_or_set_for_user(user_id, name, parts, default):
+    """get_or_set_for_user() 의 비동기 버전 (default 는 코루틴 함수)"""
+    if not settings.MEMO_CACHE_ENABLED:
+        return await default()
+    key = _cache_key(user_id, await aget_user_version(user_id), name, parts)
+    value = await cache.aget(key)
+    if value is None:
+        value = await default()
+        await cache.aset(key, value, settings.MEMO_CACHE_TIMEOUT)
+    return value
@@ -0,0 +1,165 @@
+"""
+조건부 GET (ETag / Last-Modified)
+
+템플릿 렌더링이나 JSON 직렬화 전에 가벼운 메타데이터(updated_at 최댓값과 메모 수)만
+조회해 ETag 를 계산하고, 클라이언트가 가진 것과 같으면
+django.views.decorators.http.condition 이 304 Not Modified 를 반환합니다.
+
+삭제는 updated_at 최댓값을 바꾸지 않지만 메모 수가 달라지고, queryset.update() 와
+일괄 처리 API 는 updated_at 도 갱신합니다. ETag 가 DB 상태로만 정해지므로 워커마다
+캐시가 달라도(locmem) 모든 워커가 같은 ETag 를 계산합니다.
+"""
+import hashlib
+from datetime import timezone as dt_timezone
+from functools import wraps
+
+from django.contrib.messages import get_messages
+from django.db.models import Count, Max
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, quote_etag
+
+from .models import Memo
+
+
+def _make_etag(*parts):
+    return hashlib.md5(repr(parts).encode(), usedforsecurity=False).hexdigest()
+
+
+def _has_pending_messages(request):
+    # 표시할 메시지가 있으면 304 로 응답하면 안 되므로 조건부 처리를 하지 않음
+    return len(get_messages(request)) > 0
+
+
+def _list_state(request):
+    """사용자 메모의 최종 수정 시각과 개수 - 요청당 한 번만 조회 ((author, -updated_at) 인덱스 사용)"""
+    if not hasattr(request, '_memo_list_state'):
+        request._memo_list_state = Memo.objects.filter(author=request.user).aggregate(
+            last_modified=Max('updated_at'), count=Count('id'),
+        )
+    return request._memo_list_state
+
+
+def _list_etag(request, state):
+    return _make_etag(
+        request.path, request.user.pk, state['last_modified'], state['count'], sorted(request.GET.lists()),
+    )
+
+
+def memos_etag(request, *args, **kwargs):
+    """목록/검색 응답용 ETag (경로와 쿼리 문자열 포함)"""
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    state = _list_state(request)
+    return _list_etag(request, state)
+
+
+def memos_last_modified(request, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    return _list_state(request)['last_modified']
+
+
+def _detail_updated_at(request, pk):
+    if not hasattr(request, '_memo_updated_at'):
+        request._memo_updated_at = (
+            Memo.objects.filter(pk=pk, author=request.user)
+            .values_list('updated_at', flat=True)
+            .first()
+        )
+    return request._memo_updated_at
+
+
+def detail_etag(request, pk, *args, **kwargs):
+    """메모 상세 응답용 ETag"""
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    updated_at = _detail_updated_at(request, pk)
+    if updated_at is None:
+        return None
+    return _make_etag('detail', request.user.pk, pk, updated_at)
+
+
+def detail_last_modified(request, pk, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    return _detail_updated_at(request, pk)
+
+
+# 비동기(ASGI) 뷰용 - 같은 값을 비동기 ORM/캐시 API 로 계산
+
+def acondition(etag_func=None, last_modified_func=None):
+    """django.views.decorators.http.condition 의 비동기 버전
+
+    condition() 은 비동기 뷰에서도 etag_func 를 동기로 호출하므로 ORM 을 쓸 수 없습니다.
+    여기서는 etag_func/last_modified_func 도 코루틴 함수로 받아 await 합니다.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def inner(request, *args, **kwargs):
+            last_modified = None
+            if last_modified_func:
+                if dt := await last_modified_func(request, *args, **kwargs):
+                    if not timezone.is_aware(dt):
+                        dt = timezone.make_aware(dt, dt_timezone.utc)
+                    last_modified = int(dt.timestamp())
+            etag = await etag_func(request, *args, **kwargs) if etag_func else None
+            etag = quote_etag(etag) if etag is not None else None
+
+            response = get_conditional_response(request, etag=etag, last_modified=last_modified)
+            if response is None:
+                response = await view(request, *args, **kwargs)
+            if request.method in ('GET', 'HEAD'):
+                if last_modified and not response.has_header('Last-Modified'):
+                    response.headers['Last-Modified'] = http_date(last_modified)
+                if etag:
+                    response.headers.setdefault('ETag', etag)
+            return response
+        return inner
+    return decorator
+
+
+async def _alist_state(request):
+    if not hasattr(request, '_memo_list_state'):
+        request._memo_list_state = await Memo.objects.filter(author=request.user).aaggregate(
+            last_modified=Max('updated_at'), count=Count('id'),
+        )
+    return request._memo_list_state
+
+
+async def amemos_etag(request, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    state = await _alist_state(request)
+    return _list_etag(request, state)
+
+
+async def amemos_last_modified(request, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    return (await _alist_state(request))['last_modified']
+
+
+async def _adetail_updated_at(request, pk):
+    if not hasattr(request, '_memo_updated_at'):
+        request._memo_updated_at = await (
+            Memo.objects.filter(pk=pk, author=request.user)
+            .values_list('updated_at', flat=True)
+            .afirst()
+        )
+    return request._memo_updated_at
+
+
+async def adetail_etag(request, pk, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    updated_at = await _adetail_updated_at(request, pk)
+    if updated_at is None:
+        return None
+    return _make_etag('detail', request.user.pk, pk, updated_at)
+
+
+async def adetail_last_modified(request, pk, *args, **kwargs):
+    if not request.user.is_authenticated or _has_pending_messages(request):
+        return None
+    return await _adetail_updated_at(request, pk)
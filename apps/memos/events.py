@@ -0,0 +1,99 @@
+"""
+메모 변경 이벤트 (Server-Sent Events 용 프로세스 내 pub/sub)
+
+메모가 저장/삭제되면 트랜잭션이 커밋된 뒤 작성자를 구독 중인 SSE 연결(async_views.memo_events)
+에 이벤트를 전달합니다. 구독자는 각자의 이벤트 루프에 있는 asyncio.Queue 를 가지고,
+발행은 어느 스레드에서든 call_soon_threadsafe 로 넘기므로 동기 뷰에서 저장해도 됩니다.
+
+같은 프로세스의 구독자에게만 전달되므로, 다른 워커 프로세스의 변경이나 개별 이벤트가 없는
+일괄 변경(queryset.update(), 일괄 처리 API)은 SSE 연결이 DB 에서 사용자 메모의 최종 수정
+시각과 개수를 주기적으로 확인해 'resync' 이벤트로 알립니다.
+"""
+import asyncio
+import threading
+from collections import defaultdict
+
+from django.db import transaction
+from django.template.loader import render_to_string
+
+
+# 구독자 큐가 가득 차면(느린 클라이언트) 쌓인 이벤트를 버리고 resync 를 보냄
+QUEUE_SIZE = 100
+
+
+class Subscription:
+    def __init__(self, loop):
+        self.loop = loop
+        self.queue = asyncio.Queue(QUEUE_SIZE)
+
+    def put(self, event):
+        if self.queue.full():
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            event = {'type': 'resync'}
+        self.queue.put_nowait(event)
+
+
+class MemoEventBroker:
+    def __init__(self):
+        self._subscribers = defaultdict(set)
+        self._lock = threading.Lock()
+
+    def subscribe(self, user_id):
+        """현재 이벤트 루프에서 user_id 의 이벤트를 받을 구독을 만듭니다."""
+        subscription = Subscription(asyncio.get_running_loop())
+        with self._lock:
+            self._subscribers[user_id].add(subscription)
+        return subscription
+
+    def unsubscribe(self, user_id, subscription):
+        with self._lock:
+            subscriptions = self._subscribers.get(user_id)
+            if subscriptions is not None:
+                subscriptions.discard(subscription)
+                if not subscriptions:
+                    del self._subscribers[user_id]
+
+    def has_subscribers(self, user_id):
+        return bool(self._subscribers.get(user_id))
+
+    def publish(self, user_id, event):
+        with self._lock:
+            subscriptions = list(self._subscribers.get(user_id, ()))
+        for subscription in subscriptions:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.put, event)
+            except RuntimeError:
+                # 이벤트 루프가 이미 종료된 구독
+                self.unsubscribe(user_id, subscription)
+
+
+broker = MemoEventBroker()
+
+
+def memo_event(event_type, memo):
+    """이벤트 데이터 - 목록에서 카드를 바로 바꿔 끼울 수 있도록 렌더링한 카드 HTML 포함"""
+    event = {'type': event_type, 'id': memo.pk}
+    if event_type != 'deleted':
+        event['is_pinned'] = memo.is_pinned
+        event['html'] = render_to_string('memos/_memo_card.html', {'memo': memo})
+    return event
+
+
+def publish_after_commit(user_id, event):
+    transaction.on_commit(lambda: broker.publish(user_id, event))
+
+
+def memo_saved(memo, created):
+    old_author_id = getattr(memo, '_loaded_values', {}).get('author_id', memo.author_id)
+    if old_author_id != memo.author_id and broker.has_subscribers(old_author_id):
+        publish_after_commit(old_author_id, {'type': 'deleted', 'id': memo.pk})
+    if broker.has_subscribers(memo.author_id):
+        event_type = 'created' if created or old_author_id != memo.author_id else 'updated'
+        publish_after_commit(memo.author_id, memo_event(event_type, memo))
+
+
+def memo_deleted(memo):
+    if broker.has_subscribers(memo.author_id):
+        # pk 는 삭제 후 None 이 되므로 지금 이벤트를 만들어 둠
+        publish_after_commit(memo.author_id, memo_event('deleted', memo))
@@ -0,0 +1,163 @@
+"""
+메모 내보내기 (NDJSON / CSV)
+
+QuerySet.iterator(chunk_size=...) 로 행을 나누어 읽고 바로 직렬화해 내보내므로
+메모 수와 관계없이 메모리 사용량이 일정하고, 첫 바이트를 곧바로 보낼 수 있습니다.
+다운로드 뷰(StreamingHttpResponse)와 export_memos 명령이 함께 사용합니다.
+
+ASGI 에서는 StreamingHttpResponse 가 동기 이터레이터를 sync_to_async(list) 로 한 번에
+모두 읽으므로, 비동기 뷰는 aiterator() 로 읽는 aexport_memos() 를 사용합니다.
+"""
+import csv
+import itertools
+import json
+
+from asgiref.sync import sync_to_async
+
+from .models import Memo
+
+
+EXPORT_FORMATS = {
+    'ndjson': 'application/x-ndjson; charset=utf-8',
+    'csv': 'text/csv; charset=utf-8',
+}
+
+EXPORT_FIELDS = ['id', 'author', 'title', 'content', 'priority', 'is_pinned', 'created_at', 'updated_at']
+
+# 응답에 너무 작은 조각을 여러 번 쓰지 않도록 모아서 내보낼 크기
+BUFFER_SIZE = 64 * 1024
+
+
+def _export_queryset(queryset, user):
+    if queryset is None:
+        queryset = Memo.objects.all()
+    if user is not None:
+        queryset = queryset.filter(author=user)
+    fields = ['author__username' if name == 'author' else name for name in EXPORT_FIELDS]
+    # id 순으로 읽어야 (author, ...) 인덱스 없이도 기본 키 순서로 스트리밍됨
+    return queryset.order_by('id').values_list(*fields)
+
+
+def export_rows(queryset=None, user=None, chunk_size=2000):
+    """내보낼 메모를 EXPORT_FIELDS 순서의 튜플로 하나씩 반환합니다."""
+    return _export_queryset(queryset, user).iterator(chunk_size=chunk_size)
+
+
+async def aexport_rows(queryset=None, user=None, chunk_size=2000):
+    """export_rows() 의 비동기 버전
+
+    values_list() 의 aiterator() 는 첫 조회를 이벤트 루프에서 실행하므로(SynchronousOnlyOperation)
+    aiterator() 처럼 동기 이터레이터를 chunk_size 씩 스레드에서 읽습니다.
+    """
+    rows = export_rows(queryset, user, chunk_size)
+    next_chunk = sync_to_async(lambda: list(itertools.islice(rows, chunk_size)))
+    while chunk := await next_chunk():
+        for row in chunk:
+            yield row
+
+
+def _serialize(value):
+    return value.isoformat() if hasattr(value, 'isoformat') else value
+
+
+def _ndjson_line(row):
+    record = dict(zip(EXPORT_FIELDS, map(_serialize, row)))
+    return json.dumps(record, ensure_ascii=False) + '\n'
+
+
+def iter_ndjson(rows):
+    for row in rows:
+        yield _ndjson_line(row)
+
+
+class _Echo:
+    """csv.writer 가 쓴 줄을 그대로 반환하는 파일 대용 객체"""
+
+    def write(self, value):
+        return value
+
+
+def _csv_writer():
+    writer = csv.writer(_Echo())
+    # 엑셀에서 한글이 깨지지 않도록 BOM 추가
+    return writer, '\ufeff' + writer.writerow(EXPORT_FIELDS)
+
+
+def iter_csv(rows):
+    writer, header = _csv_writer()
+    yield header
+    for row in rows:
+        yield writer.writerow([_serialize(value) for value in row])
+
+
+async def aiter_ndjson(rows):
+    async for row in rows:
+        yield _ndjson_line(row)
+
+
+async def aiter_csv(rows):
+    writer, header = _csv_writer()
+    yield header
+    async for row in rows:
+        yield writer.writerow([_serialize(value) for value in row])
+
+
+class _Buffer:
+    """줄을 BUFFER_SIZE 만큼 모으는 버퍼 (동기/비동기 공용)"""
+
+    def __init__(self):
+        self.lines = []
+        self.size = 0
+
+    def add(self, line):
+        """줄을 추가하고, 모인 크기가 BUFFER_SIZE 이상이면 합친 조각을 반환합니다."""
+        self.lines.append(line)
+        self.size += len(line)
+        if self.size >= BUFFER_SIZE:
+            return self.flush()
+        return None
+
+    def flush(self):
+        chunk = ''.join(self.lines)
+        self.lines = []
+        self.size = 0
+        return chunk
+
+
+def _buffered(lines):
+    buffer = _Buffer()
+    for line in lines:
+        if chunk := buffer.add(line):
+            yield chunk
+    if chunk := buffer.flush():
+        yield chunk
+
+
+async def _abuffered(lines):
+    buffer = _Buffer()
+    async for line in lines:
+        if chunk := buffer.add(line):
+            yield chunk
+    if chunk := buffer.flush():
+        yield chunk
+
+
+SERIALIZERS = {'ndjson': iter_ndjson, 'csv': iter_csv}
+ASYNC_SERIALIZERS = {'ndjson': aiter_ndjson, 'csv': aiter_csv}
+
+
+def _check_format(export_format):
+    if export_format not in SERIALIZERS:
+        raise ValueError(f'지원하지 않는 형식입니다: {export_format}')
+
+
+def export_memos(export_format, queryset=None, user=None, chunk_size=2000):
+    """지정한 형식으로 직렬화한 메모를 문자열 조각 단위로 반환합니다."""
+    _check_format(export_format)
+    return _buffered(SERIALIZERS[export_format](export_rows(queryset, user, chunk_size)))
+
+
+def aexport_memos(export_format, queryset=None, user=None, chunk_size=2000):
+    """export_memos() 의 비동기 버전 (비동기 이터레이터)"""
+    _check_format(export_format)
+    return _abuffered(ASYNC_SERIALIZERS[export_format](aexport_rows(queryset, user, chunk_size)))
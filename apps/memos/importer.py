@@ -0,0 +1,159 @@
+"""
+메모 가져오기 (JSON 배열 / NDJSON)
+
+loaddata 는 파일 전체를 메모리에 올린 뒤 객체를 한 건씩 저장합니다. 여기서는 파일을
+조금씩 읽으며 레코드를 하나씩 파싱하고, 일정 개수마다 bulk_create 로 저장합니다.
+import_memos 명령이 사용하며 다음 두 가지 레코드 형식을 모두 받습니다.
+
+- 장고 fixture 형식: {"model": "memos.memo", "pk": 1, "fields": {...}}
+  (같은 파일의 auth.user 레코드로 작성자 id 를 사용자명으로 바꿈)
+- 내보내기(export_memos) 형식: {"author": "사용자명", "title": ..., ...}
+"""
+import json
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from . import activity, ngram
+from .models import Memo
+
+
+READ_SIZE = 64 * 1024
+
+MEMO_FIELDS = ['title', 'content', 'priority', 'is_pinned', 'created_at', 'updated_at']
+
+
+class ImportFormatError(Exception):
+    pass
+
+
+def _iter_json_array(stream, buffer):
+    """JSON 배열의 원소를 raw_decode 로 하나씩 파싱합니다 (버퍼 크기 + 원소 하나만큼만 메모리 사용)."""
+    decoder = json.JSONDecoder()
+    pos = buffer.index('[') + 1
+    eof = False
+    while True:
+        while pos < len(buffer) and buffer[pos] in ' \t\r\n,':
+            pos += 1
+        if pos == len(buffer):
+            if eof:
+                raise ImportFormatError('JSON 배열이 닫히지 않았습니다.')
+            buffer, pos = stream.read(READ_SIZE), 0
+            eof = not buffer
+            continue
+        if buffer[pos] == ']':
+            return
+        try:
+            obj, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError as e:
+            if eof:
+                raise ImportFormatError(f'JSON 형식이 올바르지 않습니다: {e}')
+            # 원소가 버퍼 경계에서 잘린 경우 더 읽어서 다시 시도
+            chunk = stream.read(READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield obj
+        pos = end
+
+
+def _iter_ndjson(stream):
+    for number, line in enumerate(stream, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ImportFormatError(f'{number}번째 줄의 JSON 형식이 올바르지 않습니다: {e}')
+
+
+def iter_records(stream):
+    """JSON 배열 또는 NDJSON 파일(seek 가능한 텍스트 스트림)에서 레코드를 하나씩 반환합니다."""
+    buffer = stream.read(READ_SIZE)
+    if buffer.lstrip().startswith('['):
+        return _iter_json_array(stream, buffer)
+    stream.seek(0)
+    return _iter_ndjson(stream)
+
+
+def parse_record(record, fixture_users):
+    """레코드를 (작성자, 메모 필드) 로 변환합니다. 메모가 아닌 레코드는 None 을 반환합니다.
+
+    작성자는 사용자명(str) 또는 기존 사용자 id(int) 이며, 그 밖의 값이면 ValidationError 가 발생합니다.
+    """
+    if not isinstance(record, dict):
+        raise ImportFormatError('레코드는 JSON 객체여야 합니다.')
+    if 'model' in record:
+        model = str(record['model']).lower()
+        fields = record.get('fields') or {}
+        if model == 'auth.user':
+            fixture_users[record.get('pk')] = fields.get('username')
+            return None
+        if model != 'memos.memo':
+            return None
+    else:
+        fields = record
+
+    author = fields.get('author')
+    if isinstance(author, list):
+        # natural key (["username"])
+        author = author[0] if author else None
+    elif isinstance(author, int):
+        author = fixture_users.get(author, author)
+    if author is not None and (not isinstance(author, (str, int)) or isinstance(author, bool)):
+        raise ValidationError(f'작성자는 사용자명 또는 사용자 id 여야 합니다: {author!r}')
+    return author, {name: fields[name] for name in MEMO_FIELDS if name in fields}
+
+
+class AuthorResolver:
+    """사용자명/id -> 사용자 id 조회 결과를 캐시해 배치마다 한 번만 조회합니다."""
+
+    def __init__(self, create_missing=False):
+        self.create_missing = create_missing
+        self.ids = {}
+
+    def resolve(self, keys):
+        missing = {key for key in keys if key not in self.ids}
+        usernames = {key for key in missing if isinstance(key, str)}
+        pks = {key for key in missing if isinstance(key, int)}
+        if usernames:
+            self.ids.update(User.objects.filter(username__in=usernames).values_list('username', 'id'))
+        if pks:
+            self.ids.update((pk, pk) for pk in User.objects.filter(pk__in=pks).values_list('id', flat=True))
+        if self.create_missing:
+            for username in usernames - set(self.ids):
+                self.ids[username] = User.objects.create_user(username).pk
+        for key in missing - set(self.ids):
+            # 없는 사용자도 캐시해 다시 조회하지 않음
+            self.ids[key] = None
+        return self.ids
+
+
+def build_memo(author_id, fields):
+    """메모 객체를 만들고 검증합니다 (검증 실패 시 ValidationError)."""
+    memo = Memo(author_id=author_id, **fields)
+    memo.clean_fields(exclude=['author'])
+    now = timezone.now()
+    memo.created_at = memo.created_at or now
+    memo.updated_at = memo.updated_at or memo.created_at
+    memo.update_content_stats()
+    return memo
+
+
+def save_batch(memos):
+    """메모들을 한 트랜잭션에서 저장하고 검색 색인과 활동 집계를 갱신합니다.
+
+    bulk_create 는 auto_now_add/auto_now 로 작성일/수정일을 덮어쓰므로, 저장한 뒤
+    auto_now 를 적용하지 않는 bulk_update 로 가져온 시각을 다시 씁니다.
+    """
+    timestamps = [(memo.created_at, memo.updated_at) for memo in memos]
+    with transaction.atomic():
+        Memo.objects.bulk_create(memos)
+        for memo, (created_at, updated_at) in zip(memos, timestamps):
+            memo.created_at, memo.updated_at = created_at, updated_at
+        Memo.objects.bulk_update(memos, ['created_at', 'updated_at'])
+        ngram.index_memos(memos)
+        activity.memos_created(memos)
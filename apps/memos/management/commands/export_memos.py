@@ -0,0 +1,32 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.memos.export import EXPORT_FORMATS, export_memos
+
+
+class Command(BaseCommand):
+    help = '메모를 NDJSON 또는 CSV 로 내보냅니다 (메모 수와 관계없이 일정한 메모리 사용).'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--format', choices=sorted(EXPORT_FORMATS), default='ndjson', help='출력 형식')
+        parser.add_argument('--user', help='지정한 사용자명의 메모만 내보냅니다.')
+        parser.add_argument('--output', '-o', help='출력 파일 경로 (기본값: 표준 출력)')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='한 번에 읽을 행 수')
+
+    def handle(self, *args, **options):
+        user = None
+        if options['user']:
+            user = User.objects.filter(username=options['user']).first()
+            if user is None:
+                raise CommandError(f"사용자 '{options['user']}'를 찾을 수 없습니다.")
+
+        chunks = export_memos(options['format'], user=user, chunk_size=options['chunk_size'])
+        if not options['output']:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
+            return
+
+        with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+            for chunk in chunks:
+                output.write(chunk)
+        self.stdout.write(self.style.SUCCESS(f"메모를 {options['output']} 에 내보냈습니다."))
@@ -0,0 +1,104 @@
+import json
+import os
+
+from django.contrib.auth.models import User
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.memos.importer import (
+    AuthorResolver, ImportFormatError, build_memo, iter_records, parse_record, save_batch,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'JSON 배열(fixture 포함) 또는 NDJSON 파일의 메모를 스트리밍으로 읽어 일괄 저장합니다. '
+        '배치마다 커밋하며 --resume 으로 중단된 위치부터 이어서 가져올 수 있습니다.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path', help='가져올 파일 경로')
+        parser.add_argument('--user', help='모든 메모의 작성자를 지정한 사용자명으로 설정합니다.')
+        parser.add_argument('--batch-size', type=int, default=1000, help='한 번에 저장(커밋)할 메모 수')
+        parser.add_argument('--create-users', action='store_true', help='없는 작성자는 로그인할 수 없는 사용자로 만듭니다.')
+        parser.add_argument('--resume', action='store_true', help='진행 상황 파일에 기록된 위치부터 이어서 가져옵니다.')
+        parser.add_argument('--state-file', help='진행 상황 파일 경로 (기본값: <path>.import-state.json)')
+
+    def handle(self, *args, **options):
+        path = options['path']
+        self.verbosity = options['verbosity']
+        if not os.path.exists(path):
+            raise CommandError(f"파일 '{path}'를 찾을 수 없습니다.")
+        state_file = options['state_file'] or f'{path}.import-state.json'
+        source = {'path': os.path.abspath(path), 'size': os.path.getsize(path)}
+
+        state = {'source': source, 'processed': 0, 'imported': 0, 'skipped': 0}
+        if options['resume'] and os.path.exists(state_file):
+            with open(state_file, encoding='utf-8') as f:
+                state = json.load(f)
+            if state.get('source') != source:
+                raise CommandError('진행 상황 파일이 다른 파일(또는 변경된 파일)의 것입니다.')
+            self.stdout.write(f"{state['processed']}번째 레코드부터 이어서 가져옵니다.")
+
+        resolver = AuthorResolver(create_missing=options['create_users'])
+        fixed_author = None
+        if options['user']:
+            fixed_author = User.objects.filter(username=options['user']).values_list('id', flat=True).first()
+            if fixed_author is None:
+                raise CommandError(f"사용자 '{options['user']}'를 찾을 수 없습니다.")
+
+        fixture_users = {}
+        batch = []
+        total = 0
+        try:
+            with open(path, encoding='utf-8-sig') as stream:
+                for total, record in enumerate(iter_records(stream), 1):
+                    # 이미 가져온 레코드도 fixture 사용자 정보를 얻기 위해 파싱은 함
+                    try:
+                        parsed = parse_record(record, fixture_users)
+                    except ValidationError as e:
+                        if total > state['processed']:
+                            # 다음 배치의 진행 상황과 함께 기록
+                            state['skipped'] += 1
+                            if self.verbosity >= 2:
+                                self.stderr.write(f'건너뜀: {total}번째 레코드 - {e}')
+                        continue
+                    if total <= state['processed'] or parsed is None:
+                        continue
+                    batch.append(parsed)
+                    if len(batch) >= options['batch_size']:
+                        self._save(batch, total, state, state_file, resolver, fixed_author)
+                        batch = []
+                self._save(batch, max(total, state['processed']), state, state_file, resolver, fixed_author)
+        except ImportFormatError as e:
+            raise CommandError(f"{e} ({state['processed']}개 레코드까지 저장됨)")
+
+        if os.path.exists(state_file):
+            os.remove(state_file)
+        self.stdout.write(self.style.SUCCESS(
+            f"{state['imported']}개의 메모를 가져왔습니다 ({state['skipped']}개 건너뜀)."
+        ))
+
+    def _save(self, batch, processed, state, state_file, resolver, fixed_author):
+        ids = resolver.resolve({author for author, _ in batch}) if fixed_author is None else {}
+        memos = []
+        for author, fields in batch:
+            author_id = fixed_author or ids.get(author)
+            try:
+                if author_id is None:
+                    raise ValidationError(f"작성자 '{author}'를 찾을 수 없습니다.")
+                memos.append(build_memo(author_id, fields))
+            except (ValidationError, TypeError) as e:
+                state['skipped'] += 1
+                if self.verbosity >= 2:
+                    self.stderr.write(f"건너뜀: {fields.get('title')!r} - {e}")
+        if memos:
+            save_batch(memos)
+
+        # 배치가 커밋된 뒤에 진행 상황을 기록
+        state['processed'] = processed
+        state['imported'] += len(memos)
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        if batch and self.verbosity >= 1:
+            self.stdout.write(f"{state['processed']}개 레코드 처리 ({state['imported']}개 저장)")
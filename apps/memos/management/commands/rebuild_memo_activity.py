@@ -0,0 +1,21 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.memos.activity import rebuild_activity
+
+
+class Command(BaseCommand):
+    help = '메모 데이터로부터 일일 활동 집계 테이블을 다시 만듭니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='지정한 사용자명의 집계만 다시 만듭니다.')
+
+    def handle(self, *args, **options):
+        users = None
+        if options['user']:
+            users = User.objects.filter(username=options['user'])
+            if not users.exists():
+                raise CommandError(f"사용자 '{options['user']}'를 찾을 수 없습니다.")
+
+        count = rebuild_activity(users)
+        self.stdout.write(self.style.SUCCESS(f'{count}개의 일일 활동 집계를 만들었습니다.'))
@@ -0,0 +1,25 @@
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+
+from apps.memos.models import Memo
+from apps.memos.ngram import rebuild_index
+
+
+class Command(BaseCommand):
+    help = '메모 검색용 n-gram 역색인을 일괄 재생성합니다.'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--user', help='지정한 사용자명의 메모만 재색인합니다.')
+        parser.add_argument('--batch-size', type=int, default=500, help='한 번에 처리할 메모 수 (기본값: 500)')
+
+    def handle(self, *args, **options):
+        queryset = Memo.objects.all()
+        if options['user']:
+            try:
+                user = User.objects.get(username=options['user'])
+            except User.DoesNotExist:
+                raise CommandError(f"사용자 '{options['user']}'를 찾을 수 없습니다.")
+            queryset = queryset.filter(author=user)
+
+        count = rebuild_index(queryset, batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(f'{count}개의 메모를 재색인했습니다.'))
@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, connections
+
+
+class Command(BaseCommand):
+    help = (
+        '기본 SQLite DB 를 복제본(DB_REPLICA_NAME) 파일로 복사합니다. 로컬에서 두 SQLite 파일로 '
+        '복제본 구성을 시험할 때 복제 대신 사용합니다.'
+    )
+
+    def handle(self, *args, **options):
+        if 'replica' not in connections.settings:
+            raise CommandError('복제본이 설정되어 있지 않습니다 (DB_REPLICA_NAME).')
+        primary, replica = connections[DEFAULT_DB_ALIAS], connections['replica']
+        if primary.vendor != 'sqlite' or replica.vendor != 'sqlite':
+            raise CommandError('SQLite 데이터베이스끼리만 복사할 수 있습니다.')
+        if str(primary.settings_dict['NAME']) == str(replica.settings_dict['NAME']):
+            raise CommandError('기본 DB 와 복제본이 같은 파일입니다.')
+
+        primary.ensure_connection()
+        replica.ensure_connection()
+        # SQLite 온라인 백업: 기본 DB 를 사용하는 중에도 일관된 상태로 복사
+        primary.connection.backup(replica.connection)
+        self.stdout.write(self.style.SUCCESS(
+            f"{primary.settings_dict['NAME']} 을(를) {replica.settings_dict['NAME']} 로 복사했습니다."
+        ))
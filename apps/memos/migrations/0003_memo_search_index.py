@@ -0,0 +1,23 @@
+from django.db import migrations
+
+from apps.memos.search import drop_search_index, sync_search_index
+
+
+def create_search_index(apps, schema_editor):
+    # MEMO_SEARCH_BACKEND 가 fulltext 일 때만 생성
+    sync_search_index(schema_editor.connection)
+
+
+def remove_search_index(apps, schema_editor):
+    drop_search_index(schema_editor.connection)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0002_alter_memo_options_memo_is_pinned_memo_priority'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, remove_search_index),
+    ]
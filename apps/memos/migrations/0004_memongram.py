@@ -0,0 +1,42 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:25
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_ngrams(apps, schema_editor):
+    # 기존 메모도 n-gram 검색(기본 검색 백엔드)으로 찾을 수 있도록 색인 (rebuild_memo_ngrams 와 같음)
+    from apps.memos.ngram import rebuild_index
+
+    rebuild_index(
+        apps.get_model('memos', 'Memo').objects.all(),
+        ngram_model=apps.get_model('memos', 'MemoNgram'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0003_memo_search_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemoNgram',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('gram', models.CharField(max_length=3, verbose_name='n-gram')),
+                ('author', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to=settings.AUTH_USER_MODEL, verbose_name='작성자')),
+                ('memo', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='ngrams', to='memos.memo', verbose_name='메모')),
+            ],
+            options={
+                'verbose_name': '메모 n-gram',
+                'verbose_name_plural': '메모 n-gram들',
+                'indexes': [models.Index(fields=['author', 'gram', 'memo'], name='memos_ngram_posting_idx')],
+                'constraints': [models.UniqueConstraint(fields=('memo', 'gram'), name='memos_ngram_memo_gram_uniq')],
+            },
+        ),
+        migrations.RunPython(fill_ngrams, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:29
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class AddIndexConcurrentlyIfSupported(migrations.AddIndex):
+    """PostgreSQL 에서는 CREATE INDEX CONCURRENTLY 로 테이블 쓰기를 막지 않고 인덱스를 만듭니다.
+
+    그 외 백엔드에서는 일반 AddIndex 와 동일하게 동작합니다.
+    """
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        model = to_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            if schema_editor.connection.vendor == 'postgresql':
+                schema_editor.add_index(model, self.index, concurrently=True)
+            else:
+                schema_editor.add_index(model, self.index)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        model = from_state.apps.get_model(app_label, self.model_name)
+        if self.allow_migrate_model(schema_editor.connection.alias, model):
+            if schema_editor.connection.vendor == 'postgresql':
+                schema_editor.remove_index(model, self.index, concurrently=True)
+            else:
+                schema_editor.remove_index(model, self.index)
+
+
+class Migration(migrations.Migration):
+
+    # CREATE INDEX CONCURRENTLY 는 트랜잭션 안에서 실행할 수 없습니다.
+    atomic = False
+
+    dependencies = [
+        ('memos', '0004_memongram'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        AddIndexConcurrentlyIfSupported(
+            model_name='memo',
+            index=models.Index(fields=['author', '-is_pinned', '-created_at', 'id'], name='memos_memo_author_list_idx'),
+        ),
+        AddIndexConcurrentlyIfSupported(
+            model_name='memo',
+            index=models.Index(fields=['author', '-updated_at'], name='memos_memo_author_upd_idx'),
+        ),
+    ]
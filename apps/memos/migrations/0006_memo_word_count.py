@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:30
+
+from django.db import migrations, models
+
+
+def fill_word_count(apps, schema_editor):
+    Memo = apps.get_model('memos', 'Memo')
+    last_pk = 0
+    while True:
+        batch = list(
+            Memo.objects.filter(pk__gt=last_pk).order_by('pk').only('id', 'content')[:1000]
+        )
+        if not batch:
+            break
+        for memo in batch:
+            memo.word_count = len(memo.content.split())
+        Memo.objects.bulk_update(batch, ['word_count'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0005_memo_access_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memo',
+            name='word_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='단어 수'),
+        ),
+        migrations.RunPython(fill_word_count, migrations.RunPython.noop),
+    ]
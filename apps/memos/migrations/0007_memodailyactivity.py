@@ -0,0 +1,49 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:32
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def fill_activity(apps, schema_editor):
+    # 통계 화면은 집계 테이블만 읽으므로 기존 메모의 작성 집계를 채움 (rebuild_memo_activity 와 같음)
+    from apps.memos.activity import rebuild_activity
+
+    rebuild_activity(
+        memo_model=apps.get_model('memos', 'Memo'),
+        activity_model=apps.get_model('memos', 'MemoDailyActivity'),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0006_memo_word_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MemoDailyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(verbose_name='날짜')),
+                ('created_count', models.PositiveIntegerField(default=0, verbose_name='작성 수')),
+                ('updated_count', models.PositiveIntegerField(default=0, verbose_name='수정 수')),
+                ('deleted_count', models.PositiveIntegerField(default=0, verbose_name='삭제 수')),
+                ('words_added', models.IntegerField(default=0, verbose_name='단어 증감')),
+                ('low_count', models.PositiveIntegerField(default=0, verbose_name='낮음 작성 수')),
+                ('normal_count', models.PositiveIntegerField(default=0, verbose_name='보통 작성 수')),
+                ('high_count', models.PositiveIntegerField(default=0, verbose_name='높음 작성 수')),
+                ('urgent_count', models.PositiveIntegerField(default=0, verbose_name='긴급 작성 수')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memo_activities', to=settings.AUTH_USER_MODEL, verbose_name='사용자')),
+            ],
+            options={
+                'verbose_name': '일일 메모 활동',
+                'verbose_name_plural': '일일 메모 활동들',
+                'ordering': ['date'],
+                'constraints': [models.UniqueConstraint(fields=('user', 'date'), name='memos_activity_user_date_uniq')],
+            },
+        ),
+        migrations.RunPython(fill_activity, migrations.RunPython.noop),
+    ]
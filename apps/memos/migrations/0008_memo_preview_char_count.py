@@ -0,0 +1,43 @@
+# Generated by Django 5.2.4 on 2026-10-18 08:34
+
+from django.db import migrations, models
+
+
+PREVIEW_LENGTH = 150
+
+
+def fill_preview(apps, schema_editor):
+    Memo = apps.get_model('memos', 'Memo')
+    last_pk = 0
+    while True:
+        batch = list(
+            Memo.objects.filter(pk__gt=last_pk).order_by('pk').only('id', 'content')[:1000]
+        )
+        if not batch:
+            break
+        for memo in batch:
+            memo.preview = memo.content[:PREVIEW_LENGTH]
+            memo.char_count = len(memo.content)
+        Memo.objects.bulk_update(batch, ['preview', 'char_count'])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('memos', '0007_memodailyactivity'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='memo',
+            name='char_count',
+            field=models.PositiveIntegerField(default=0, editable=False, verbose_name='글자 수'),
+        ),
+        migrations.AddField(
+            model_name='memo',
+            name='preview',
+            field=models.CharField(blank=True, editable=False, max_length=150, verbose_name='미리보기'),
+        ),
+        migrations.RunPython(fill_preview, migrations.RunPython.noop),
+    ]
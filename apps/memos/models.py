@@ -1,9 +1,54 @@
-from django.db import models
+from django.db import models, router, transaction
 from django.contrib.auth.models import User
 from django.urls import reverse
+from django.utils import timezone
+
+from .cache import bump_user_versions
+
+
+class MemoQuerySet(models.QuerySet):
+    """save()/delete() 를 거치지 않는 일괄 변경도 사용자 캐시를 무효화하는 QuerySet"""
+    
+    def update(self, **kwargs):
+        # ETag(conditional.py)가 DB 의 수정 시각으로 변경을 알 수 있도록 수정 시각도 갱신
+        kwargs.setdefault('updated_at', timezone.now())
+        author_ids = set(self.order_by().values_list('author_id', flat=True).distinct())
+        rows = super().update(**kwargs)
+        if rows:
+            author = kwargs.get('author', kwargs.get('author_id'))
+            if author is not None:
+                author_ids.add(getattr(author, 'pk', author))
+            bump_user_versions(author_ids)
+        return rows
+    
+    def bulk_create(self, objs, *args, **kwargs):
+        objs = super().bulk_create(objs, *args, **kwargs)
+        bump_user_versions({obj.author_id for obj in objs})
+        return objs
+    
+    def bulk_update(self, objs, fields, *args, **kwargs):
+        rows = super().bulk_update(objs, fields, *args, **kwargs)
+        bump_user_versions({obj.author_id for obj in objs})
+        return rows
+    
+    def delete(self):
+        """일일 활동 집계를 메모마다가 아니라 작성자별로 한 번에 반영"""
+        from .activity import memos_deleted
+        
+        using = self._db or router.db_for_write(self.model)
+        with transaction.atomic(using=using):
+            rows = list(
+                self.using(using).order_by().values('author_id')
+                .annotate(count=models.Count('id'), words=models.Sum('word_count'))
+            )
+            result = super().delete()
+            memos_deleted(rows)
+        return result
 
 
 class Memo(models.Model):
+    PREVIEW_LENGTH = 150
+    
     PRIORITY_CHOICES = [
         ('low', '낮음'),
         ('normal', '보통'),
@@ -20,18 +65,65 @@ class Memo(models.Model):
         default='normal'
     )
     is_pinned = models.BooleanField('상단 고정', default=False)
+    word_count = models.PositiveIntegerField('단어 수', default=0, editable=False)
+    # 목록/검색에서 본문 전체를 읽지 않도록 저장 시 계산해 두는 값
+    preview = models.CharField('미리보기', max_length=150, blank=True, editable=False)
+    char_count = models.PositiveIntegerField('글자 수', default=0, editable=False)
     author = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='작성자')
     created_at = models.DateTimeField('작성일', auto_now_add=True)
     updated_at = models.DateTimeField('수정일', auto_now=True)
     
+    objects = MemoQuerySet.as_manager()
+    
     class Meta:
         ordering = ['-is_pinned', '-created_at']
         verbose_name = '메모'
         verbose_name_plural = '메모들'
+        indexes = [
+            # 목록: author 필터 + (-is_pinned, -created_at, id) 키셋 정렬
+            models.Index(fields=['author', '-is_pinned', '-created_at', 'id'], name='memos_memo_author_list_idx'),
+            # AJAX 검색: author 필터 + -updated_at 정렬
+            models.Index(fields=['author', '-updated_at'], name='memos_memo_author_upd_idx'),
+        ]
     
     def __str__(self):
         return self.title
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # 수정 전 값과 비교하기 위해 DB에서 읽은 값을 보관
+        instance._loaded_values = {
+            name: value for name, value in zip(field_names, values)
+            if value is not models.DEFERRED
+        }
+        return instance
+    
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get('update_fields')
+        if update_fields is None or 'content' in update_fields:
+            self.update_content_stats()
+            if update_fields is not None:
+                kwargs['update_fields'] = {*update_fields, 'word_count', 'preview', 'char_count'}
+        # post_save 에서 갱신하는 색인/집계 테이블이 메모와 함께 커밋되도록 묶음
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            super().save(*args, **kwargs)
+        self._loaded_values = {
+            field.attname: getattr(self, field.attname)
+            for field in self._meta.concrete_fields
+            if field.attname not in self.get_deferred_fields()
+        }
+    
+    def delete(self, *args, **kwargs):
+        with transaction.atomic(using=router.db_for_write(type(self), instance=self)):
+            return super().delete(*args, **kwargs)
+    
+    def update_content_stats(self):
+        """내용으로부터 계산되는 통계 필드를 갱신 (저장 시 자동 호출)"""
+        self.word_count = len(self.content.split())
+        self.preview = self.content[:self.PREVIEW_LENGTH]
+        self.char_count = len(self.content)
+    
     def get_absolute_url(self):
         return reverse('memos:detail', kwargs={'pk': self.pk})
     
@@ -54,3 +146,50 @@ class Memo(models.Model):
             'urgent': 'bg-danger'
         }
         return classes.get(self.priority, 'bg-secondary')
+
+
+class MemoNgram(models.Model):
+    """부분 문자열 검색용 n-gram 역색인 (gram -> memo 포스팅)"""
+    gram = models.CharField('n-gram', max_length=3)
+    memo = models.ForeignKey(Memo, on_delete=models.CASCADE, related_name='ngrams', verbose_name='메모')
+    author = models.ForeignKey(User, on_delete=models.CASCADE, verbose_name='작성자')
+    
+    class Meta:
+        verbose_name = '메모 n-gram'
+        verbose_name_plural = '메모 n-gram들'
+        constraints = [
+            models.UniqueConstraint(fields=['memo', 'gram'], name='memos_ngram_memo_gram_uniq'),
+        ]
+        indexes = [
+            models.Index(fields=['author', 'gram', 'memo'], name='memos_ngram_posting_idx'),
+        ]
+    
+    def __str__(self):
+        return f'{self.gram} -> {self.memo_id}'
+
+
+class MemoDailyActivity(models.Model):
+    """사용자별 일일 메모 활동 집계 (메모 저장/삭제 시 증분 갱신)"""
+    user = models.ForeignKey(User, on_delete=models.CASCADE, related_name='memo_activities', verbose_name='사용자')
+    date = models.DateField('날짜')
+    created_count = models.PositiveIntegerField('작성 수', default=0)
+    updated_count = models.PositiveIntegerField('수정 수', default=0)
+    deleted_count = models.PositiveIntegerField('삭제 수', default=0)
+    # 작성 +, 수정 시 증감분, 삭제 - 를 더한 순증가량 (전체 합계 = 현재 총 단어 수)
+    words_added = models.IntegerField('단어 증감', default=0)
+    # 중요도별 작성 수
+    low_count = models.PositiveIntegerField('낮음 작성 수', default=0)
+    normal_count = models.PositiveIntegerField('보통 작성 수', default=0)
+    high_count = models.PositiveIntegerField('높음 작성 수', default=0)
+    urgent_count = models.PositiveIntegerField('긴급 작성 수', default=0)
+    
+    class Meta:
+        ordering = ['date']
+        verbose_name = '일일 메모 활동'
+        verbose_name_plural = '일일 메모 활동들'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'date'], name='memos_activity_user_date_uniq'),
+        ]
+    
+    def __str__(self):
+        return f'{self.user_id} {self.date}'
@@ -0,0 +1,134 @@
+"""
+한글 부분 문자열 검색을 위한 n-gram 역색인
+
+형태소/공백 단위 토크나이저는 조사가 붙은 한국어 복합어("공부중입니다")를
+제대로 나누지 못하므로, 제목/내용을 2-gram, 3-gram 으로 잘라 MemoNgram 에
+저장하고 검색 시 포스팅 리스트의 교집합으로 후보 메모를 찾습니다.
+"""
+from django.db import transaction
+from django.db.models import Count, Q
+
+from .models import Memo, MemoNgram
+
+
+NGRAM_SIZES = (2, 3)
+
+
+def normalize(text):
+    """대소문자 구분 없이 색인/검색하기 위해 정규화합니다."""
+    return (text or '').lower()
+
+
+def extract_ngrams(text):
+    """텍스트에서 색인할 n-gram 집합을 추출합니다 (공백만으로 된 gram 제외)."""
+    text = normalize(text)
+    grams = set()
+    for size in NGRAM_SIZES:
+        for i in range(len(text) - size + 1):
+            gram = text[i:i + size]
+            if not gram.isspace():
+                grams.add(gram)
+    return grams
+
+
+def memo_ngrams(memo):
+    """메모의 제목과 내용에서 n-gram 집합을 추출합니다."""
+    return extract_ngrams(memo.title) | extract_ngrams(memo.content)
+
+
+def query_ngrams(query):
+    """검색어를 포스팅 리스트 조회용 n-gram 집합으로 변환합니다.
+
+    3글자 이상이면 3-gram, 2글자면 2-gram 을 사용하고,
+    1글자 검색어는 색인으로 찾을 수 없으므로 빈 집합을 반환합니다.
+    """
+    query = normalize(query)
+    size = min(len(query), max(NGRAM_SIZES))
+    if size < min(NGRAM_SIZES):
+        return set()
+    return {
+        query[i:i + size]
+        for i in range(len(query) - size + 1)
+        if not query[i:i + size].isspace()
+    }
+
+
+def index_memo(memo):
+    """메모 한 건의 색인을 증분 갱신합니다 (추가/삭제된 gram 만 반영)."""
+    grams = memo_ngrams(memo)
+    with transaction.atomic():
+        existing = dict(MemoNgram.objects.filter(memo=memo).values_list('gram', 'author_id'))
+        if any(author_id != memo.author_id for author_id in existing.values()):
+            # 작성자가 바뀐 경우 포스팅을 새로 만듭니다.
+            MemoNgram.objects.filter(memo=memo).delete()
+            existing = {}
+
+        removed = set(existing) - grams
+        if removed:
+            MemoNgram.objects.filter(memo=memo, gram__in=removed).delete()
+        added = grams - set(existing)
+        MemoNgram.objects.bulk_create(
+            [MemoNgram(gram=gram, memo_id=memo.pk, author_id=memo.author_id) for gram in added],
+            batch_size=500,
+        )
+
+
+def index_memos(memos, batch_size=500):
+    """여러 메모의 색인을 한 번에 다시 만듭니다 (bulk_create/bulk_update 후 사용)."""
+    memos = list(memos)
+    with transaction.atomic():
+        MemoNgram.objects.filter(memo__in=[memo.pk for memo in memos]).delete()
+        MemoNgram.objects.bulk_create(
+            [
+                MemoNgram(gram=gram, memo_id=memo.pk, author_id=memo.author_id)
+                for memo in memos
+                for gram in memo_ngrams(memo)
+            ],
+            batch_size=batch_size * 10,
+        )
+
+
+def rebuild_index(queryset=None, batch_size=500, ngram_model=MemoNgram):
+    """메모들의 색인을 일괄 재생성하고 처리한 메모 수를 반환합니다.
+
+    마이그레이션에서는 과거 모델의 queryset 과 ngram_model 을 넘깁니다.
+    """
+    if queryset is None:
+        queryset = Memo.objects.all()
+    queryset = queryset.order_by().only('id', 'author_id', 'title', 'content')
+
+    ngram_model.objects.filter(memo__in=queryset.values('pk')).delete()
+
+    count = 0
+    postings = []
+    for memo in queryset.iterator(chunk_size=batch_size):
+        postings.extend(
+            ngram_model(gram=gram, memo_id=memo.pk, author_id=memo.author_id)
+            for gram in memo_ngrams(memo)
+        )
+        count += 1
+        if count % batch_size == 0:
+            ngram_model.objects.bulk_create(postings, batch_size=batch_size * 10)
+            postings = []
+    ngram_model.objects.bulk_create(postings, batch_size=batch_size * 10)
+    return count
+
+
+def search_ngram(queryset, query, author=None):
+    """포스팅 리스트의 교집합으로 후보를 찾고, 실제 부분 문자열 포함 여부를 확인합니다."""
+    substring = Q(title__icontains=query) | Q(content__icontains=query)
+    grams = query_ngrams(query)
+    if not grams:
+        return queryset.filter(substring)
+
+    postings = MemoNgram.objects.filter(gram__in=grams)
+    if author is not None:
+        postings = postings.filter(author=author)
+    candidates = (
+        postings.values('memo_id')
+        .annotate(hits=Count('memo'))
+        .filter(hits=len(grams))
+        .values('memo_id')
+    )
+    # n-gram 이 모두 있어도 연속된 문자열이 아닐 수 있으므로 후보 안에서만 재확인
+    return queryset.filter(pk__in=candidates).filter(substring)
@@ -0,0 +1,147 @@
+"""
+키셋(커서) 페이지네이션
+
+OFFSET 기반 페이지네이션은 뒤 페이지로 갈수록 건너뛰는 행이 늘어나고
+매번 COUNT(*) 를 실행합니다. 여기서는 정렬 키의 마지막 값을 커서로 넘겨
+"이 값 다음부터 N개" 를 조회하므로 페이지 깊이와 관계없이 비용이 일정합니다.
+"""
+import base64
+import binascii
+import json
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class KeysetPage:
+    """Paginator 의 Page 와 비슷하게 템플릿에서 쓸 수 있는 페이지 객체"""
+
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self._has_next or self._has_previous
+
+    @property
+    def next_cursor(self):
+        if not self._has_next:
+            return None
+        return self.paginator.encode_cursor(self.object_list[-1], 'next')
+
+    @property
+    def previous_cursor(self):
+        if not self._has_previous:
+            return None
+        return self.paginator.encode_cursor(self.object_list[0], 'prev')
+
+
+class KeysetPaginator:
+    """ordering 의 마지막 필드는 유일해야 합니다 (예: 'id')."""
+
+    def __init__(self, queryset, per_page, ordering):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = list(ordering)
+        self.fields = [
+            (name.lstrip('-'), name.startswith('-')) for name in self.ordering
+        ]
+        self.model = queryset.model
+
+    def encode_cursor(self, obj, direction):
+        """객체의 정렬 키 값을 불투명한 커서 문자열로 만듭니다."""
+        values = [
+            self.model._meta.get_field(name).value_to_string(obj)
+            for name, _ in self.fields
+        ]
+        payload = json.dumps({'d': direction, 'v': values}, separators=(',', ':'))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip('=')
+
+    def decode_cursor(self, cursor):
+        try:
+            padded = cursor + '=' * (-len(cursor) % 4)
+            payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+            direction, raw_values = payload['d'], payload['v']
+            # encode_cursor 는 값을 모두 문자열로 저장 (null, 숫자, 목록 등은 조작된 커서)
+            if (
+                direction not in ('next', 'prev')
+                or not isinstance(raw_values, list)
+                or len(raw_values) != len(self.fields)
+                or not all(isinstance(value, str) for value in raw_values)
+            ):
+                raise InvalidCursor(cursor)
+            values = [
+                self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.fields, raw_values)
+            ]
+        except (ValueError, KeyError, TypeError, binascii.Error, ValidationError):
+            raise InvalidCursor(cursor)
+        # 빈 문자열은 None 으로 바뀌며 filter() 에서 None 은 쓸 수 없음
+        if any(value is None for value in values):
+            raise InvalidCursor(cursor)
+        return direction, values
+
+    def _seek(self, values, forward):
+        """(f1, f2, ...) 가 커서 값보다 뒤(forward) 또는 앞에 있는 행만 남기는 조건"""
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.fields, values):
+            lookup = 'lt' if descending == forward else 'gt'
+            condition |= equal & Q(**{f'{name}__{lookup}': value})
+            equal &= Q(**{name: value})
+        return condition
+
+    def _query(self, cursor):
+        """커서에 해당하는 (조회할 queryset, 방향) - 첫 페이지의 방향은 None"""
+        if not cursor:
+            return self.queryset.order_by(*self.ordering)[:self.per_page + 1], None
+
+        direction, values = self.decode_cursor(cursor)
+        if direction == 'next':
+            queryset = self.queryset.filter(self._seek(values, forward=True)).order_by(*self.ordering)
+        else:
+            reverse_ordering = [
+                name if descending else f'-{name}' for name, descending in self.fields
+            ]
+            queryset = self.queryset.filter(self._seek(values, forward=False)).order_by(*reverse_ordering)
+        return queryset[:self.per_page + 1], direction
+
+    def _build_page(self, items, direction):
+        # per_page + 1 개를 조회해 한 개가 더 있으면 그 방향으로 페이지가 더 있음
+        more = len(items) > self.per_page
+        items = items[:self.per_page]
+        if direction is None:
+            return KeysetPage(items, self, more, False)
+        if direction == 'next':
+            return KeysetPage(items, self, more, True)
+        return KeysetPage(items[::-1], self, True, more)
+
+    def page(self, cursor=None):
+        queryset, direction = self._query(cursor)
+        return self._build_page(list(queryset), direction)
+
+    async def apage(self, cursor=None):
+        """page() 의 비동기 버전 (ASGI 뷰용)"""
+        queryset, direction = self._query(cursor)
+        return self._build_page([obj async for obj in queryset.aiterator()], direction)
@@ -0,0 +1,138 @@
+"""
+메모 검색
+
+settings.MEMO_SEARCH_BACKEND 로 검색 방식을 선택합니다.
+
+- 'ngram': n-gram 역색인 부분 문자열 검색 (기본값, ngram.py 참고)
+- 'fulltext': 단어 단위 전문 검색
+    - SQLite: FTS5 가상 테이블(external content)과 트리거로 memos_memo 와 동기화
+    - PostgreSQL: tsvector 표현식 GIN 인덱스
+    - 그 외 백엔드: icontains 검색으로 대체
+- 'icontains': 색인 없이 LIKE 검색
+
+전문 검색 인덱스는 메모를 쓸 때마다 갱신되므로 'fulltext' 일 때만 만들고, 다른 방식이면
+마이그레이션 후(post_migrate) 삭제합니다 (sync_search_index).
+"""
+import re
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Q
+from django.db.models.expressions import RawSQL
+
+
+FTS_TABLE = 'memos_memo_fts'
+PG_SEARCH_INDEX = 'memos_memo_search_gin'
+PG_SEARCH_VECTOR = "to_tsvector('simple', coalesce(title, '') || ' ' || coalesce(content, ''))"
+
+SQLITE_FTS_SQL = [
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(
+        title, content, content='memos_memo', content_rowid='id', tokenize='unicode61'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ai AFTER INSERT ON memos_memo BEGIN
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_ad AFTER DELETE ON memos_memo BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {FTS_TABLE}_au AFTER UPDATE OF title, content ON memos_memo BEGIN
+        INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, content)
+        VALUES ('delete', old.id, old.title, old.content);
+        INSERT INTO {FTS_TABLE}(rowid, title, content) VALUES (new.id, new.title, new.content);
+    END
+    """,
+]
+
+SQLITE_FTS_DROP_SQL = [
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ai',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_ad',
+    f'DROP TRIGGER IF EXISTS {FTS_TABLE}_au',
+    f'DROP TABLE IF EXISTS {FTS_TABLE}',
+]
+
+
+def ensure_search_index(connection, rebuild=False):
+    """검색 인덱스(테이블/트리거)가 없으면 생성합니다.
+
+    SQLite 는 컬럼 변경 시 테이블을 재생성하면서 트리거가 함께 삭제되므로
+    마이그레이션 이후(post_migrate)에도 다시 호출됩니다. FTS 테이블을 새로 만들면
+    기존 메모를 색인합니다.
+    """
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            created = FTS_TABLE not in connection.introspection.table_names(cursor)
+            for sql in SQLITE_FTS_SQL:
+                cursor.execute(sql)
+            if rebuild or created:
+                cursor.execute(f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')")
+        elif connection.vendor == 'postgresql':
+            cursor.execute(
+                f'CREATE INDEX IF NOT EXISTS {PG_SEARCH_INDEX} '
+                f'ON memos_memo USING gin ({PG_SEARCH_VECTOR})'
+            )
+
+
+def drop_search_index(connection):
+    """검색 인덱스를 삭제합니다."""
+    with connection.cursor() as cursor:
+        if connection.vendor == 'sqlite':
+            for sql in SQLITE_FTS_DROP_SQL:
+                cursor.execute(sql)
+        elif connection.vendor == 'postgresql':
+            cursor.execute(f'DROP INDEX IF EXISTS {PG_SEARCH_INDEX}')
+
+
+def sync_search_index(connection):
+    """MEMO_SEARCH_BACKEND 가 'fulltext' 일 때만 검색 인덱스를 두고, 아니면 삭제합니다."""
+    if settings.MEMO_SEARCH_BACKEND == 'fulltext':
+        ensure_search_index(connection)
+    else:
+        drop_search_index(connection)
+
+
+def tokenize(query):
+    """검색어를 단어 단위 토큰으로 분리합니다."""
+    return re.findall(r'\w+', query)
+
+
+def search_memos(queryset, query, author=None):
+    """설정된 검색 백엔드로 queryset 에서 검색어와 일치하는 메모만 남깁니다.
+
+    author 를 넘기면 n-gram 포스팅 조회를 해당 사용자 범위로 좁힙니다.
+    """
+    backend = getattr(settings, 'MEMO_SEARCH_BACKEND', 'ngram')
+    if backend == 'ngram':
+        from .ngram import search_ngram
+        return search_ngram(queryset, query, author=author)
+    if backend == 'fulltext':
+        return search_fulltext(queryset, query)
+    return queryset.filter(Q(title__icontains=query) | Q(content__icontains=query))
+
+
+def search_fulltext(queryset, query):
+    """제목/내용에 검색어의 모든 단어(접두어 일치)가 포함된 메모만 남깁니다."""
+    terms = tokenize(query)
+    if not terms:
+        return queryset.none()
+
+    vendor = connections[queryset.db].vendor
+    if vendor == 'sqlite':
+        match = ' '.join(f'"{term}"*' for term in terms)
+        return queryset.filter(pk__in=RawSQL(
+            f'SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s', [match]
+        ))
+    if vendor == 'postgresql':
+        tsquery = ' & '.join(f"'{term}':*" for term in terms)
+        return queryset.filter(pk__in=RawSQL(
+            f"SELECT id FROM memos_memo WHERE {PG_SEARCH_VECTOR} @@ to_tsquery('simple', %s)",
+            [tsquery]
+        ))
+    return queryset.filter(Q(title__icontains=query) | Q(content__icontains=query))
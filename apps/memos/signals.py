@@ -0,0 +1,63 @@
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models import QuerySet
+
+from . import activity, events, ngram
+from .autocomplete import title_indexes
+from .cache import bump_user_versions
+from .search import sync_search_index
+
+
+def sync_search_index_after_migrate(sender, using, **kwargs):
+    """마이그레이션으로 테이블이 재생성되어도 검색 인덱스를 유지 (검색 방식이 바뀌었으면 생성/삭제)"""
+    connection = connections[using]
+    if 'memos_memo' in connection.introspection.table_names():
+        sync_search_index(connection)
+
+
+def update_ngram_index(sender, instance, raw=False, update_fields=None, **kwargs):
+    """메모 저장 시 n-gram 색인 증분 갱신"""
+    if raw:
+        return
+    if update_fields is not None and not {'title', 'content', 'author'} & set(update_fields):
+        return
+    ngram.index_memo(instance)
+
+
+def record_memo_saved(sender, instance, created, raw=False, **kwargs):
+    """메모 작성/수정을 일일 활동 집계에 반영"""
+    if raw:
+        return
+    activity.memo_saved(instance, created)
+
+
+def record_memo_deleted(sender, instance, origin=None, **kwargs):
+    """메모 삭제를 일일 활동 집계에 반영 (회원 탈퇴로 인한 삭제는 제외)
+
+    QuerySet.delete() 는 MemoQuerySet.delete() 에서 작성자별로 한 번에 반영합니다.
+    """
+    if isinstance(origin, (User, QuerySet)):
+        return
+    activity.memo_deleted(instance)
+
+
+def invalidate_user_cache(sender, instance, **kwargs):
+    """메모 변경 시 작성자의 목록/검색 캐시 무효화"""
+    author_ids = {instance.author_id}
+    # 작성자가 바뀐 경우 이전 작성자의 캐시도 무효화
+    author_ids.add(getattr(instance, '_loaded_values', {}).get('author_id'))
+    bump_user_versions(author_ids)
+    for author_id in author_ids:
+        title_indexes.invalidate(author_id)
+
+
+def publish_memo_saved(sender, instance, created, raw=False, **kwargs):
+    """메모 작성/수정을 SSE 구독자에게 전달"""
+    if raw:
+        return
+    events.memo_saved(instance, created)
+
+
+def publish_memo_deleted(sender, instance, **kwargs):
+    """메모 삭제를 SSE 구독자에게 전달"""
+    events.memo_deleted(instance)
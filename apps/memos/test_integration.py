@@ -1,11 +1,16 @@
 """
 통합 테스트 및 API 테스트
 """
-from django.test import TestCase, Client
+from io import StringIO
+from unittest import skipUnless
+
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, Client, override_settings
+from django.core.management import call_command
 from django.contrib.auth.models import User
 from django.urls import reverse
 from django.utils import timezone
-from apps.memos.models import Memo
+from apps.memos.models import Memo, MemoDailyActivity
 import json
 
 
@@ -182,6 +187,297 @@ class MemoStatsTest(TestCase):
         self.assertEqual(response.context['total_count'], 5)
         self.assertTrue(response.context['total_words'] > 0)
         self.assertTrue(response.context['avg_words_per_memo'] > 0)
+        
+    def test_memo_stats_word_count(self):
+        """저장 시 계산된 단어 수로 통계를 내는지 테스트"""
+        # '이것은 N번째 메모의 내용입니다. ' * N -> 4 * N 단어
+        expected = sum(4 * (i + 1) for i in range(5))
+        self.assertEqual(
+            sum(Memo.objects.filter(author=self.user).values_list('word_count', flat=True)),
+            expected
+        )
+        
+        self.client.login(username='testuser', password='testpass123')
+        response = self.client.get(reverse('memos:stats'))
+        self.assertEqual(response.context['total_words'], expected)
+        self.assertEqual(response.context['avg_words_per_memo'], expected // 5)
+        self.assertEqual(response.context['recent_count'], 5)
+        
+    def test_memo_stats_calendar_months(self):
+        """월별 통계가 달력 기준 월로 집계되는지 테스트"""
+        now = timezone.localtime()
+        first_of_month = now.replace(day=1, hour=12, minute=0, second=0, microsecond=0)
+        last_month = first_of_month - timezone.timedelta(days=1)
+        old_memo = Memo.objects.create(title='지난달 메모', content='내용', author=self.user)
+        Memo.objects.filter(pk=old_memo.pk).update(created_at=last_month)
+        call_command('rebuild_memo_activity', stdout=StringIO())
+        
+        self.client.login(username='testuser', password='testpass123')
+        response = self.client.get(reverse('memos:stats'))
+        monthly = response.context['monthly_stats']
+        self.assertEqual(len(monthly), 6)
+        self.assertEqual(len({item['month'] for item in monthly}), 6)
+        self.assertEqual(monthly[-1], {'month': now.strftime('%Y-%m'), 'count': 5})
+        self.assertEqual(monthly[-2], {'month': last_month.strftime('%Y-%m'), 'count': 1})
+        
+    def test_memo_stats_query_count_is_constant(self):
+        """메모 수와 관계없이 통계 쿼리 수가 일정한지 테스트"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        self.client.login(username='testuser', password='testpass123')
+        with CaptureQueriesContext(connection) as small:
+            self.client.get(reverse('memos:stats'))
+        
+        Memo.objects.bulk_create([
+            Memo(title=f'추가 메모 {i}', content='추가 내용', author=self.user)
+            for i in range(50)
+        ])
+        with CaptureQueriesContext(connection) as large:
+            self.client.get(reverse('memos:stats'))
+        self.assertEqual(len(small), len(large))
+
+
+class MemoActivityRollupTest(TestCase):
+    """일일 활동 집계 테스트"""
+    
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        
+    def today_activity(self):
+        return MemoDailyActivity.objects.get(user=self.user, date=timezone.localdate())
+        
+    def test_rollup_follows_create_update_delete(self):
+        """메모 작성/수정/삭제 시 집계가 갱신되는지 테스트"""
+        memo = Memo.objects.create(title='메모', content='하나 둘 셋', author=self.user, priority='high')
+        Memo.objects.create(title='메모2', content='넷', author=self.user, priority='urgent')
+        activity = self.today_activity()
+        self.assertEqual(activity.created_count, 2)
+        self.assertEqual(activity.words_added, 4)
+        self.assertEqual((activity.high_count, activity.urgent_count, activity.normal_count), (1, 1, 0))
+        
+        memo = Memo.objects.get(pk=memo.pk)
+        memo.content = '하나 둘 셋 넷 다섯'
+        memo.save()
+        memo.content = '하나'
+        memo.save()
+        activity = self.today_activity()
+        self.assertEqual(activity.updated_count, 2)
+        self.assertEqual(activity.words_added, 2)
+        
+        memo.delete()
+        activity = self.today_activity()
+        self.assertEqual(activity.deleted_count, 1)
+        self.assertEqual(activity.words_added, 1)
+        
+        self.client.login(username='testuser', password='testpass123')
+        response = self.client.get(reverse('memos:stats'))
+        self.assertEqual(response.context['total_count'], 1)
+        self.assertEqual(response.context['total_words'], 1)
+        self.assertEqual(response.context['recent_count'], 2)
+        
+    def test_author_change_moves_rollup(self):
+        """작성자를 바꾸면 작성 집계가 이전 작성자에서 새 작성자로 옮겨지는지 테스트"""
+        other = User.objects.create_user(username='otheruser', password='testpass123')
+        memo = Memo.objects.create(title='메모', content='하나 둘 셋', author=self.user, priority='high')
+        memo = Memo.objects.get(pk=memo.pk)
+        memo.author = other
+        memo.content = '하나 둘'
+        memo.save()
+        
+        activity = self.today_activity()
+        self.assertEqual((activity.created_count, activity.words_added, activity.high_count), (0, 0, 0))
+        moved = MemoDailyActivity.objects.get(user=other, date=timezone.localdate())
+        self.assertEqual((moved.created_count, moved.words_added, moved.high_count), (1, 2, 1))
+        self.assertEqual(moved.updated_count, 1)
+        
+        memo.delete()
+        moved.refresh_from_db()
+        self.assertEqual((moved.deleted_count, moved.words_added), (1, 0))
+        
+    def test_user_deletion_cascades(self):
+        """회원 삭제 시 메모와 집계가 함께 삭제되는지 테스트"""
+        Memo.objects.create(title='메모', content='내용', author=self.user)
+        self.user.delete()
+        self.assertFalse(MemoDailyActivity.objects.exists())
+        
+    def test_rebuild_command(self):
+        """집계 재생성 명령 테스트"""
+        Memo.objects.bulk_create([
+            Memo(title=f'메모 {i}', content='단어 두개', word_count=2, author=self.user,
+                 priority=['low', 'normal'][i % 2])
+            for i in range(4)
+        ])
+        self.assertFalse(MemoDailyActivity.objects.exists())
+        
+        out = StringIO()
+        call_command('rebuild_memo_activity', user='testuser', stdout=out)
+        self.assertIn('1개의 일일 활동 집계', out.getvalue())
+        activity = self.today_activity()
+        self.assertEqual(activity.created_count, 4)
+        self.assertEqual(activity.words_added, 8)
+        self.assertEqual((activity.low_count, activity.normal_count), (2, 2))
+        
+    def test_activity_range_api(self):
+        """기간별 활동 API 테스트"""
+        Memo.objects.create(title='메모', content='하나 둘', author=self.user, priority='low')
+        today = timezone.localdate()
+        MemoDailyActivity.objects.create(
+            user=self.user, date=today - timezone.timedelta(days=40), created_count=3
+        )
+        self.client.login(username='testuser', password='testpass123')
+        
+        response = self.client.get(reverse('memos:activity_range'))
+        data = json.loads(response.content)
+        self.assertEqual(data['end'], today.isoformat())
+        self.assertEqual(len(data['days']), 2)
+        self.assertEqual(data['totals']['created_count'], 4)
+        self.assertEqual(data['days'][-1]['low_count'], 1)
+        
+        response = self.client.get(reverse('memos:activity_range'), {
+            'start': (today - timezone.timedelta(days=7)).isoformat(),
+            'end': today.isoformat(),
+        })
+        data = json.loads(response.content)
+        self.assertEqual([day['date'] for day in data['days']], [today.isoformat()])
+        
+    def test_activity_range_api_invalid_dates(self):
+        """잘못된 기간 요청 테스트"""
+        self.client.login(username='testuser', password='testpass123')
+        for params in (
+            {'start': '2024-13-01'}, {'start': 'abc'}, {'end': '2024/01/01'},
+            {'start': '2024-02-01', 'end': '2024-01-01'},
+        ):
+            response = self.client.get(reverse('memos:activity_range'), params)
+            self.assertEqual(response.status_code, 400)
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MemoConditionalGetTest(TestCase):
+    """ETag / Last-Modified 조건부 GET 테스트"""
+    
+    def setUp(self):
+        from django.core.cache import cache
+        
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.memo = Memo.objects.create(
+            title='조건부 메모',
+            content='조건부 요청 테스트',
+            author=self.user
+        )
+        self.client.login(username='testuser', password='testpass123')
+        
+    def assert_revalidates(self, url, params=None, change=None):
+        response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('no-cache', response['Cache-Control'])
+        etag = response['ETag']
+        
+        response = self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+        
+        if change:
+            change()
+            response = self.client.get(url, params or {}, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotEqual(response['ETag'], etag)
+        
+    def update_memo(self):
+        self.memo.title = '수정된 조건부 메모'
+        self.memo.save()
+        
+    def test_memo_list_not_modified(self):
+        """메모 목록 304 응답 테스트"""
+        self.assert_revalidates(reverse('memos:list'), change=self.update_memo)
+        
+    def test_memo_list_etag_depends_on_query(self):
+        """검색어/커서가 다르면 ETag 도 다른지 테스트"""
+        etag = self.client.get(reverse('memos:list'))['ETag']
+        response = self.client.get(reverse('memos:list'), {'search': '조건'}, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        
+    def test_memo_list_changes_after_delete(self):
+        """메모 삭제 후에는 304 가 아닌지 테스트"""
+        other = Memo.objects.create(title='삭제될 메모', content='내용', author=self.user)
+        self.assert_revalidates(reverse('memos:list'), change=other.delete)
+        
+    def test_memo_list_counts_memos(self):
+        """캐시 버전이 그대로여도(다른 워커에서 삭제) 메모 수가 바뀌면 304 가 아닌지 테스트"""
+        from django.core.cache import cache
+        from apps.memos.cache import _version_key
+
+        other = Memo.objects.create(title='다른 워커에서 삭제될 메모', content='내용', author=self.user)
+        # 최종 수정 시각은 삭제와 상관없이 그대로 남도록
+        self.update_memo()
+        version_key = _version_key(self.user.pk)
+
+        def delete_on_other_worker():
+            version = cache.get(version_key)
+            other.delete()
+            cache.set(version_key, version, None)
+
+        self.assert_revalidates(reverse('memos:list'), change=delete_on_other_worker)
+        
+    def test_queryset_update_changes_etag(self):
+        """다른 워커의 일괄 변경(캐시 버전 그대로)도 목록/상세에서 304 가 아닌지 테스트"""
+        from django.core.cache import cache
+        from apps.memos.cache import _version_key
+        
+        version_key = _version_key(self.user.pk)
+        
+        def pin_on_other_worker():
+            version = cache.get(version_key)
+            Memo.objects.filter(pk=self.memo.pk).update(is_pinned=not Memo.objects.get(pk=self.memo.pk).is_pinned)
+            cache.set(version_key, version, None)
+        
+        for url in [reverse('memos:list'), reverse('memos:detail', kwargs={'pk': self.memo.pk})]:
+            with self.subTest(url=url):
+                self.assert_revalidates(url, change=pin_on_other_worker)
+        
+    def test_memo_detail_not_modified(self):
+        """메모 상세 304 응답 테스트"""
+        url = reverse('memos:detail', kwargs={'pk': self.memo.pk})
+        self.assert_revalidates(url, change=self.update_memo)
+        
+        last_modified = self.client.get(url)['Last-Modified']
+        response = self.client.get(url, HTTP_IF_MODIFIED_SINCE=last_modified)
+        self.assertEqual(response.status_code, 304)
+        
+    def test_search_ajax_not_modified(self):
+        """AJAX 검색 304 응답 테스트"""
+        self.assert_revalidates(
+            reverse('memos:search_ajax'), {'q': '조건부'},
+            change=lambda: Memo.objects.filter(pk=self.memo.pk).update(is_pinned=True)
+        )
+        
+    def test_pending_messages_disable_304(self):
+        """표시할 메시지가 있으면 전체 페이지를 다시 보내는지 테스트"""
+        etag = self.client.get(reverse('memos:list'))['ETag']
+        self.client.post(reverse('memos:edit', kwargs={'pk': self.memo.pk}), {
+            'title': self.memo.title,
+            'content': self.memo.content,
+            'priority': 'normal',
+        })
+        response = self.client.get(reverse('memos:list'), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '성공적으로 수정되었습니다')
+        
+    def test_other_users_memo_detail(self):
+        """다른 사용자의 메모 상세는 여전히 404 인지 테스트"""
+        other_user = User.objects.create_user(username='otheruser', password='testpass123')
+        other_memo = Memo.objects.create(title='남의 메모', content='내용', author=other_user)
+        response = self.client.get(reverse('memos:detail', kwargs={'pk': other_memo.pk}))
+        self.assertEqual(response.status_code, 404)
 
 
 class MemoSecurityTest(TestCase):
@@ -306,3 +602,561 @@ class MemoPerformanceTest(TestCase):
         
         data = json.loads(response.content)
         self.assertGreater(data['count'], 0)
+
+
+class MetricsTest(TestCase):
+    """요청 지표(/metrics) 테스트"""
+
+    def setUp(self):
+        from memojjang.metrics import registry
+        self.registry = registry
+        self.registry.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.staff = User.objects.create_user(username='staff', password='testpass123', is_staff=True)
+        Memo.objects.create(title='지표 메모', content='내용', author=self.user)
+
+    def test_records_view_latency_and_queries(self):
+        """URL 이름별 요청 수, 응답 시간, 쿼리 수 기록"""
+        self.client.login(username='testuser', password='testpass123')
+        self.client.get(reverse('memos:list'))
+        self.client.get(reverse('memos:list'))
+        self.client.get('/memos/does-not-exist/')
+
+        merged = self.registry.collect()
+        labels = (('view', 'memos:list'),)
+        self.assertEqual(
+            merged[('memojjang_http_requests_total', (('view', 'memos:list'), ('method', 'GET'), ('status', '200')))],
+            2,
+        )
+        queries = merged[('memojjang_http_request_db_queries', labels)]
+        self.assertEqual(sum(queries[:-1]), 2)
+        self.assertGreater(queries[-1], 0)
+        self.assertEqual(sum(merged[('memojjang_http_request_duration_seconds', labels)][:-1]), 2)
+        self.assertIn(
+            ('memojjang_http_requests_total', (('view', '<unmatched>'), ('method', 'GET'), ('status', '404'))),
+            merged,
+        )
+
+    def test_prometheus_text_format(self):
+        """Prometheus 텍스트 형식 출력"""
+        self.client.login(username='testuser', password='testpass123')
+        self.client.get(reverse('memos:list'))
+        self.client.logout()
+        self.client.login(username='staff', password='testpass123')
+
+        response = self.client.get('/metrics')
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response['Content-Type'].startswith('text/plain; version=0.0.4'))
+        body = response.content.decode()
+        self.assertIn('# TYPE memojjang_http_request_duration_seconds histogram', body)
+        self.assertIn('memojjang_http_requests_total{view="memos:list",method="GET",status="200"} 1', body)
+        self.assertIn('memojjang_http_request_db_queries_bucket{view="memos:list",le="+Inf"} 1', body)
+        self.assertIn('memojjang_http_request_db_queries_count{view="memos:list"} 1', body)
+
+    def test_access_control(self):
+        """관리자 또는 토큰만 지표 조회 가능"""
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.client.login(username='testuser', password='testpass123')
+        self.assertEqual(self.client.get('/metrics').status_code, 403)
+        self.client.logout()
+
+        with override_settings(METRICS_TOKEN='secret'):
+            self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer wrong').status_code, 403)
+            self.assertEqual(self.client.get('/metrics', HTTP_AUTHORIZATION='Bearer secret').status_code, 200)
+
+    def test_aggregates_worker_processes(self):
+        """METRICS_DIR 의 다른 프로세스 지표 합산"""
+        import os
+        import tempfile
+        from memojjang.metrics import MetricsRegistry
+
+        with tempfile.TemporaryDirectory() as directory:
+            worker = MetricsRegistry(directory)
+            labels = (('view', 'memos:list'),)
+            worker.inc('memojjang_http_requests_total', labels, 3)
+            worker.observe('memojjang_http_request_db_queries', labels, 4)
+            worker.flush()
+            # 다른 워커 프로세스가 기록한 파일처럼 이름 변경
+            os.replace(
+                os.path.join(directory, f'metrics-{os.getpid()}.json'),
+                os.path.join(directory, 'metrics-999999.json'),
+            )
+
+            current = MetricsRegistry(directory)
+            current.inc('memojjang_http_requests_total', labels, 2)
+            current.observe('memojjang_http_request_db_queries', labels, 1)
+            current.flush()
+
+            body = current.render()
+            self.assertIn('memojjang_http_requests_total{view="memos:list"} 5', body)
+            self.assertIn('memojjang_http_request_db_queries_bucket{view="memos:list",le="1"} 1', body)
+            self.assertIn('memojjang_http_request_db_queries_bucket{view="memos:list",le="5"} 2', body)
+            self.assertIn('memojjang_http_request_db_queries_sum{view="memos:list"} 5', body)
+            self.assertIn('memojjang_http_request_db_queries_count{view="memos:list"} 2', body)
+
+
+class SqlitePragmaTest(TestCase):
+    """SQLite 연결 설정(PRAGMA) 테스트"""
+
+    def _new_connection(self, name):
+        from django.db import connections
+        default = connections['default']
+        wrapper = type(default)({**default.settings_dict, 'NAME': name}, alias='sqlite_pragma_test')
+        self.addCleanup(wrapper.close)
+        return wrapper
+
+    def _pragma(self, wrapper, name):
+        with wrapper.cursor() as cursor:
+            cursor.execute(f'PRAGMA {name}')
+            return cursor.fetchone()[0]
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite 전용')
+    def test_pragmas_applied_on_new_connection(self):
+        """새 파일 DB 연결에 WAL, busy_timeout 등 적용"""
+        import os
+        import tempfile
+
+        with tempfile.TemporaryDirectory() as directory:
+            wrapper = self._new_connection(os.path.join(directory, 'pragma.sqlite3'))
+            with override_settings(SQLITE_PRAGMAS={
+                'journal_mode': 'WAL', 'synchronous': 'NORMAL', 'busy_timeout': '1234',
+                'cache_size': '-4000', 'temp_store': 'MEMORY', 'mmap_size': '',
+            }):
+                wrapper.ensure_connection()
+                self.assertEqual(self._pragma(wrapper, 'journal_mode'), 'wal')
+                self.assertEqual(self._pragma(wrapper, 'synchronous'), 1)
+                self.assertEqual(self._pragma(wrapper, 'busy_timeout'), 1234)
+                self.assertEqual(self._pragma(wrapper, 'cache_size'), -4000)
+                self.assertEqual(self._pragma(wrapper, 'temp_store'), 2)
+                # 빈 값은 SQLite 기본값 유지
+                self.assertEqual(self._pragma(wrapper, 'mmap_size'), 0)
+            wrapper.close()
+
+    def test_invalid_pragma_rejected(self):
+        """PRAGMA 값에 SQL 을 넣을 수 없음"""
+        from django.core.exceptions import ImproperlyConfigured
+        from memojjang.sqlite import pragma_statements
+
+        self.assertEqual(
+            pragma_statements({'journal_mode': 'WAL', 'cache_size': -2000, 'mmap_size': None}),
+            ['PRAGMA journal_mode = WAL', 'PRAGMA cache_size = -2000'],
+        )
+        with self.assertRaises(ImproperlyConfigured):
+            pragma_statements({'journal_mode': 'WAL; DROP TABLE memos_memo'})
+
+    @skipUnless(connection.vendor == 'sqlite', 'SQLite 전용')
+    def test_pragmas_not_counted_as_queries(self):
+        """PRAGMA 는 요청 지표와 쿼리 예산의 쿼리 수에 포함되지 않음"""
+        from memojjang.sqlite import configure_sqlite
+
+        wrapper = self._new_connection(':memory:')
+        wrapper.ensure_connection()
+        executed = []
+
+        def record(execute, sql, params, many, context):
+            executed.append(sql)
+            return execute(sql, params, many, context)
+
+        with wrapper.execute_wrapper(record):
+            configure_sqlite(wrapper)
+        self.assertEqual(executed, [])
+        self.assertEqual(self._pragma(wrapper, 'busy_timeout'), 5000)
+
+
+class DatabaseConfigTest(TestCase):
+    """환경변수로 만드는 데이터베이스 설정 테스트"""
+
+    def _config(self, env, engine='django.db.backends.sqlite3'):
+        import os
+        from unittest import mock
+        from memojjang.settings import database_config
+
+        with mock.patch.dict(os.environ, env):
+            return database_config({
+                'ENGINE': engine, 'NAME': 'memojjang', 'USER': '', 'PASSWORD': '', 'HOST': '', 'PORT': '',
+            })
+
+    def test_persistent_connections(self):
+        """기본값은 60초 동안 연결을 유지하고 재사용 전에 확인"""
+        config = self._config({})
+        self.assertEqual(config['CONN_MAX_AGE'], 60)
+        self.assertTrue(config['CONN_HEALTH_CHECKS'])
+        config = self._config({'DB_CONN_MAX_AGE': '0', 'DB_CONN_HEALTH_CHECKS': 'False'})
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        self.assertFalse(config['CONN_HEALTH_CHECKS'])
+
+    def test_postgres_pool(self):
+        """PostgreSQL 연결 풀 옵션 (풀을 쓰면 지속 연결은 끔)"""
+        from django.core.exceptions import ImproperlyConfigured
+
+        config = self._config(
+            {'DB_POOL': 'True', 'DB_POOL_MAX_SIZE': '20'}, engine='django.db.backends.postgresql',
+        )
+        self.assertEqual(config['OPTIONS']['pool'], {'min_size': 2, 'max_size': 20, 'timeout': 10.0})
+        self.assertEqual(config['CONN_MAX_AGE'], 0)
+        with self.assertRaises(ImproperlyConfigured):
+            self._config({'DB_POOL': 'True'})
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    SESSION_ENGINE='django.contrib.sessions.backends.cached_db',
+)
+class SessionStorageTest(TestCase):
+    """캐시 세션과 쿠키 메시지 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.memo = Memo.objects.create(title='세션 메모', content='내용', author=self.user)
+
+    def _session_queries(self, func):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = func()
+        return response, [query['sql'] for query in context.captured_queries if 'django_session' in query['sql']]
+
+    def test_memo_list_without_session_queries(self):
+        """로그인한 뒤 목록 요청은 세션 테이블을 조회하지 않음 (cached_db, cache)"""
+        for engine in ('cached_db', 'cache'):
+            with self.subTest(engine=engine), self.settings(
+                SESSION_ENGINE=f'django.contrib.sessions.backends.{engine}',
+            ):
+                # 세션 미들웨어가 설정을 다시 읽도록 새 Client
+                self.client = self.client_class()
+                self.client.login(username='testuser', password='testpass123')
+                for _ in range(2):
+                    response, queries = self._session_queries(lambda: self.client.get(reverse('memos:list')))
+                    self.assertEqual(response.status_code, 200)
+                    self.assertEqual(queries, [])
+
+    def test_cached_db_survives_cache_clear(self):
+        """cached_db 는 캐시가 비워져도 DB 에서 세션을 읽어 로그인 유지"""
+        from django.core.cache import cache
+
+        self.client.login(username='testuser', password='testpass123')
+        cache.clear()
+        response, queries = self._session_queries(lambda: self.client.get(reverse('memos:list')))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        _, queries = self._session_queries(lambda: self.client.get(reverse('memos:list')))
+        self.assertEqual(queries, [])
+
+    def test_session_engine_default(self):
+        """세션 기본값은 공유 캐시면 cached_db, locmem 이면 db"""
+        import os
+        from unittest import mock
+        from memojjang.settings import session_engine
+
+        with mock.patch.dict(os.environ, {'SESSION_BACKEND': ''}):
+            self.assertEqual(session_engine('redis', False), 'django.contrib.sessions.backends.cached_db')
+            self.assertEqual(session_engine('file', False), 'django.contrib.sessions.backends.cached_db')
+            self.assertEqual(session_engine('locmem', False), 'django.contrib.sessions.backends.db')
+            self.assertEqual(session_engine('locmem', True), 'django.contrib.sessions.backends.db')
+
+    def test_cache_session_requires_shared_cache(self):
+        """DEBUG 가 꺼져 있으면 locmem 캐시로 캐시 세션을 쓸 수 없음"""
+        import os
+        from unittest import mock
+        from django.core.exceptions import ImproperlyConfigured
+        from memojjang.settings import session_engine
+
+        for backend in ('cached_db', 'cache'):
+            with self.subTest(backend=backend), mock.patch.dict(os.environ, {'SESSION_BACKEND': backend}):
+                with self.assertRaises(ImproperlyConfigured):
+                    session_engine('locmem', False)
+                self.assertEqual(session_engine('locmem', True), f'django.contrib.sessions.backends.{backend}')
+                self.assertEqual(session_engine('redis', False), f'django.contrib.sessions.backends.{backend}')
+
+    def test_messages_do_not_write_session(self):
+        """메시지는 쿠키에 저장되어 세션을 다시 쓰지 않음"""
+        self.client.login(username='testuser', password='testpass123')
+        response, queries = self._session_queries(lambda: self.client.post(
+            reverse('memos:edit', kwargs={'pk': self.memo.pk}),
+            {'title': '수정한 메모', 'content': '내용', 'priority': 'normal'},
+        ))
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(queries, [])
+        self.assertIn('messages', response.cookies)
+        self.assertContains(self.client.get(reverse('memos:list')), '성공적으로 수정되었습니다')
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MemoCardFragmentCacheTest(TestCase):
+    """메모 카드 조각 캐시와 템플릿 로더 캐시 테스트"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.memo = Memo.objects.create(title='카드 메모', content='카드 내용', author=self.user)
+
+    def _render(self, memo):
+        from django.template.loader import render_to_string
+
+        return render_to_string('memos/_memo_card.html', {'memo': memo})
+
+    def test_card_cached_until_updated(self):
+        """updated_at 이 같으면 캐시한 카드를, 메모를 저장하면 새 카드를 렌더링"""
+        self.assertIn('카드 메모', self._render(self.memo))
+        # 저장하지 않고 바꾼 값은 캐시 때문에 보이지 않음
+        self.memo.title = '저장 안 한 제목'
+        self.assertIn('카드 메모', self._render(self.memo))
+
+        self.memo.title = '수정한 제목'
+        self.memo.save()
+        html = self._render(self.memo)
+        self.assertIn('수정한 제목', html)
+        self.assertIn('수정됨', html)
+
+    def test_pinned_state_outside_cache(self):
+        """고정 여부는 캐시와 관계없이 반영"""
+        self.assertNotIn('data-pinned', self._render(self.memo))
+        self.memo.is_pinned = True
+        self.assertIn('data-pinned', self._render(self.memo))
+
+    def test_memo_list_after_edit(self):
+        """수정한 메모가 목록의 카드에 바로 반영"""
+        self.client.login(username='testuser', password='testpass123')
+        self.assertContains(self.client.get(reverse('memos:list')), '카드 메모')
+        self.client.post(
+            reverse('memos:edit', kwargs={'pk': self.memo.pk}),
+            {'title': '목록에서 수정', 'content': '카드 내용', 'priority': 'normal'},
+        )
+        response = self.client.get(reverse('memos:list'))
+        self.assertContains(response, '목록에서 수정')
+        self.assertNotContains(response, '카드 메모')
+
+    def test_cached_template_loader(self):
+        """템플릿을 cached 로더로 읽어 요청마다 다시 파싱하지 않음"""
+        from django.template import engines
+        from django.template.loaders.cached import Loader
+
+        self.assertIsInstance(engines['django'].engine.template_loaders[0], Loader)
+
+
+@override_settings(DATABASE_REPLICA='replica')
+class ReplicaRoutingTest(TestCase):
+    """읽기 복제본 라우팅 테스트 (기본 DB 와 복제본이 별도의 SQLite DB)"""
+    databases = {'default', 'replica'}
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.primary_memo = Memo.objects.create(title='기본 DB 메모', content='기본 내용', author=self.user)
+        # 복제되지 않은 상태를 흉내내기 위해 복제본에만 있는 메모 (bulk_create 는 시그널 없음)
+        User.objects.using('replica').bulk_create([User(pk=self.user.pk, username='testuser')])
+        self.replica_memo, = Memo.objects.using('replica').bulk_create([
+            Memo(title='복제본 메모', content='복제본 내용', author_id=self.user.pk),
+        ])
+        self.client.login(username='testuser', password='testpass123')
+
+    def _memo_queries(self, alias, func):
+        from django.db import connections
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connections[alias]) as context:
+            func()
+        return [query['sql'] for query in context.captured_queries if 'memos_' in query['sql']]
+
+    def test_read_only_views_read_from_replica(self):
+        """목록, 상세는 복제본에서 읽음"""
+        response = self.client.get(reverse('memos:list'))
+        self.assertContains(response, '복제본 메모')
+        self.assertNotContains(response, '기본 DB 메모')
+        response = self.client.get(reverse('memos:detail', kwargs={'pk': self.replica_memo.pk}))
+        self.assertContains(response, '복제본 내용')
+
+    def test_search_and_stats_read_from_replica(self):
+        """검색, 통계의 메모 쿼리는 복제본에서만 실행"""
+        for url, params in [(reverse('memos:search_ajax'), {'q': '내용'}), (reverse('memos:stats'), {})]:
+            with self.subTest(url=url):
+                self.assertEqual(
+                    self._memo_queries('default', lambda: self.client.get(url, params)), [],
+                )
+                self.assertNotEqual(
+                    self._memo_queries('replica', lambda: self.client.get(url, params)), [],
+                )
+
+    def test_other_views_use_primary(self):
+        """수정 화면 같은 다른 뷰는 기본 DB 사용"""
+        response = self.client.get(reverse('memos:edit', kwargs={'pk': self.primary_memo.pk}))
+        self.assertEqual(response.status_code, 200)
+        with self.settings(DATABASE_REPLICA=None):
+            self.assertContains(self.client.get(reverse('memos:list')), '기본 DB 메모')
+
+    def test_read_your_writes(self):
+        """메모를 쓴 뒤에는 잠시 기본 DB 에서 읽음"""
+        from memojjang.db_router import PIN_COOKIE
+
+        response = self.client.post(reverse('memos:create'), {
+            'title': '방금 쓴 메모', 'content': '방금 쓴 내용', 'priority': 'normal',
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertTrue(Memo.objects.using('default').filter(title='방금 쓴 메모').exists())
+        self.assertFalse(Memo.objects.using('replica').filter(title='방금 쓴 메모').exists())
+        self.assertEqual(response.cookies[PIN_COOKIE]['max-age'], 5)
+
+        response = self.client.get(reverse('memos:list'))
+        self.assertContains(response, '방금 쓴 메모')
+        self.assertNotContains(response, '복제본 메모')
+
+        # 고정 시간이 지나 쿠키가 만료되면 다시 복제본에서 읽음
+        del self.client.cookies[PIN_COOKIE]
+        self.assertNotContains(self.client.get(reverse('memos:list')), '방금 쓴 메모')
+
+    def test_reads_do_not_pin(self):
+        """조회만 한 요청은 기본 DB 에 고정하지 않음"""
+        from memojjang.db_router import PIN_COOKIE
+
+        response = self.client.get(reverse('memos:list'))
+        self.assertNotIn(PIN_COOKIE, response.cookies)
+
+    @override_settings(ROOT_URLCONF='memojjang.urls_asgi')
+    async def test_async_views_read_from_replica(self):
+        """비동기 조회 뷰도 복제본에서 읽음"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        response = await self.async_client.get(reverse('memos:list'))
+        self.assertContains(response, '복제본 메모')
+        self.assertNotContains(response, '기본 DB 메모')
+        response = await self.async_client.get(reverse('memos:detail', kwargs={'pk': self.replica_memo.pk}))
+        self.assertContains(response, '복제본 내용')
+
+
+class QueryBudgetIntegrationTest(TestCase):
+    """쿼리 예산 통합 테스트 (모든 뷰의 예산 선언, 비동기 뷰, 일괄 처리 API, 관리자 화면)"""
+
+    def setUp(self):
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.memos = [
+            Memo.objects.create(title=f'예산 메모 {i}', content=f'예산 내용 {i}', author=self.user)
+            for i in range(25)
+        ]
+
+    def test_every_view_has_budget(self):
+        """메모/사용자 URL 의 모든 뷰(ASGI 버전 포함)에 쿼리 예산이 있는지 테스트"""
+        from apps.memos import urls as memo_urls, urls_async
+        from apps.users import urls as user_urls
+        from memojjang import urls as root_urls
+        from memojjang.query_budget import get_query_budget
+
+        patterns = [
+            *memo_urls.urlpatterns, *urls_async.urlpatterns, *user_urls.urlpatterns,
+            *(pattern for pattern in root_urls.urlpatterns if getattr(pattern, 'name', None) == 'home'),
+        ]
+        for pattern in patterns:
+            with self.subTest(name=pattern.name):
+                self.assertIsNotNone(get_query_budget(pattern.callback))
+
+    @override_settings(ROOT_URLCONF='memojjang.urls_asgi')
+    async def test_async_views_within_budget(self):
+        """비동기 조회 뷰가 예산 안에서 실행되는지 테스트"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        requests = [
+            (reverse('memos:list'), {}),
+            (reverse('memos:list'), {'page': 2}),
+            (reverse('memos:detail', kwargs={'pk': self.memos[0].pk}), {}),
+            (reverse('memos:search_ajax'), {'q': '예산'}),
+        ]
+        for url, params in requests:
+            with self.subTest(url=url, params=params):
+                response = await self.async_client.get(url, params)
+                self.assertEqual(response.status_code, 200)
+        with self.settings(MEMO_LIST_PAGINATION='offset'):
+            response = await self.async_client.get(reverse('memos:list'), {'page': 2})
+        self.assertEqual(response.status_code, 200)
+
+    def test_bulk_api_within_budget(self):
+        """일괄 처리 API 가 항목 수와 관계없이 예산 안인지 테스트 (HTTP Basic 인증)"""
+        import base64
+
+        auth = 'Basic ' + base64.b64encode(b'testuser:testpass123').decode()
+        for size in (1, 100):
+            with self.subTest(size=size):
+                MemoDailyActivity.objects.all().delete()
+                response = self.client.post(
+                    reverse('memos:api_bulk_create'),
+                    json.dumps({'memos': [{'title': f'API {i}', 'content': '내용 ' * 50} for i in range(size)]}),
+                    content_type='application/json', HTTP_AUTHORIZATION=auth,
+                )
+                ids = [result['id'] for result in response.json()['results']]
+                response = self.client.post(
+                    reverse('memos:api_bulk_update'),
+                    json.dumps({'memos': [{'id': pk, 'content': '수정 ' * 50} for pk in ids]}),
+                    content_type='application/json', HTTP_AUTHORIZATION=auth,
+                )
+                self.assertEqual(response.json()['summary'], {'updated': size})
+                response = self.client.post(
+                    reverse('memos:api_bulk_delete'), json.dumps({'ids': ids}),
+                    content_type='application/json', HTTP_AUTHORIZATION=auth,
+                )
+                self.assertEqual(response.json()['summary'], {'deleted': size})
+
+    def test_admin_changelist_query_count_constant(self):
+        """관리자 메모 목록(작성자, 중요도 표시)의 쿼리 수가 메모 수와 무관한지 테스트"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        User.objects.create_superuser(username='admin', password='adminpass123')
+        self.client.login(username='admin', password='adminpass123')
+        url = reverse('admin:memos_memo_changelist')
+
+        with CaptureQueriesContext(connection) as small:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        for i in range(25):
+            author = User.objects.create_user(username=f'author{i}')
+            Memo.objects.create(title=f'관리자 메모 {i}', content='내용', author=author, priority='urgent')
+        with CaptureQueriesContext(connection) as large:
+            self.assertEqual(self.client.get(url).status_code, 200)
+        self.assertEqual(len(large.captured_queries), len(small.captured_queries))
+
+
+class MemoMigrationBackfillTest(TransactionTestCase):
+    """기존 메모가 있는 DB 를 업그레이드할 때 데이터를 채우는 마이그레이션 테스트"""
+
+    def _migrate(self, target):
+        """memos 앱을 target 마이그레이션으로 옮기고 그 시점의 모델 레지스트리를 반환합니다."""
+        from django.db.migrations.executor import MigrationExecutor
+
+        executor = MigrationExecutor(connection)
+        if target is None:
+            target = executor.loader.graph.leaf_nodes('memos')[0][1]
+        executor.migrate([('memos', target)])
+        executor.loader.build_graph()
+        return executor.loader.project_state([('memos', target)]).apps
+
+    def tearDown(self):
+        self._migrate(None)
+
+    def test_ngram_index_backfilled(self):
+        """n-gram 색인 테이블을 만들 때 기존 메모를 색인해 검색할 수 있음"""
+        apps = self._migrate('0003_memo_search_index')
+        user = apps.get_model('auth', 'User').objects.create(username='legacy')
+        memo = apps.get_model('memos', 'Memo').objects.create(
+            title='기존 테스트 메모', content='업그레이드 전에 쓴 메모', author_id=user.pk,
+        )
+
+        self._migrate(None)
+        from apps.memos.ngram import search_ngram
+
+        self.assertEqual(
+            list(search_ngram(Memo.objects.all(), '테스트', author=user.pk).values_list('pk', flat=True)), [memo.pk],
+        )
+
+    def test_activity_backfilled(self):
+        """일일 활동 집계 테이블을 만들 때 기존 메모의 작성 집계를 채움"""
+        apps = self._migrate('0006_memo_word_count')
+        user = apps.get_model('auth', 'User').objects.create(username='legacy')
+        apps.get_model('memos', 'Memo').objects.create(
+            title='기존 메모', content='업그레이드 전에 쓴 메모', author_id=user.pk, priority='high', word_count=3,
+        )
+
+        apps = self._migrate('0007_memodailyactivity')
+        activity = apps.get_model('memos', 'MemoDailyActivity').objects.get(user_id=user.pk)
+        self.assertEqual(activity.created_count, 1)
+        self.assertEqual(activity.high_count, 1)
+        self.assertEqual(activity.words_added, 3)
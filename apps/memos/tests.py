@@ -1,8 +1,11 @@
-from django.test import TestCase, Client
+from io import StringIO
+from django.test import TestCase, TransactionTestCase, Client, override_settings
 from django.contrib.auth.models import User
+from django.core.management import call_command
 from django.urls import reverse
-from .models import Memo
+from .models import Memo, MemoNgram
 from .forms import MemoForm
+from .search import search_memos
 
 
 class MemoModelTest(TestCase):
@@ -191,3 +194,1239 @@ class MemoViewTest(TestCase):
         response = self.client.get(reverse('memos:list'))
         self.assertContains(response, '테스트 메모')
         self.assertNotContains(response, '다른 사용자 메모')
+
+
+@override_settings(MEMO_SEARCH_BACKEND='fulltext')
+class MemoSearchIndexTest(TransactionTestCase):
+    # FTS5 가상 테이블 생성/삭제는 롤백하면 SQLite 스키마가 깨지므로 실제로 커밋하고 tearDown 에서 삭제
+    
+    def setUp(self):
+        from django.db import connection
+        from .search import sync_search_index
+        
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.memo = Memo.objects.create(
+            title='장보기 목록',
+            content='Django 공부 후 우유 사기',
+            author=self.user
+        )
+        # 테스트 DB 는 기본 검색 방식(ngram)으로 마이그레이션되므로 인덱스를 만들고 기존 메모를 색인
+        sync_search_index(connection)
+    
+    def tearDown(self):
+        from django.db import connection
+        from .search import drop_search_index
+        
+        drop_search_index(connection)
+
+    def search(self, query):
+        return list(search_memos(Memo.objects.filter(author=self.user), query))
+
+    def test_search_matches_title_and_content(self):
+        """제목/내용 전문 검색 테스트"""
+        self.assertEqual(self.search('장보기'), [self.memo])
+        self.assertEqual(self.search('django'), [self.memo])
+        self.assertEqual(self.search('Djan'), [self.memo])  # 접두어 일치
+        self.assertEqual(self.search('장보기 우유'), [self.memo])
+        self.assertEqual(self.search('장보기 커피'), [])
+
+    def test_search_index_follows_update_and_delete(self):
+        """메모 수정/삭제 시 검색 인덱스 동기화 테스트"""
+        self.memo.title = '회의 준비'
+        self.memo.save()
+        self.assertEqual(self.search('장보기'), [])
+        self.assertEqual(self.search('회의'), [self.memo])
+
+        self.memo.delete()
+        self.assertEqual(self.search('회의'), [])
+
+    def test_search_ignores_punctuation_only_query(self):
+        """특수문자만 있는 검색어 테스트"""
+        self.assertEqual(self.search('"*()'), [])
+
+    def test_index_only_for_fulltext(self):
+        """다른 검색 방식에서는 메모를 쓸 때마다 갱신되는 전문 검색 인덱스를 삭제하는지 테스트"""
+        from django.db import connection
+        from .search import FTS_TABLE, PG_SEARCH_INDEX, sync_search_index
+        
+        def index_exists():
+            with connection.cursor() as cursor:
+                if connection.vendor == 'sqlite':
+                    return FTS_TABLE in connection.introspection.table_names(cursor)
+                return PG_SEARCH_INDEX in connection.introspection.get_constraints(cursor, 'memos_memo')
+        
+        self.assertTrue(index_exists())
+        with self.settings(MEMO_SEARCH_BACKEND='ngram'):
+            sync_search_index(connection)
+            self.assertFalse(index_exists())
+            Memo.objects.create(title='인덱스 없이 저장', content='내용', author=self.user)
+
+
+class MemoNgramIndexTest(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        self.memo = Memo.objects.create(
+            title='주간 회의록',
+            content='Django 프레임워크를 공부중입니다',
+            author=self.user
+        )
+
+    def search(self, query, user=None):
+        user = user or self.user
+        return list(search_memos(Memo.objects.filter(author=user), query, author=user))
+
+    def test_ngram_index_created_on_save(self):
+        """메모 저장 시 n-gram 색인 생성 테스트"""
+        grams = set(MemoNgram.objects.filter(memo=self.memo).values_list('gram', flat=True))
+        self.assertIn('회의', grams)
+        self.assertIn('회의록', grams)
+        self.assertIn('dja', grams)
+
+    def test_substring_search(self):
+        """한글 복합어 부분 문자열 검색 테스트"""
+        self.assertEqual(self.search('공부중'), [self.memo])
+        self.assertEqual(self.search('레임워크'), [self.memo])
+        self.assertEqual(self.search('회의'), [self.memo])  # 2글자 검색
+        self.assertEqual(self.search('DJANGO'), [self.memo])
+        self.assertEqual(self.search('회의록 Django'), [])  # 제목/내용에 걸친 문자열
+        self.assertEqual(self.search('공부 중'), [])
+
+    def test_search_is_scoped_to_author(self):
+        """다른 사용자의 색인은 검색되지 않는지 테스트"""
+        self.assertEqual(self.search('회의', user=self.other_user), [])
+
+    def test_index_follows_update(self):
+        """메모 수정 시 색인 증분 갱신 테스트"""
+        self.memo.content = '장보기 목록'
+        self.memo.save()
+        self.assertEqual(self.search('공부중'), [])
+        self.assertEqual(self.search('장보기'), [self.memo])
+        self.assertFalse(MemoNgram.objects.filter(memo=self.memo, gram='공부').exists())
+
+    def test_index_removed_on_delete(self):
+        """메모 삭제 시 색인 삭제 테스트"""
+        self.memo.delete()
+        self.assertFalse(MemoNgram.objects.exists())
+
+    def test_rebuild_command(self):
+        """n-gram 색인 재생성 명령 테스트"""
+        Memo.objects.bulk_create([
+            Memo(title=f'일괄 메모 {i}', content='대량으로 넣은 메모', author=self.user)
+            for i in range(3)
+        ])
+        self.assertEqual(len(self.search('대량으로')), 0)
+
+        out = StringIO()
+        call_command('rebuild_memo_ngrams', batch_size=2, stdout=out)
+        self.assertIn('4개의 메모', out.getvalue())
+        self.assertEqual(len(self.search('대량으로')), 3)
+        self.assertEqual(self.search('공부중'), [self.memo])
+
+
+class MemoCursorPaginationTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        from django.utils import timezone
+        import datetime
+        
+        now = timezone.now()
+        memos = []
+        for i in range(25):
+            memo = Memo.objects.create(
+                title=f'메모 {i}',
+                content=f'내용 {i}',
+                author=self.user,
+                is_pinned=(i % 7 == 0)
+            )
+            # 같은 작성 시각을 가진 메모도 섞어서 id 보조 정렬을 확인
+            memo.created_at = now - datetime.timedelta(minutes=i // 2)
+            memos.append(memo)
+        Memo.objects.bulk_update(memos, ['created_at'])
+        self.expected = list(
+            Memo.objects.filter(author=self.user)
+            .order_by('-is_pinned', '-created_at', 'id')
+            .values_list('pk', flat=True)
+        )
+        self.client.login(username='testuser', password='testpass123')
+    
+    def get_page(self, cursor=None):
+        params = {'cursor': cursor} if cursor else {}
+        return self.client.get(reverse('memos:list'), params)
+    
+    def test_walk_forward_and_back(self):
+        """다음/이전 커서로 전체 목록을 순회하는지 테스트"""
+        pages = []
+        cursor = None
+        while True:
+            response = self.get_page(cursor)
+            self.assertEqual(response.status_code, 200)
+            page = response.context['page_obj']
+            pages.append([memo.pk for memo in page])
+            cursor = page.next_cursor
+            if not cursor:
+                break
+        self.assertEqual(sum(pages, []), self.expected)
+        self.assertEqual([len(p) for p in pages], [10, 10, 5])
+        
+        # 마지막 페이지에서 이전 페이지로 이동
+        self.assertTrue(page.has_previous())
+        response = self.get_page(page.previous_cursor)
+        page = response.context['page_obj']
+        self.assertEqual([memo.pk for memo in page], pages[1])
+        self.assertTrue(page.has_next())
+        response = self.get_page(page.previous_cursor)
+        page = response.context['page_obj']
+        self.assertEqual([memo.pk for memo in page], pages[0])
+        self.assertFalse(page.has_previous())
+    
+    def test_no_count_query(self):
+        """커서 페이지네이션은 COUNT 쿼리를 실행하지 않는지 테스트"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.get_page()
+        self.assertEqual(response.status_code, 200)
+        # ETag 계산용 MAX(updated_at)/COUNT 집계는 제외
+        self.assertFalse(any(
+            'COUNT(' in q['sql'] and 'MAX(' not in q['sql'] for q in ctx.captured_queries
+        ))
+        self.assertContains(response, 'cursor=')
+    
+    def test_invalid_cursor(self):
+        """잘못된 커서는 404를 반환하는지 테스트"""
+        response = self.get_page('not-a-cursor')
+        self.assertEqual(response.status_code, 404)
+    
+    def test_crafted_cursor(self):
+        """값이 null, 숫자, 빈 문자열인 조작된 커서도 404를 반환하는지 테스트"""
+        import base64
+        import json
+        
+        values_list = [
+            ['True', None, None], ['False', '2025-01-01T00:00:00+00:00', None], ['True', '', '1'],
+            [True, 1, 1], {'a': 1, 'b': 2, 'c': 3}, 'abc',
+        ]
+        for values in values_list:
+            with self.subTest(values=values):
+                payload = json.dumps({'d': 'next', 'v': values}).encode()
+                cursor = base64.urlsafe_b64encode(payload).decode().rstrip('=')
+                self.assertEqual(self.get_page(cursor).status_code, 404)
+
+
+class MemoQueryPlanTest(TestCase):
+    """목록/검색 쿼리가 복합 인덱스를 사용하는지 EXPLAIN 으로 확인"""
+    
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        for i in range(30):
+            Memo.objects.create(
+                title=f'회의 메모 {i}',
+                content=f'내용 {i}',
+                author=self.user,
+                is_pinned=(i % 5 == 0)
+            )
+        self.client.login(username='testuser', password='testpass123')
+    
+    def memo_select_plan(self, url, params, order_by):
+        """뷰가 실행한 memos_memo SELECT 쿼리의 실행 계획을 반환"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        
+        queries = [
+            q['sql'] for q in ctx.captured_queries
+            if q['sql'].startswith('SELECT') and 'FROM "memos_memo"' in q['sql'] and order_by in q['sql']
+        ]
+        self.assertTrue(queries, f'{url} 에서 memos_memo 조회 쿼리를 찾지 못했습니다.')
+        
+        with connection.cursor() as cursor:
+            if connection.vendor == 'postgresql':
+                cursor.execute('SET LOCAL enable_seqscan = off')
+                cursor.execute('EXPLAIN ' + queries[0])
+            else:
+                cursor.execute('EXPLAIN QUERY PLAN ' + queries[0])
+            return '\n'.join(str(row) for row in cursor.fetchall())
+    
+    def test_list_uses_author_list_index(self):
+        """메모 목록 쿼리의 인덱스 사용 테스트"""
+        plan = self.memo_select_plan(reverse('memos:list'), {}, '"is_pinned" DESC')
+        self.assertIn('memos_memo_author_list_idx', plan)
+    
+    def test_list_search_uses_author_list_index(self):
+        """검색어가 있는 메모 목록 쿼리의 인덱스 사용 테스트"""
+        plan = self.memo_select_plan(reverse('memos:list'), {'search': '회의'}, '"is_pinned" DESC')
+        self.assertIn('memos_memo_author_list_idx', plan)
+    
+    def test_ajax_search_uses_author_updated_index(self):
+        """AJAX 검색 쿼리의 인덱스 사용 테스트"""
+        plan = self.memo_select_plan(reverse('memos:search_ajax'), {'q': '회의'}, '"updated_at" DESC')
+        self.assertIn('memos_memo_author_upd_idx', plan)
+
+
+class MemoPreviewTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.memo = Memo.objects.create(
+            title='긴 메모',
+            content='가나다라마바사 ' * 100,
+            author=self.user
+        )
+        self.client.login(username='testuser', password='testpass123')
+    
+    def test_preview_fields_computed_on_save(self):
+        """저장 시 미리보기/글자 수 계산 테스트"""
+        self.assertEqual(self.memo.char_count, 800)
+        self.assertEqual(self.memo.preview, self.memo.content[:Memo.PREVIEW_LENGTH])
+        
+        self.memo.content = '짧은 내용'
+        self.memo.save(update_fields=['content'])
+        self.memo.refresh_from_db()
+        self.assertEqual((self.memo.preview, self.memo.char_count, self.memo.word_count), ('짧은 내용', 5, 2))
+    
+    def assert_content_not_selected(self, url, params):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        selects = [
+            q['sql'].split(' FROM ')[0] for q in ctx.captured_queries
+            if 'FROM "memos_memo"' in q['sql'] and q['sql'].startswith('SELECT')
+        ]
+        self.assertTrue(selects)
+        for select in selects:
+            self.assertNotIn('"memos_memo"."content"', select)
+        return response
+    
+    def test_list_reads_preview_only(self):
+        """메모 목록이 본문 전체를 읽지 않는지 테스트"""
+        response = self.assert_content_not_selected(reverse('memos:list'), {})
+        self.assertContains(response, '800자')
+        self.assertContains(response, '가나다라마바사 가나다라마바사')
+    
+    def test_ajax_search_reads_preview_only(self):
+        """AJAX 검색이 본문 전체를 읽지 않는지 테스트"""
+        import json
+        
+        response = self.assert_content_not_selected(reverse('memos:search_ajax'), {'q': '가나다'})
+        result = json.loads(response.content)['results'][0]
+        self.assertEqual(result['content'], self.memo.content[:100] + '...')
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    MEMO_CACHE_ENABLED=True,
+)
+class MemoUserCacheTest(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        
+        cache.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        self.memo = Memo.objects.create(
+            title='캐시 메모',
+            content='캐시 내용',
+            author=self.user
+        )
+        self.client.login(username='testuser', password='testpass123')
+    
+    def memo_queries(self, url, params=None):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.client.get(url, params or {})
+        self.assertEqual(response.status_code, 200)
+        # ETag 계산용 MAX(updated_at)/COUNT 집계를 제외한 메모 조회 쿼리 수
+        count = sum(
+            'FROM "memos_memo"' in q['sql'] and 'MAX(' not in q['sql']
+            for q in ctx.captured_queries
+        )
+        return response, count
+    
+    def test_list_served_from_cache(self):
+        """두 번째 목록 요청은 메모 테이블을 조회하지 않는지 테스트"""
+        _, first = self.memo_queries(reverse('memos:list'))
+        response, second = self.memo_queries(reverse('memos:list'))
+        self.assertGreater(first, 0)
+        self.assertEqual(second, 0)
+        self.assertContains(response, '캐시 메모')
+    
+    def test_list_cache_invalidated_on_save_and_delete(self):
+        """메모 수정/삭제 시 목록 캐시가 무효화되는지 테스트"""
+        self.memo_queries(reverse('memos:list'))
+        self.memo.title = '수정된 캐시 메모'
+        self.memo.save()
+        response, count = self.memo_queries(reverse('memos:list'))
+        self.assertGreater(count, 0)
+        self.assertContains(response, '수정된 캐시 메모')
+        
+        self.memo.delete()
+        response, _ = self.memo_queries(reverse('memos:list'))
+        self.assertNotContains(response, '수정된 캐시 메모')
+    
+    def test_cache_invalidated_by_queryset_update(self):
+        """관리자 일괄 작업(queryset.update) 후 캐시가 무효화되는지 테스트"""
+        from django.contrib.admin.sites import site
+        from django.contrib.messages.storage.cookie import CookieStorage
+        from django.test import RequestFactory
+        
+        self.memo_queries(reverse('memos:search_ajax'), {'q': '캐시'})
+        request = RequestFactory().post('/admin/memos/memo/')
+        request._messages = CookieStorage(request)
+        site._registry[Memo].make_pinned(request, Memo.objects.filter(pk=self.memo.pk))
+        
+        _, count = self.memo_queries(reverse('memos:search_ajax'), {'q': '캐시'})
+        self.assertGreater(count, 0)
+    
+    def test_other_users_writes_keep_cache(self):
+        """다른 사용자의 메모 변경은 캐시를 무효화하지 않는지 테스트"""
+        self.memo_queries(reverse('memos:search_ajax'), {'q': '캐시'})
+        Memo.objects.create(title='캐시 메모', content='다른 사용자', author=self.other_user)
+        Memo.objects.filter(author=self.other_user).update(is_pinned=True)
+        _, count = self.memo_queries(reverse('memos:search_ajax'), {'q': '캐시'})
+        self.assertEqual(count, 0)
+    
+    @override_settings(MEMO_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        """공유 캐시가 아니면 다른 워커에서 작성한 메모(버전 그대로)도 바로 보이는지 테스트"""
+        from django.core.cache import cache
+        from .cache import _version_key
+        
+        self.memo_queries(reverse('memos:list'))
+        version_key = _version_key(self.user.pk)
+        version = cache.get(version_key)
+        Memo.objects.create(title='다른 워커의 메모', content='내용', author=self.user)
+        cache.set(version_key, version, None)
+        
+        response, count = self.memo_queries(reverse('memos:list'))
+        self.assertGreater(count, 0)
+        self.assertContains(response, '다른 워커의 메모')
+
+
+@override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}})
+class MemoAutocompleteTest(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        from .autocomplete import title_indexes
+        
+        cache.clear()
+        title_indexes.clear()
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        for title in ['주간 회의록', 'Django 정리', '회고 메모', '장보기 목록']:
+            Memo.objects.create(title=title, content='내용', author=self.user)
+        Memo.objects.create(title='회의 준비', content='내용', author=self.other_user)
+        self.client.login(username='testuser', password='testpass123')
+    
+    def suggest(self, query):
+        response = self.client.get(reverse('memos:autocomplete'), {'q': query})
+        self.assertEqual(response.status_code, 200)
+        return [item['title'] for item in response.json()['results']]
+    
+    def test_prefix_and_word_start(self):
+        """제목 시작과 제목 중간 단어의 접두어로 자동완성되는지 테스트"""
+        self.assertEqual(self.suggest('회'), ['회고 메모', '주간 회의록'])
+        self.assertEqual(self.suggest('django'), ['Django 정리'])
+        self.assertEqual(self.suggest('주간 회'), ['주간 회의록'])
+        self.assertEqual(self.suggest('없는'), [])
+        self.assertEqual(self.suggest(''), [])
+    
+    def test_only_own_memos(self):
+        """다른 사용자의 메모 제목은 제안되지 않는지 테스트"""
+        self.assertNotIn('회의 준비', self.suggest('회의'))
+    
+    def test_served_from_memory(self):
+        """색인이 만들어진 뒤에는 메모 테이블을 조회하지 않는지 테스트"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        
+        self.suggest('회')
+        with CaptureQueriesContext(connection) as ctx:
+            self.suggest('장')
+        self.assertFalse(any('memos_memo' in q['sql'] for q in ctx.captured_queries))
+    
+    def test_index_refreshed_after_changes(self):
+        """메모 작성/수정/삭제 및 일괄 변경 후 색인이 갱신되는지 테스트"""
+        self.suggest('회')
+        memo = Memo.objects.create(title='회식 장소', content='내용', author=self.user)
+        self.assertIn('회식 장소', self.suggest('회'))
+        
+        memo.title = '저녁 장소'
+        memo.save()
+        self.assertNotIn('회식 장소', self.suggest('회'))
+        
+        Memo.objects.filter(pk=memo.pk).update(title='점심 장소')
+        self.assertEqual(self.suggest('점심'), ['점심 장소'])
+        
+        memo.delete()
+        self.assertEqual(self.suggest('점심'), [])
+    
+    def test_index_expires_after_ttl(self):
+        """버전이 그대로여도(다른 워커에서 변경) TTL 이 지나면 색인을 다시 만드는지 테스트"""
+        import time
+        from unittest import mock
+        from django.conf import settings
+        from django.core.cache import cache
+        from .cache import _version_key
+        
+        self.suggest('회')
+        version_key = _version_key(self.user.pk)
+        version = cache.get(version_key)
+        Memo.objects.filter(author=self.user, title='회고 메모').update(title='다른 워커의 메모')
+        cache.set(version_key, version, None)
+        self.assertIn('회고 메모', self.suggest('회'))
+        
+        later = time.monotonic() + settings.MEMO_AUTOCOMPLETE_TTL
+        with mock.patch('apps.memos.autocomplete.time.monotonic', return_value=later):
+            self.assertNotIn('회고 메모', self.suggest('회'))
+            self.assertEqual(self.suggest('다른'), ['다른 워커의 메모'])
+    
+    def test_lru_eviction(self):
+        """최대 사용자 수를 넘으면 가장 오래 사용하지 않은 색인이 제거되는지 테스트"""
+        from .autocomplete import TitleIndex, TitleIndexCache
+        
+        indexes = TitleIndexCache(max_users=2)
+        indexes.put(1, TitleIndex(0, []))
+        indexes.put(2, TitleIndex(0, []))
+        indexes.get(1)
+        indexes.put(3, TitleIndex(0, []))
+        self.assertEqual(len(indexes), 2)
+        self.assertIsNotNone(indexes.get(1))
+        self.assertIsNone(indexes.get(2))
+
+
+class MemoBulkApiTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        self.client.login(username='testuser', password='testpass123')
+    
+    def post(self, name, payload, client=None, **extra):
+        import json
+        
+        return (client or self.client).post(
+            reverse(f'memos:{name}'), json.dumps(payload), content_type='application/json', **extra
+        )
+    
+    def test_bulk_create(self):
+        """여러 메모를 한 번에 작성하고 항목별 결과를 반환하는지 테스트"""
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+        from .models import MemoDailyActivity
+        
+        memos = [
+            {'title': f'일괄 메모 {i}', 'content': f'일괄 내용 {i}', 'priority': 'high'}
+            for i in range(50)
+        ]
+        memos.insert(3, {'title': '', 'content': '제목 없음'})
+        memos.insert(5, '메모 아님')
+        with CaptureQueriesContext(connection) as ctx:
+            response = self.post('api_bulk_create', {'memos': memos})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        
+        self.assertEqual(data['summary'], {'created': 50, 'error': 2})
+        self.assertEqual(len(data['results']), 52)
+        self.assertEqual(data['results'][3]['status'], 'error')
+        self.assertIn('title', data['results'][3]['errors'])
+        self.assertEqual(data['results'][5]['status'], 'error')
+        
+        memo = Memo.objects.get(pk=data['results'][0]['id'])
+        self.assertEqual(memo.title, '일괄 메모 0')
+        self.assertEqual(memo.author, self.user)
+        self.assertEqual(memo.word_count, 3)
+        self.assertEqual(memo.preview, '일괄 내용 0')
+        # 건수와 관계없이 쿼리 수가 일정
+        self.assertLess(len(ctx.captured_queries), 20)
+        
+        # n-gram 색인과 일일 활동 집계도 갱신됨
+        self.assertEqual(search_memos(Memo.objects.all(), '메모 49').count(), 1)
+        activity = MemoDailyActivity.objects.get(user=self.user)
+        self.assertEqual(activity.created_count, 50)
+        self.assertEqual(activity.high_count, 50)
+        self.assertEqual(activity.words_added, 150)
+    
+    def test_bulk_update(self):
+        """여러 메모를 한 번에 수정하고 지정한 필드만 바뀌는지 테스트"""
+        from .models import MemoDailyActivity
+        
+        memos = [
+            Memo.objects.create(title=f'원래 제목 {i}', content='원래 내용', author=self.user)
+            for i in range(3)
+        ]
+        other = Memo.objects.create(title='남의 메모', content='내용', author=self.other_user)
+        old_updated_at = memos[0].updated_at
+        
+        response = self.post('api_bulk_update', {'memos': [
+            {'id': memos[0].pk, 'content': '새 내용 입니다'},
+            {'id': memos[1].pk, 'is_pinned': True},
+            {'id': memos[2].pk, 'title': '원래 제목 2'},
+            {'id': memos[0].pk, 'title': '중복'},
+            {'id': other.pk, 'title': '가로채기'},
+            {'id': memos[1].pk + 1000},
+            {'id': memos[2].pk, 'priority': 'wrong'},
+        ]})
+        self.assertEqual(response.status_code, 200)
+        statuses = [result['status'] for result in response.json()['results']]
+        self.assertEqual(statuses, ['updated', 'updated', 'unchanged', 'error', 'error', 'error', 'error'])
+        
+        memos[0].refresh_from_db()
+        self.assertEqual(memos[0].content, '새 내용 입니다')
+        self.assertEqual(memos[0].title, '원래 제목 0')
+        self.assertEqual(memos[0].word_count, 3)
+        self.assertGreater(memos[0].updated_at, old_updated_at)
+        memos[1].refresh_from_db()
+        self.assertTrue(memos[1].is_pinned)
+        self.assertEqual(memos[1].content, '원래 내용')
+        other.refresh_from_db()
+        self.assertEqual(other.title, '남의 메모')
+        
+        self.assertEqual(search_memos(Memo.objects.all(), '새 내용').count(), 1)
+        activity = MemoDailyActivity.objects.get(user=self.user)
+        self.assertEqual(activity.updated_count, 2)
+        self.assertEqual(activity.words_added, 3 * 2 + 1)
+    
+    def test_bulk_delete(self):
+        """여러 메모를 한 번에 삭제하고 다른 사용자의 메모는 지우지 않는지 테스트"""
+        from .models import MemoDailyActivity
+        
+        memos = [
+            Memo.objects.create(title=f'삭제 메모 {i}', content='삭제 내용', author=self.user)
+            for i in range(3)
+        ]
+        other = Memo.objects.create(title='남의 메모', content='내용', author=self.other_user)
+        
+        response = self.post('api_bulk_delete', {'ids': [memos[0].pk, memos[1].pk, other.pk, 'x']})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['summary'], {'deleted': 2, 'error': 2})
+        self.assertEqual(list(Memo.objects.filter(author=self.user)), [memos[2]])
+        self.assertTrue(Memo.objects.filter(pk=other.pk).exists())
+        self.assertFalse(MemoNgram.objects.filter(memo_id=memos[0].pk).exists())
+        
+        activity = MemoDailyActivity.objects.get(user=self.user)
+        self.assertEqual(activity.deleted_count, 2)
+        self.assertEqual(activity.words_added, 2)
+    
+    def test_invalid_ids(self):
+        """정수가 아닌 id(목록, 객체, true)는 항목별 오류로 반환하는지 테스트"""
+        memo = Memo.objects.create(title='첫 메모', content='내용', author=self.user)
+        invalid_ids = [[memo.pk], {'id': memo.pk}, True, None, '1']
+        
+        response = self.post('api_bulk_update', {'memos': [
+            *({'id': pk, 'title': '바뀜'} for pk in invalid_ids), '메모 아님',
+        ]})
+        self.assertEqual(response.status_code, 200)
+        results = response.json()['results']
+        self.assertEqual(response.json()['summary'], {'error': len(invalid_ids) + 1})
+        self.assertEqual(results[0]['errors'], {'id': ['id 는 정수여야 합니다.']})
+        
+        response = self.post('api_bulk_delete', {'ids': [*invalid_ids, memo.pk]})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['summary'], {'error': len(invalid_ids), 'deleted': 1})
+        self.assertEqual(response.json()['results'][-1], {'index': len(invalid_ids), 'status': 'deleted', 'id': memo.pk})
+        self.assertFalse(Memo.objects.filter(pk=memo.pk).exists())
+    
+    def test_invalid_requests(self):
+        """잘못된 요청 본문과 항목 수 제한을 검사하는지 테스트"""
+        response = self.client.post(
+            reverse('memos:api_bulk_create'), 'not json', content_type='application/json'
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.post('api_bulk_create', {'memo': []}).status_code, 400)
+        self.assertEqual(self.client.get(reverse('memos:api_bulk_create')).status_code, 405)
+        with self.settings(MEMO_API_BULK_LIMIT=2):
+            response = self.post('api_bulk_create', {'memos': [{}, {}, {}]})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_authentication(self):
+        """HTTP Basic 인증과 세션 인증(CSRF 필요)을 지원하는지 테스트"""
+        import base64
+        
+        anonymous = Client(enforce_csrf_checks=True)
+        payload = {'memos': [{'title': '스크립트 메모', 'content': '내용'}]}
+        response = self.post('api_bulk_create', payload, client=anonymous)
+        self.assertEqual(response.status_code, 401)
+        self.assertIn('WWW-Authenticate', response)
+        
+        def basic(password):
+            token = base64.b64encode(f'testuser:{password}'.encode()).decode()
+            return {'HTTP_AUTHORIZATION': f'Basic {token}'}
+        
+        response = self.post('api_bulk_create', payload, client=anonymous, **basic('wrong'))
+        self.assertEqual(response.status_code, 401)
+        response = self.post('api_bulk_create', payload, client=anonymous, **basic('testpass123'))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(Memo.objects.get(title='스크립트 메모').author, self.user)
+        
+        session = Client(enforce_csrf_checks=True)
+        session.login(username='testuser', password='testpass123')
+        response = self.post('api_bulk_create', payload, client=session)
+        self.assertEqual(response.status_code, 403)
+
+
+class MemoExportTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        for i in range(5):
+            Memo.objects.create(title=f'내보낼 메모 {i}', content=f'내용 {i}\n"따옴표", 쉼표', author=self.user)
+        Memo.objects.create(title='남의 메모', content='내용', author=self.other_user)
+        self.client.login(username='testuser', password='testpass123')
+    
+    def download(self, export_format):
+        response = self.client.get(reverse('memos:export'), {'format': export_format})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn('attachment', response['Content-Disposition'])
+        return b''.join(response.streaming_content).decode('utf-8')
+    
+    def test_ndjson_export(self):
+        """NDJSON 으로 자신의 메모만 내보내는지 테스트"""
+        import json
+        
+        records = [json.loads(line) for line in self.download('ndjson').splitlines()]
+        self.assertEqual(len(records), 5)
+        self.assertEqual(records[0]['title'], '내보낼 메모 0')
+        self.assertEqual(records[0]['content'], '내용 0\n"따옴표", 쉼표')
+        self.assertEqual(records[0]['author'], 'testuser')
+        self.assertEqual(records[0]['priority'], 'normal')
+        self.assertFalse(records[0]['is_pinned'])
+        self.assertIn('T', records[0]['created_at'])
+    
+    @override_settings(ROOT_URLCONF='memojjang.urls_asgi')
+    async def test_async_export(self):
+        """ASGI 에서는 비동기 이터레이터로 스트리밍하고 내용은 동기 버전과 같은지 테스트"""
+        from asgiref.sync import sync_to_async
+        from .export import export_memos
+        
+        expected = {
+            export_format: await sync_to_async(''.join)(export_memos(export_format, user=self.user))
+            for export_format in ('ndjson', 'csv')
+        }
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        for export_format, content in expected.items():
+            with self.subTest(format=export_format):
+                response = await self.async_client.get(reverse('memos:export'), {'format': export_format})
+                self.assertEqual(response.status_code, 200)
+                self.assertTrue(response.is_async)
+                chunks = [chunk async for chunk in response.streaming_content]
+                self.assertEqual(b''.join(chunks).decode('utf-8'), content)
+        response = await self.async_client.get(reverse('memos:export'), {'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_csv_export(self):
+        """CSV 로 내보내고 다시 읽을 수 있는지 테스트"""
+        import csv
+        
+        rows = list(csv.DictReader(StringIO(self.download('csv').lstrip('\ufeff'))))
+        self.assertEqual(len(rows), 5)
+        self.assertEqual(rows[4]['title'], '내보낼 메모 4')
+        self.assertEqual(rows[4]['content'], '내용 4\n"따옴표", 쉼표')
+    
+    def test_invalid_format(self):
+        """지원하지 않는 형식은 400 을 반환하는지 테스트"""
+        response = self.client.get(reverse('memos:export'), {'format': 'xml'})
+        self.assertEqual(response.status_code, 400)
+    
+    def test_export_command(self):
+        """export_memos 명령으로 표준 출력과 파일에 내보내는지 테스트"""
+        import csv
+        import json
+        import os
+        import tempfile
+        
+        out = StringIO()
+        call_command('export_memos', '--user', 'otheruser', stdout=out)
+        records = [json.loads(line) for line in out.getvalue().splitlines()]
+        self.assertEqual([record['title'] for record in records], ['남의 메모'])
+        
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'memos.csv')
+            call_command('export_memos', '--format', 'csv', '--output', path, '--chunk-size', '2', stdout=StringIO())
+            with open(path, encoding='utf-8-sig', newline='') as f:
+                rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 6)
+
+
+class MemoImportTest(TestCase):
+    def setUp(self):
+        import tempfile
+        
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+    
+    def write(self, name, text):
+        import os
+        
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        return path
+    
+    def import_memos(self, *args):
+        out = StringIO()
+        call_command('import_memos', *args, stdout=out, stderr=StringIO())
+        return out.getvalue()
+    
+    def test_import_fixture(self):
+        """fixture 형식 파일을 작성자와 작성일을 유지하며 가져오는지 테스트"""
+        from unittest import mock
+        
+        # 작은 읽기 단위로 레코드가 버퍼 경계에 걸쳐도 파싱되는지 확인
+        with mock.patch('apps.memos.importer.READ_SIZE', 16):
+            self.import_memos('fixtures/sample_data.json', '--create-users', '--batch-size', '4')
+        
+        memos = Memo.objects.filter(author__username='demo_user')
+        self.assertEqual(memos.count(), 6)
+        memo = memos.get(title='메모짱 사용법')
+        self.assertEqual(memo.created_at.isoformat(), '2024-01-01T09:00:00+00:00')
+        self.assertEqual(memo.priority, 'high')
+        self.assertTrue(memo.is_pinned)
+        self.assertGreater(memo.word_count, 0)
+        self.assertEqual(search_memos(memos, '환영합니다').count(), 1)
+        self.assertFalse(User.objects.get(username='demo_user').has_usable_password())
+    
+    def test_import_ndjson_export(self):
+        """export_memos 로 내보낸 NDJSON 을 다른 사용자에게 가져오는지 테스트"""
+        from .models import MemoDailyActivity
+        
+        other = User.objects.create_user(username='otheruser', password='testpass123')
+        for i in range(3):
+            Memo.objects.create(title=f'옮길 메모 {i}', content='옮길 내용', author=self.user)
+        out = StringIO()
+        call_command('export_memos', stdout=out)
+        path = self.write('memos.ndjson', out.getvalue() + '\n{"title": "", "content": "제목 없음"}\n')
+        
+        output = self.import_memos(path, '--user', 'otheruser')
+        self.assertIn('3개의 메모를 가져왔습니다 (1개 건너뜀)', output)
+        self.assertEqual(
+            sorted(Memo.objects.filter(author=other).values_list('title', flat=True)),
+            ['옮길 메모 0', '옮길 메모 1', '옮길 메모 2'],
+        )
+        self.assertEqual(MemoDailyActivity.objects.get(user=other).created_count, 3)
+    
+    def test_resume(self):
+        """진행 상황 파일에 기록된 위치부터 이어서 가져오는지 테스트"""
+        import json
+        import os
+        
+        lines = [
+            json.dumps({'author': 'testuser', 'title': f'메모 {i}', 'content': '내용'})
+            for i in range(5)
+        ]
+        path = self.write('memos.ndjson', '\n'.join(lines))
+        state_file = path + '.import-state.json'
+        with open(state_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'source': {'path': os.path.abspath(path), 'size': os.path.getsize(path)},
+                'processed': 3, 'imported': 3, 'skipped': 0,
+            }, f)
+        
+        self.import_memos(path, '--resume', '--batch-size', '1')
+        self.assertEqual(
+            sorted(Memo.objects.values_list('title', flat=True)), ['메모 3', '메모 4']
+        )
+        self.assertFalse(os.path.exists(state_file))
+    
+    def test_invalid_author_skipped(self):
+        """작성자가 사용자명/id 가 아닌 레코드는 가져오기를 멈추지 않고 건너뛰는지 테스트"""
+        import json
+        
+        records = [
+            {'author': {'username': 'testuser'}, 'title': '객체 작성자'},
+            {'author': [['testuser']], 'title': '중첩 목록 작성자'},
+            {'author': True, 'title': '불리언 작성자'},
+            {'author': 'testuser', 'title': '정상 메모', 'content': '내용',
+             'created_at': '2024-01-01T09:00:00+00:00', 'updated_at': '2024-02-01T09:00:00+00:00'},
+        ]
+        path = self.write('memos.ndjson', '\n'.join(json.dumps(record) for record in records))
+        
+        output = self.import_memos(path, '--batch-size', '2')
+        self.assertIn('1개의 메모를 가져왔습니다 (3개 건너뜀)', output)
+        memo = Memo.objects.get()
+        self.assertEqual(memo.title, '정상 메모')
+        self.assertEqual(memo.created_at.isoformat(), '2024-01-01T09:00:00+00:00')
+        self.assertEqual(memo.updated_at.isoformat(), '2024-02-01T09:00:00+00:00')
+        # 가져오기가 모델 필드 설정을 바꾸지 않음
+        self.assertTrue(Memo._meta.get_field('updated_at').auto_now)
+        self.assertTrue(Memo._meta.get_field('created_at').auto_now_add)
+    
+    def test_invalid_file(self):
+        """형식이 잘못된 파일은 오류로 처리하는지 테스트"""
+        from django.core.management.base import CommandError
+        
+        path = self.write('broken.json', '[{"title": "깨진 파일"')
+        with self.assertRaises(CommandError):
+            self.import_memos(path)
+        path = self.write('broken.ndjson', '{"title": "a"}\n{잘못된 줄}\n')
+        with self.assertRaises(CommandError):
+            self.import_memos(path)
+
+
+@override_settings(
+    ROOT_URLCONF='memojjang.urls_asgi',
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class MemoAsyncViewTest(TestCase):
+    def setUp(self):
+        from django.core.cache import cache
+        
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        self.other_user = User.objects.create_user(
+            username='otheruser',
+            password='testpass123'
+        )
+        self.memos = [
+            Memo.objects.create(title=f'비동기 메모 {i}', content=f'비동기 내용 {i}', author=self.user)
+            for i in range(12)
+        ]
+        self.other_memo = Memo.objects.create(title='남의 메모', content='내용', author=self.other_user)
+    
+    def test_async_views_routed(self):
+        """ASGI URL 설정에서 조회 뷰가 비동기 뷰로 연결되는지 테스트"""
+        from asgiref.sync import iscoroutinefunction
+        from django.urls import resolve
+        
+        for url in [reverse('memos:list'), reverse('memos:detail', kwargs={'pk': 1}), reverse('memos:search_ajax')]:
+            self.assertTrue(iscoroutinefunction(resolve(url).func), url)
+        self.assertFalse(iscoroutinefunction(resolve(reverse('memos:create')).func))
+    
+    async def test_login_required(self):
+        """로그인하지 않으면 로그인 페이지로 리다이렉트되는지 테스트"""
+        response = await self.async_client.get(reverse('memos:list'))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn('/users/login/', response.url)
+    
+    async def test_list_and_pagination(self):
+        """비동기 목록이 동기 목록과 같은 페이지를 보여주는지 테스트"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        response = await self.async_client.get(reverse('memos:list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '비동기 메모 11')
+        self.assertNotContains(response, '비동기 메모 1<')
+        self.assertNotContains(response, '남의 메모')
+        self.assertContains(response, f'data-memo-id="{self.memos[11].pk}"')
+        self.assertContains(response, 'data-live-insert')
+        
+        next_cursor = response.context['page_obj'].next_cursor
+        response = await self.async_client.get(reverse('memos:list'), {'cursor': next_cursor})
+        self.assertEqual(len(response.context['memos']), 2)
+        self.assertContains(response, '비동기 메모 0')
+        
+        with self.settings(MEMO_LIST_PAGINATION='offset'):
+            response = await self.async_client.get(reverse('memos:list'), {'page': 2})
+            self.assertEqual(response.context['paginator'].count, 12)
+            self.assertEqual(len(response.context['memos']), 2)
+            response = await self.async_client.get(reverse('memos:list'), {'page': 9})
+            self.assertEqual(response.status_code, 404)
+    
+    async def test_detail(self):
+        """비동기 상세 뷰가 자신의 메모만 보여주는지 테스트"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        response = await self.async_client.get(reverse('memos:detail', kwargs={'pk': self.memos[0].pk}))
+        self.assertEqual(response.status_code, 200)
+        self.assertContains(response, '비동기 내용 0')
+        self.assertContains(response, 'testuser')
+        
+        response = await self.async_client.get(reverse('memos:detail', kwargs={'pk': self.other_memo.pk}))
+        self.assertEqual(response.status_code, 404)
+    
+    async def test_search_ajax_and_conditional_get(self):
+        """비동기 검색 API 결과와 ETag 기반 304 응답 테스트"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        url = reverse('memos:search_ajax')
+        response = await self.async_client.get(url, {'q': '비동기 메모'})
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data['count'], 10)
+        self.assertEqual(data['query'], '비동기 메모')
+        
+        response = await self.async_client.get(
+            url, {'q': '비동기 메모'}, headers={'If-None-Match': response['ETag']}
+        )
+        self.assertEqual(response.status_code, 304)
+
+
+@override_settings(
+    ROOT_URLCONF='memojjang.urls_asgi',
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+)
+class MemoEventStreamTest(TransactionTestCase):
+    # 이벤트는 커밋 후에 전달되므로 실제로 커밋되는 TransactionTestCase 사용
+    
+    def setUp(self):
+        from django.core.cache import cache
+        
+        cache.clear()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+    
+    async def open_stream(self, **headers):
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        response = await self.async_client.get(reverse('memos:events'), headers=headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'text/event-stream')
+        stream = aiter(response.streaming_content)
+        self.assertTrue((await self.next_chunk(stream)).startswith('retry:'))
+        return stream
+    
+    async def next_chunk(self, stream):
+        import asyncio
+        
+        chunk = await asyncio.wait_for(anext(stream), timeout=5)
+        return chunk.decode() if isinstance(chunk, bytes) else chunk
+    
+    def parse(self, chunk):
+        import json
+        
+        fields = dict(line.split(': ', 1) for line in chunk.strip().splitlines())
+        return fields['event'], json.loads(fields['data'])
+    
+    async def test_memo_events(self):
+        """메모 작성/수정/삭제가 카드 HTML 과 함께 스트림으로 전달되는지 테스트"""
+        from asgiref.sync import sync_to_async
+        
+        stream = await self.open_stream()
+        memo = await sync_to_async(Memo.objects.create)(title='실시간 메모', content='실시간 내용', author=self.user)
+        event, data = self.parse(await self.next_chunk(stream))
+        self.assertEqual(event, 'created')
+        self.assertEqual(data['id'], memo.pk)
+        self.assertIn(f'data-memo-id="{memo.pk}"', data['html'])
+        self.assertIn('실시간 메모', data['html'])
+        
+        memo.title = '수정된 실시간 메모'
+        memo.is_pinned = True
+        await sync_to_async(memo.save)()
+        event, data = self.parse(await self.next_chunk(stream))
+        self.assertEqual(event, 'updated')
+        self.assertTrue(data['is_pinned'])
+        self.assertIn('수정된 실시간 메모', data['html'])
+        
+        pk = memo.pk
+        await sync_to_async(memo.delete)()
+        event, data = self.parse(await self.next_chunk(stream))
+        self.assertEqual((event, data), ('deleted', {'type': 'deleted', 'id': pk}))
+    
+    @override_settings(MEMO_EVENTS_HEARTBEAT=1)
+    async def test_resync_after_bulk_change(self):
+        """개별 이벤트가 없는 일괄 변경은 resync 로 알리는지 테스트"""
+        from asgiref.sync import sync_to_async
+        
+        stream = await self.open_stream()
+        self.assertEqual(await self.next_chunk(stream), ': ping\n\n')
+        await sync_to_async(Memo.objects.filter(author=self.user).update)(is_pinned=True)
+        await sync_to_async(Memo.objects.bulk_create)([
+            Memo(title='일괄 메모', content='내용', author=self.user)
+        ])
+        event, _ = self.parse(await self.next_chunk(stream))
+        self.assertEqual(event, 'resync')
+    
+    @override_settings(MEMO_EVENTS_HEARTBEAT=1)
+    async def test_resync_after_other_worker_change(self):
+        """다른 워커의 변경(이 프로세스의 이벤트와 캐시 버전 없음)도 resync 로 알리는지 테스트"""
+        from asgiref.sync import sync_to_async
+        from django.db import connection
+        from django.utils import timezone
+        
+        memo = await sync_to_async(Memo.objects.create)(title='메모', content='내용', author=self.user)
+        stream = await self.open_stream()
+        self.assertEqual(await self.next_chunk(stream), ': ping\n\n')
+        
+        def update_on_other_worker():
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    'UPDATE memos_memo SET title = %s, updated_at = %s WHERE id = %s',
+                    ['다른 워커에서 수정', timezone.now() + timezone.timedelta(seconds=1), memo.pk],
+                )
+        
+        await sync_to_async(update_on_other_worker)()
+        event, _ = self.parse(await self.next_chunk(stream))
+        self.assertEqual(event, 'resync')
+    
+    async def test_resync_on_reconnect(self):
+        """재연결 시 놓친 변경이 있으면 resync 를 보내는지 테스트"""
+        stream = await self.open_stream(**{'Last-Event-ID': '1'})
+        event, _ = self.parse(await self.next_chunk(stream))
+        self.assertEqual(event, 'resync')
+    
+    def test_empty_list_subscribes(self):
+        """메모가 없어도 목록 컨테이너를 렌더링해 첫 메모를 실시간으로 받을 수 있는지 테스트"""
+        self.client.login(username='testuser', password='testpass123')
+        response = self.client.get(reverse('memos:list'))
+        self.assertContains(response, '아직 작성한 메모가 없습니다')
+        self.assertContains(response, 'id="memo-list-empty"')
+        self.assertContains(
+            response, f'id="memo-list" data-events-url="{reverse("memos:events")}" data-live-insert'
+        )
+        
+        response = self.client.get(reverse('memos:list'), {'search': '없는 메모'})
+        self.assertContains(response, f'id="memo-list" data-events-url="{reverse("memos:events")}">')
+    
+    def test_wsgi_returns_no_content(self):
+        """WSGI URL 설정에서는 204 를 반환해 EventSource 가 재연결하지 않는지 테스트"""
+        self.client.login(username='testuser', password='testpass123')
+        with self.settings(ROOT_URLCONF='memojjang.urls'):
+            response = self.client.get(reverse('memos:events'))
+        self.assertEqual(response.status_code, 204)
+
+
+class MemoQueryBudgetTest(TestCase):
+    """뷰별 쿼리 예산 테스트 (테스트 중에는 예산을 넘으면 QueryBudgetExceeded 발생)"""
+    
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            password='testpass123'
+        )
+        # 반복문 안의 N+1 쿼리가 예산을 넘도록 한 페이지 이상 생성
+        self.memos = [
+            Memo.objects.create(
+                title=f'예산 메모 {i}', content=f'예산 내용 {i}', author=self.user, is_pinned=i % 5 == 0
+            )
+            for i in range(25)
+        ]
+        self.client.login(username='testuser', password='testpass123')
+    
+    def test_read_views_within_budget(self):
+        """조회 화면과 AJAX 뷰가 예산 안에서 실행되는지 테스트"""
+        memo = self.memos[0]
+        requests = [
+            (reverse('memos:list'), {}),
+            (reverse('memos:list'), {'search': '예산'}),
+            (reverse('memos:list'), {'page': 2}),
+            (reverse('memos:detail', kwargs={'pk': memo.pk}), {}),
+            (reverse('memos:create'), {}),
+            (reverse('memos:create_simple'), {}),
+            (reverse('memos:edit', kwargs={'pk': memo.pk}), {}),
+            (reverse('memos:delete', kwargs={'pk': memo.pk}), {}),
+            (reverse('memos:search_ajax'), {'q': '예산'}),
+            (reverse('memos:autocomplete'), {'q': '예산'}),
+            (reverse('memos:export'), {'format': 'csv'}),
+            (reverse('memos:events'), {}),
+            (reverse('memos:stats'), {}),
+            (reverse('memos:activity_range'), {}),
+        ]
+        for url, params in requests:
+            with self.subTest(url=url, params=params):
+                response = self.client.get(url, params)
+                self.assertIn(response.status_code, (200, 204))
+    
+    def test_offset_pagination_within_budget(self):
+        """번호 페이지네이션(전체 개수 조회 포함)도 예산 안인지 테스트"""
+        from unittest import mock
+        from .views import MemoListView
+        
+        with mock.patch.object(MemoListView, 'pagination_mode', 'offset'):
+            response = self.client.get(reverse('memos:list'), {'page': 2})
+        self.assertEqual(response.status_code, 200)
+    
+    def test_write_views_within_budget(self):
+        """작성/수정/삭제가 그날 첫 활동 집계 행 생성까지 포함해 예산 안인지 테스트"""
+        from .models import MemoDailyActivity
+        
+        MemoDailyActivity.objects.all().delete()
+        data = {'title': '새 메모', 'content': '새 내용', 'priority': 'normal'}
+        self.assertEqual(self.client.post(reverse('memos:create'), data).status_code, 302)
+        self.assertEqual(self.client.post(reverse('memos:create_simple'), data).status_code, 302)
+        self.assertEqual(self.client.post(reverse('memos:create'), {**data, 'title': ''}).status_code, 200)
+        
+        MemoDailyActivity.objects.all().delete()
+        response = self.client.post(
+            reverse('memos:edit', kwargs={'pk': self.memos[0].pk}),
+            {**data, 'title': '수정한 메모'}
+        )
+        self.assertEqual(response.status_code, 302)
+        
+        MemoDailyActivity.objects.all().delete()
+        response = self.client.post(reverse('memos:delete', kwargs={'pk': self.memos[1].pk}))
+        self.assertEqual(response.status_code, 302)
+    
+    def test_exceeding_budget_raises(self):
+        """예산을 넘으면 테스트 중에는 예외가 발생하는지 테스트"""
+        from unittest import mock
+        from memojjang.query_budget import QueryBudgetExceeded
+        from .views import MemoListView
+        
+        with mock.patch.object(MemoListView, 'query_budget', 1):
+            with self.assertRaisesMessage(QueryBudgetExceeded, 'memos:list'):
+                self.client.get(reverse('memos:list'))
+    
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_exceeding_budget_logs_when_not_strict(self):
+        """QUERY_BUDGET_STRICT 가 꺼져 있으면 경고 로그만 남기는지 테스트"""
+        from unittest import mock
+        from .views import MemoListView
+        
+        with mock.patch.object(MemoListView, 'query_budget', 1):
+            with self.assertLogs('memojjang.query_budget', 'WARNING') as logs:
+                response = self.client.get(reverse('memos:list'))
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('예산 1개', logs.output[0])
@@ -1,5 +1,5 @@
 from django.urls import path
-from . import views
+from . import api, views
 
 app_name = 'memos'
 
@@ -13,5 +13,14 @@ urlpatterns = [
     
     # AJAX 및 고급 기능
     path('search/ajax/', views.memo_search_ajax, name='search_ajax'),
+    path('autocomplete/', views.memo_autocomplete, name='autocomplete'),
+    path('export/', views.memo_export, name='export'),
+    path('events/', views.memo_events, name='events'),
     path('stats/', views.memo_stats, name='stats'),
+    path('stats/activity/', views.memo_activity_range, name='activity_range'),
+    
+    # JSON API (일괄 처리)
+    path('api/bulk/create/', api.memo_bulk_create, name='api_bulk_create'),
+    path('api/bulk/update/', api.memo_bulk_update, name='api_bulk_update'),
+    path('api/bulk/delete/', api.memo_bulk_delete, name='api_bulk_delete'),
 ]
@@ -0,0 +1,20 @@
+"""
+ASGI 배포용 메모 URL
+
+조회 뷰(목록, 상세, AJAX 검색), 내보내기와 SSE 이벤트 스트림을 async_views 의 비동기 버전으로 바꾸고
+나머지 URL 은 urls.py 와 같습니다.
+"""
+from django.urls import path
+
+from . import async_views
+from .urls import app_name, urlpatterns as sync_urlpatterns
+
+ASYNC_VIEWS = {
+    'list': path('', async_views.memo_list, name='list'),
+    'detail': path('<int:pk>/', async_views.memo_detail, name='detail'),
+    'search_ajax': path('search/ajax/', async_views.memo_search_ajax, name='search_ajax'),
+    'events': path('events/', async_views.memo_events, name='events'),
+    'export': path('export/', async_views.memo_export, name='export'),
+}
+
+urlpatterns = [ASYNC_VIEWS.get(pattern.name, pattern) for pattern in sync_urlpatterns]
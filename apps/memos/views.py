@@ -1,68 +1,125 @@
+import logging
+
 from django.shortcuts import render, get_object_or_404, redirect
 from django.contrib.auth.decorators import login_required
+from django.conf import settings
 from django.contrib.auth.mixins import LoginRequiredMixin
 from django.contrib import messages
 from django.urls import reverse_lazy
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
 from django.core.paginator import Paginator
-from django.db.models import Q
+from django.db.models import Q, Sum
+from django.db.models.functions import TruncMonth
 from django.utils import timezone
-from django.http import JsonResponse
-from django.views.decorators.http import require_GET
-from .models import Memo
+from django.utils.dateparse import parse_date
+from django.http import Http404, HttpResponse, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition, require_GET
+from memojjang.db_router import replica_reads
+from memojjang.query_budget import query_budget
+from .autocomplete import suggest_titles
+from .cache import get_or_set_for_user
+from .export import EXPORT_FORMATS, export_memos
+from .conditional import detail_etag, detail_last_modified, memos_etag, memos_last_modified
+from .models import Memo, MemoDailyActivity
 from .forms import MemoForm
+from .pagination import InvalidCursor, KeysetPage, KeysetPaginator
+from .search import search_memos
+
+
+logger = logging.getLogger(__name__)
+
+# 브라우저가 항상 재검증(조건부 GET)하도록 no-cache 지정
+revalidate = cache_control(private=True, no_cache=True)
 
 
+def _list_queryset(user, search_query):
+    # 카드에는 미리보기/글자 수만 표시하므로 본문 전체는 읽지 않음
+    queryset = Memo.objects.filter(author=user).defer('content')
+    if search_query:
+        queryset = search_memos(queryset, search_query, author=user)
+    return queryset
+
+
+@method_decorator([revalidate, condition(etag_func=memos_etag, last_modified_func=memos_last_modified)], name='get')
 class MemoListView(LoginRequiredMixin, ListView):
     model = Memo
     template_name = 'memos/memo_list.html'
     context_object_name = 'memos'
     paginate_by = 10
+    # 세션, 사용자, Last-Modified, (번호 페이지네이션이면 전체 개수), 목록
+    query_budget = 5
+    replica_reads = True
+    # 'cursor': 키셋 페이지네이션 (COUNT 없음), 'offset': 페이지 번호 방식
+    pagination_mode = settings.MEMO_LIST_PAGINATION
+    keyset_ordering = ['-is_pinned', '-created_at', 'id']
     
     def get_queryset(self):
-        queryset = Memo.objects.filter(author=self.request.user)
-        search_query = self.request.GET.get('search')
-        if search_query:
-            queryset = queryset.filter(
-                Q(title__icontains=search_query) | Q(content__icontains=search_query)
+        return _list_queryset(self.request.user, self.request.GET.get('search'))
+    
+    def paginate_queryset(self, queryset, page_size):
+        if self.pagination_mode != 'cursor':
+            return super().paginate_queryset(queryset, page_size)
+        paginator = KeysetPaginator(queryset, page_size, self.keyset_ordering)
+        cursor = self.request.GET.get('cursor')
+        
+        def load_page():
+            page = paginator.page(cursor)
+            return page.object_list, page.has_next(), page.has_previous()
+        
+        try:
+            object_list, has_next, has_previous = get_or_set_for_user(
+                self.request.user.pk, 'list',
+                (self.request.GET.get('search', ''), cursor or '', page_size),
+                load_page,
             )
-        return queryset
+        except InvalidCursor:
+            raise Http404('잘못된 페이지 커서입니다.')
+        page = KeysetPage(object_list, paginator, has_next, has_previous)
+        return (paginator, page, page.object_list, page.has_other_pages())
     
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
         context['search_query'] = self.request.GET.get('search', '')
+        context['cursor_pagination'] = self.pagination_mode == 'cursor'
         return context
 
 
+@method_decorator([revalidate, condition(etag_func=detail_etag, last_modified_func=detail_last_modified)], name='get')
 class MemoDetailView(LoginRequiredMixin, DetailView):
     model = Memo
     template_name = 'memos/memo_detail.html'
     context_object_name = 'memo'
+    query_budget = 4
+    replica_reads = True
     
     def get_queryset(self):
         return Memo.objects.filter(author=self.request.user)
+    
+    def get_object(self, queryset=None):
+        memo = super().get_object(queryset)
+        # 템플릿에서 작성자를 다시 조회하지 않도록 이미 읽은 사용자를 연결
+        memo.author = self.request.user
+        return memo
 
 
+@query_budget(15)
 @login_required
 def memo_create_simple(request):
     """간단한 메모 생성 뷰 (디버깅용)"""
     if request.method == 'POST':
-        print(f"DEBUG: POST 데이터 수신")
-        print(f"DEBUG: 사용자: {request.user}")
-        print(f"DEBUG: POST 내용: {dict(request.POST)}")
-        
         form = MemoForm(request.POST)
-        print(f"DEBUG: 폼 유효성: {form.is_valid()}")
         
         if form.is_valid():
             memo = form.save(commit=False)
             memo.author = request.user
             memo.save()
-            print(f"DEBUG: 메모 저장 성공 - ID: {memo.id}")
+            logger.debug('메모 저장 성공 - ID: %s, 사용자: %s', memo.pk, request.user.pk)
             messages.success(request, f'메모 "{memo.title}"가 성공적으로 저장되었습니다!')
             return redirect('memos:list')
         else:
-            print(f"DEBUG: 폼 오류: {form.errors}")
+            logger.debug('메모 저장 실패 - 사용자: %s, 오류: %s', request.user.pk, form.errors.as_json())
             messages.error(request, '폼에 오류가 있습니다.')
     else:
         form = MemoForm()
@@ -75,28 +132,27 @@ class MemoCreateView(LoginRequiredMixin, CreateView):
     form_class = MemoForm
     template_name = 'memos/memo_form.html'
     success_url = reverse_lazy('memos:list')
+    # 저장, n-gram 색인, 그날 첫 활동 집계 행 생성까지 포함
+    query_budget = 15
     
     def form_valid(self, form):
         form.instance.author = self.request.user
         messages.success(self.request, '메모가 성공적으로 작성되었습니다.')
-        print(f"DEBUG: 메모 생성 성공 - 제목: {form.instance.title}")
-        return super().form_valid(form)
+        response = super().form_valid(form)
+        logger.debug('메모 생성 성공 - ID: %s, 사용자: %s', self.object.pk, self.request.user.pk)
+        return response
     
     def form_invalid(self, form):
         messages.error(self.request, '메모 저장 중 오류가 발생했습니다. 입력 내용을 확인해 주세요.')
-        print(f"DEBUG: 메모 생성 실패 - 오류: {form.errors}")
+        logger.debug('메모 생성 실패 - 사용자: %s, 오류: %s', self.request.user.pk, form.errors.as_json())
         return super().form_invalid(form)
-    
-    def post(self, request, *args, **kwargs):
-        print(f"DEBUG: 메모 생성 POST 요청 - 사용자: {request.user}")
-        print(f"DEBUG: POST 데이터: {request.POST}")
-        return super().post(request, *args, **kwargs)
 
 
 class MemoUpdateView(LoginRequiredMixin, UpdateView):
     model = Memo
     form_class = MemoForm
     template_name = 'memos/memo_form.html'
+    query_budget = 17
     
     def get_queryset(self):
         return Memo.objects.filter(author=self.request.user)
@@ -111,6 +167,7 @@ class MemoDeleteView(LoginRequiredMixin, DeleteView):
     template_name = 'memos/memo_confirm_delete.html'
     success_url = reverse_lazy('memos:list')
     context_object_name = 'memo'
+    query_budget = 13
     
     def get_queryset(self):
         return Memo.objects.filter(author=self.request.user)
@@ -129,8 +186,12 @@ memo_delete = MemoDeleteView.as_view()
 
 
 # AJAX 검색 뷰
+@query_budget(4)
+@replica_reads
 @login_required
 @require_GET
+@revalidate
+@condition(etag_func=memos_etag, last_modified_func=memos_last_modified)
 def memo_search_ajax(request):
     """AJAX 메모 검색 API"""
     query = request.GET.get('q', '').strip()
@@ -138,24 +199,52 @@ def memo_search_ajax(request):
     if not query:
         return JsonResponse({'results': [], 'count': 0})
     
-    # 사용자의 메모만 검색
-    memos = Memo.objects.filter(
-        author=request.user
-    ).filter(
-        Q(title__icontains=query) | Q(content__icontains=query)
-    ).order_by('-updated_at')[:10]  # 최대 10개 결과
-    
-    results = []
-    for memo in memos:
-        results.append({
-            'id': memo.pk,
-            'title': memo.title,
-            'content': memo.content[:100] + '...' if len(memo.content) > 100 else memo.content,
-            'created_at': memo.created_at.strftime('%Y-%m-%d %H:%M'),
-            'updated_at': memo.updated_at.strftime('%Y-%m-%d %H:%M'),
-            'url': memo.get_absolute_url(),
-        })
+    payload = get_or_set_for_user(
+        request.user.pk, 'search', (query,), lambda: _search_payload(request.user, query)
+    )
+    return JsonResponse(payload)
+
+
+def _search_queryset(user, query):
+    """사용자의 메모 중 검색 결과 (최신 수정순 최대 10개)"""
+    return search_memos(
+        Memo.objects.filter(author=user).defer('content'), query, author=user
+    ).order_by('-updated_at')[:10]
+
+
+def _search_result(memo):
+    return {
+        'id': memo.pk,
+        'title': memo.title,
+        'content': memo.preview[:100] + '...' if memo.char_count > 100 else memo.preview,
+        'created_at': memo.created_at.strftime('%Y-%m-%d %H:%M'),
+        'updated_at': memo.updated_at.strftime('%Y-%m-%d %H:%M'),
+        'url': memo.get_absolute_url(),
+    }
+
+
+def _search_payload(user, query):
+    """AJAX 검색 결과 데이터 생성"""
+    results = [_search_result(memo) for memo in _search_queryset(user, query)]
+    return {
+        'results': results,
+        'count': len(results),
+        'query': query
+    }
+
+
+# 제목 자동완성 API
+@query_budget(3)
+@login_required
+@require_GET
+def memo_autocomplete(request):
+    """메모 제목 자동완성 API (메모리 색인 사용)"""
+    query = request.GET.get('q', '').strip()
     
+    if not query:
+        return JsonResponse({'results': [], 'count': 0})
+    
+    results = suggest_titles(request.user.pk, query)
     return JsonResponse({
         'results': results,
         'count': len(results),
@@ -163,42 +252,153 @@ def memo_search_ajax(request):
     })
 
 
+# 메모 변경 이벤트 (SSE)
+@query_budget(2)
+@login_required
+@require_GET
+def memo_events(request):
+    """WSGI 에서는 연결마다 워커를 점유하므로 SSE 를 제공하지 않음
+
+    204 응답을 받은 EventSource 는 재연결하지 않습니다. ASGI 에서는
+    async_views.memo_events 가 연결됩니다.
+    """
+    return HttpResponse(status=204)
+
+
+# 메모 내보내기
+def _export_response(request, export):
+    """format 매개변수를 확인하고 export(형식, user=...) 가 만든 조각을 내려받는 응답
+
+    async_views.memo_export 는 export 로 aexport_memos 를 넘깁니다.
+    """
+    export_format = request.GET.get('format', 'ndjson')
+    if export_format not in EXPORT_FORMATS:
+        return JsonResponse({'error': f'지원하지 않는 형식입니다: {export_format}'}, status=400)
+    
+    response = StreamingHttpResponse(
+        export(export_format, user=request.user),
+        content_type=EXPORT_FORMATS[export_format],
+    )
+    filename = f'memos-{timezone.localdate():%Y%m%d}.{export_format}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+    return response
+
+
+# 본문은 응답을 보내며 조회하므로 예산에 포함되지 않음
+@query_budget(2)
+@login_required
+@require_GET
+def memo_export(request):
+    """사용자 메모 전체를 NDJSON 또는 CSV 로 스트리밍 다운로드"""
+    return _export_response(request, export_memos)
+
+
 # 메모 통계 뷰
+@query_budget(3)
+@replica_reads
 @login_required
 def memo_stats(request):
-    """사용자 메모 통계"""
-    user_memos = Memo.objects.filter(author=request.user)
+    """사용자 메모 통계 (일일 활동 집계 테이블 기반)"""
+    today = timezone.localdate()
+    week_start = today - timezone.timedelta(days=6)
     
-    # 기본 통계
-    total_count = user_memos.count()
-    total_words = sum(len(memo.content.split()) for memo in user_memos)
+    # 월별로 묶은 한 번의 집계 쿼리에서 모든 통계를 계산
+    rows = (
+        MemoDailyActivity.objects.filter(user=request.user)
+        .annotate(month=TruncMonth('date'))
+        .values('month')
+        .annotate(
+            created=Sum('created_count'),
+            deleted=Sum('deleted_count'),
+            words=Sum('words_added'),
+            recent=Sum('created_count', filter=Q(date__gte=week_start), default=0),
+        )
+        .order_by('month')
+    )
     
-    # 최근 활동
-    recent_memos = user_memos.filter(
-        created_at__gte=timezone.now() - timezone.timedelta(days=7)
-    ).count()
+    total_count = 0
+    total_words = 0
+    recent_memos = 0
+    month_counts = {}
+    for row in rows:
+        total_count += row['created'] - row['deleted']
+        total_words += row['words']
+        recent_memos += row['recent']
+        month_counts[(row['month'].year, row['month'].month)] = row['created']
     
-    # 월별 통계 (최근 6개월)
+    # 월별 작성 통계 (이번 달을 포함한 최근 6개월, 오래된 순)
     monthly_stats = []
-    for i in range(6):
-        date = timezone.now() - timezone.timedelta(days=30*i)
-        month_count = user_memos.filter(
-            created_at__year=date.year,
-            created_at__month=date.month
-        ).count()
+    year, month = today.year, today.month
+    for _ in range(6):
         monthly_stats.append({
-            'month': date.strftime('%Y-%m'),
-            'count': month_count
+            'month': f'{year:04d}-{month:02d}',
+            'count': month_counts.get((year, month), 0)
         })
+        year, month = (year, month - 1) if month > 1 else (year - 1, 12)
+    monthly_stats.reverse()
     
     import json
     context = {
         'total_count': total_count,
         'total_words': total_words,
         'recent_count': recent_memos,
-        'monthly_stats': monthly_stats[::-1],  # 오래된 순으로 정렬
-        'monthly_stats_json': json.dumps(monthly_stats[::-1]),
+        'monthly_stats': monthly_stats,
+        'monthly_stats_json': json.dumps(monthly_stats),
         'avg_words_per_memo': total_words // total_count if total_count > 0 else 0,
     }
     
     return render(request, 'memos/memo_stats.html', context)
+
+
+ACTIVITY_FIELDS = [
+    'created_count', 'updated_count', 'deleted_count', 'words_added',
+    'low_count', 'normal_count', 'high_count', 'urgent_count',
+]
+
+
+# 기간별 활동 통계 API
+def _date_param(request, name):
+    """YYYY-MM-DD 날짜 파라미터 (없으면 None, 형식이 잘못되었거나 없는 날짜면 ValueError)"""
+    value = request.GET.get(name)
+    if not value:
+        return None
+    date = parse_date(value)
+    if date is None:
+        raise ValueError(value)
+    return date
+
+
+@query_budget(3)
+@login_required
+@require_GET
+def memo_activity_range(request):
+    """기간별 일일 활동 JSON API (히트맵, 중요도별 추이용)
+
+    start/end (YYYY-MM-DD) 를 생략하면 오늘까지 최근 1년을 반환합니다.
+    """
+    today = timezone.localdate()
+    try:
+        end = _date_param(request, 'end') or today
+        start = _date_param(request, 'start') or end - timezone.timedelta(days=364)
+    except ValueError:
+        return JsonResponse({'error': '날짜 형식이 올바르지 않습니다. (YYYY-MM-DD)'}, status=400)
+    if start > end:
+        return JsonResponse({'error': '시작일이 종료일보다 늦습니다.'}, status=400)
+    if (end - start).days > 3660:
+        return JsonResponse({'error': '조회 기간은 최대 10년입니다.'}, status=400)
+    
+    days = list(
+        MemoDailyActivity.objects.filter(user=request.user, date__range=(start, end))
+        .order_by('date')
+        .values('date', *ACTIVITY_FIELDS)
+    )
+    totals = {field: sum(day[field] for day in days) for field in ACTIVITY_FIELDS}
+    for day in days:
+        day['date'] = day['date'].isoformat()
+    
+    return JsonResponse({
+        'start': start.isoformat(),
+        'end': end.isoformat(),
+        'days': days,
+        'totals': totals,
+    })
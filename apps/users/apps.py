@@ -1,6 +1,17 @@
 from django.apps import AppConfig
+from django.db.models.signals import post_delete, post_save
 
 
 class UsersConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'apps.users'
+
+    def ready(self):
+        from django.contrib.auth import get_user_model
+
+        from .middleware import invalidate_cached_user
+
+        # 비밀번호 변경, 비활성화를 포함한 모든 사용자 저장/삭제
+        User = get_user_model()
+        post_save.connect(invalidate_cached_user, sender=User)
+        post_delete.connect(invalidate_cached_user, sender=User)
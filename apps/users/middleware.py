@@ -0,0 +1,99 @@
+"""
+캐시를 사용하는 인증 미들웨어
+
+django.contrib.auth 의 AuthenticationMiddleware 는 request.user 를 처음 사용할 때마다
+auth_user 를 조회합니다. CachedAuthenticationMiddleware 는 세션 검증을 통과한 사용자를
+세션의 사용자 id 와 비밀번호 해시 지문(HASH_SESSION_KEY)을 포함한 키로 캐시해, 같은 세션의
+다음 요청부터 auth_user 를 조회하지 않습니다.
+
+- 비밀번호를 바꾸면 지문이 달라져 다른 세션은 캐시를 쓰지 못하고 기존처럼 로그아웃됩니다.
+- 사용자를 저장/삭제하면(비밀번호 변경, 비활성화 포함) 사용자 버전을 올려 캐시를 무효화합니다.
+- 캐시에 없으면 django.contrib.auth.get_user() 로 조회와 세션 검증을 그대로 수행합니다.
+
+워커마다 캐시가 다르면(locmem) 다른 워커의 비밀번호 변경/비활성화가 보이지 않으므로,
+워커끼리 캐시를 공유할 때(USER_CACHE_ENABLED)만 캐시하고 그 외에는 매 요청 조회합니다.
+queryset.update() 처럼 시그널 없이 사용자를 바꾸면 USER_CACHE_TIMEOUT 동안 이전 값이
+남을 수 있습니다.
+"""
+import hashlib
+from functools import partial
+
+from django.conf import settings
+from django.contrib import auth
+from django.contrib.auth import BACKEND_SESSION_KEY, HASH_SESSION_KEY, SESSION_KEY
+from django.contrib.auth.middleware import AuthenticationMiddleware
+from django.core.cache import cache
+from django.utils.functional import SimpleLazyObject
+
+from memojjang.cache_versions import aget_version, bump_versions, get_version
+
+
+def _version_key(user_id):
+    return f'users:auth:{user_id}:version'
+
+
+def _cache_key(user_id, version, backend_path, session_hash):
+    digest = hashlib.md5(f'{backend_path}:{session_hash}'.encode(), usedforsecurity=False).hexdigest()
+    return f'users:auth:{user_id}:v{version}:{digest}'
+
+
+def invalidate_cached_user(sender, instance, **kwargs):
+    """사용자 저장/삭제 시 캐시한 사용자 무효화"""
+    bump_versions([_version_key(instance.pk)])
+
+
+def _cacheable(user_id, backend_path, session_hash):
+    return (
+        settings.USER_CACHE_ENABLED and user_id is not None and session_hash
+        and backend_path in settings.AUTHENTICATION_BACKENDS
+    )
+
+
+def get_user(request):
+    if hasattr(request, '_cached_user'):
+        return request._cached_user
+    session = request.session
+    user_id, backend_path = session.get(SESSION_KEY), session.get(BACKEND_SESSION_KEY)
+    session_hash = session.get(HASH_SESSION_KEY)
+    if not _cacheable(user_id, backend_path, session_hash):
+        request._cached_user = auth.get_user(request)
+        return request._cached_user
+
+    key = _cache_key(user_id, get_version(_version_key(user_id)), backend_path, session_hash)
+    user = cache.get(key)
+    if user is None:
+        user = auth.get_user(request)
+        # 세션 검증을 통과했고 지문이 바뀌지 않았을 때만 (이전 비밀 키로 검증된 세션은 다음 요청부터)
+        if user.is_authenticated and session.get(HASH_SESSION_KEY) == session_hash:
+            cache.set(key, user, settings.USER_CACHE_TIMEOUT)
+    request._cached_user = user
+    return user
+
+
+async def auser(request):
+    if hasattr(request, '_acached_user'):
+        return request._acached_user
+    session = request.session
+    user_id, backend_path = await session.aget(SESSION_KEY), await session.aget(BACKEND_SESSION_KEY)
+    session_hash = await session.aget(HASH_SESSION_KEY)
+    if not _cacheable(user_id, backend_path, session_hash):
+        request._acached_user = await auth.aget_user(request)
+        return request._acached_user
+
+    key = _cache_key(user_id, await aget_version(_version_key(user_id)), backend_path, session_hash)
+    user = await cache.aget(key)
+    if user is None:
+        user = await auth.aget_user(request)
+        if user.is_authenticated and await session.aget(HASH_SESSION_KEY) == session_hash:
+            await cache.aset(key, user, settings.USER_CACHE_TIMEOUT)
+    request._acached_user = user
+    return user
+
+
+class CachedAuthenticationMiddleware(AuthenticationMiddleware):
+    """AuthenticationMiddleware 와 같지만 세션별로 검증한 사용자를 캐시에서 읽습니다."""
+
+    def process_request(self, request):
+        super().process_request(request)
+        request.user = SimpleLazyObject(lambda: get_user(request))
+        request.auser = partial(auser, request)
@@ -1,4 +1,4 @@
-from django.test import TestCase, Client
+from django.test import TestCase, Client, override_settings
 from django.urls import reverse
 from django.contrib.auth.models import User
 
@@ -107,3 +107,118 @@ class UserAuthTests(TestCase):
         response = self.client.get(reverse('users:register'))
         self.assertEqual(response.status_code, 200)
         self.assertContains(response, '회원가입')
+
+
+class UserQueryBudgetTest(TestCase):
+    """사용자 뷰 쿼리 예산 테스트 (테스트 중에는 예산을 넘으면 QueryBudgetExceeded 발생)"""
+    
+    def setUp(self):
+        self.client = Client()
+        self.user = User.objects.create_user(
+            username='testuser',
+            email='test@example.com',
+            password='testpass123'
+        )
+    
+    def test_anonymous_views_within_budget(self):
+        """로그인 전 화면이 예산 안에서 실행되는지 테스트"""
+        for url in [reverse('home'), reverse('users:login'), reverse('users:register')]:
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+    
+    def test_auth_flow_within_budget(self):
+        """회원가입, 로그인, 프로필, 로그아웃이 예산 안에서 실행되는지 테스트"""
+        response = self.client.post(reverse('users:register'), {
+            'username': 'newuser',
+            'email': 'new@example.com',
+            'password1': 'complexpass123!',
+            'password2': 'complexpass123!'
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.client.get(reverse('users:quick_logout')).status_code, 302)
+        
+        response = self.client.post(reverse('users:login'), {
+            'username': 'testuser',
+            'password': 'testpass123'
+        })
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(self.client.get(reverse('home')).status_code, 302)
+        self.assertEqual(self.client.get(reverse('users:profile')).status_code, 200)
+        self.assertEqual(self.client.get(reverse('users:logout')).status_code, 200)
+        self.assertEqual(self.client.post(reverse('users:logout')).status_code, 302)
+
+
+@override_settings(
+    CACHES={'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}},
+    USER_CACHE_ENABLED=True,
+)
+class CachedAuthenticationTest(TestCase):
+    """인증한 사용자 캐시 테스트 (CachedAuthenticationMiddleware)"""
+
+    def setUp(self):
+        from django.core.cache import cache
+
+        cache.clear()
+        self.user = User.objects.create_user(username='testuser', password='testpass123')
+        self.client.login(username='testuser', password='testpass123')
+
+    def _user_queries(self, func):
+        from django.db import connection
+        from django.test.utils import CaptureQueriesContext
+
+        with CaptureQueriesContext(connection) as context:
+            response = func()
+        return response, [query['sql'] for query in context.captured_queries if 'auth_user' in query['sql']]
+
+    def test_authenticated_requests_skip_user_query(self):
+        """두 번째 요청부터 auth_user 를 조회하지 않음"""
+        response, queries = self._user_queries(lambda: self.client.get(reverse('users:profile')))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(queries), 1)
+        for url in [reverse('users:profile'), reverse('memos:list')]:
+            with self.subTest(url=url):
+                response, queries = self._user_queries(lambda: self.client.get(url))
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(queries, [])
+
+    def test_password_change_logs_out_session(self):
+        """다른 곳에서 비밀번호를 바꾸면 캐시가 있어도 기존 세션은 로그아웃"""
+        self.client.get(reverse('users:profile'))
+        self.user.set_password('newpass456')
+        self.user.save()
+        response = self.client.get(reverse('users:profile'))
+        self.assertEqual(response.status_code, 302)
+        self.assertIn(reverse('users:login'), response.url)
+
+    def test_deactivation_logs_out_session(self):
+        """비활성화한 사용자는 캐시가 있어도 로그아웃"""
+        self.client.get(reverse('users:profile'))
+        self.user.is_active = False
+        self.user.save()
+        self.assertEqual(self.client.get(reverse('users:profile')).status_code, 302)
+
+    def test_user_update_refreshes_cached_user(self):
+        """사용자를 저장하면 다음 요청에서 새 값을 읽음"""
+        self.client.get(reverse('users:profile'))
+        self.user.username = 'renamed'
+        self.user.save()
+        response, queries = self._user_queries(lambda: self.client.get(reverse('users:profile')))
+        self.assertContains(response, 'renamed')
+        self.assertEqual(len(queries), 1)
+
+    @override_settings(USER_CACHE_ENABLED=False)
+    def test_disabled_without_shared_cache(self):
+        """공유 캐시가 아니면 매 요청 사용자를 조회해 다른 워커의 비활성화도 바로 반영"""
+        self.client.get(reverse('users:profile'))
+        # 다른 워커에서 비활성화 (이 프로세스의 캐시 버전은 그대로)
+        User.objects.filter(pk=self.user.pk).update(is_active=False)
+        self.assertEqual(self.client.get(reverse('users:profile')).status_code, 302)
+
+    @override_settings(ROOT_URLCONF='memojjang.urls_asgi')
+    async def test_async_views_use_cached_user(self):
+        """비동기 뷰(request.auser)도 캐시한 사용자를 사용"""
+        await self.async_client.alogin(username='testuser', password='testpass123')
+        self.assertContains(await self.async_client.get(reverse('memos:list')), 'testuser님')
+        # 시그널 없이 바꾸면 캐시 유지 시간 동안 캐시한 값을 사용
+        await User.objects.filter(pk=self.user.pk).aupdate(username='renamed')
+        self.assertContains(await self.async_client.get(reverse('memos:list')), 'testuser님')
@@ -6,12 +6,16 @@ from django.contrib import messages
 from django.urls import reverse_lazy
 from django.views.generic import CreateView
 from django.views import View
+from memojjang.query_budget import query_budget
+
 from .forms import CustomUserCreationForm
 
 
 class CustomLoginView(LoginView):
     template_name = 'users/login.html'
     redirect_authenticated_user = True
+    # 인증, 마지막 로그인 시각 갱신, 세션 키 교체 포함
+    query_budget = 9
     
     def get_success_url(self):
         return reverse_lazy('memos:list')
@@ -19,6 +23,7 @@ class CustomLoginView(LoginView):
 
 class CustomLogoutView(View):
     """로그아웃 처리"""
+    query_budget = 4
     
     def get(self, request):
         if request.user.is_authenticated:
@@ -33,6 +38,7 @@ class CustomLogoutView(View):
         return redirect('home')
 
 
+@query_budget(4)
 def quick_logout(request):
     """즉시 로그아웃 (확인 없이)"""
     username = request.user.username if request.user.is_authenticated else None
@@ -46,6 +52,8 @@ class SignUpView(CreateView):
     form_class = CustomUserCreationForm
     template_name = 'users/register.html'
     success_url = reverse_lazy('memos:list')
+    # 사용자명 중복 확인, 사용자 생성, 로그인(세션 저장) 포함
+    query_budget = 11
     
     def form_valid(self, form):
         response = super().form_valid(form)
@@ -54,6 +62,8 @@ class SignUpView(CreateView):
         return response
 
 
+# 세션 무효화(비밀번호 변경, 비활성화)로 로그아웃할 때의 세션 삭제 포함 (db 세션은 삭제 전 조회 1개)
+@query_budget(4)
 @login_required
 def profile_view(request):
     """사용자 프로필 페이지"""
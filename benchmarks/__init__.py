@@ -0,0 +1,13 @@
+"""
+메모짱 벤치마크
+
+performance_test.py 가 실행하는 벤치마크 모음입니다. 데이터셋 크기별로 별도의
+SQLite 데이터베이스(benchmarks/data/)를 만들어 개발용 DB 를 건드리지 않으며,
+시나리오마다 워밍업 후 perf_counter_ns 로 측정한 p50/p95/p99 와 요청당 쿼리 수를
+JSON 으로 기록하고 기준(baseline) 결과와 비교합니다.
+
+- timing.py: 반복 측정과 백분위 계산
+- dataset.py: 크기별 벤치마크 DB 와 데이터 생성
+- scenarios.py: 측정 시나리오 (목록, 깊은 페이지, 검색, 통계, 작성, 수정)
+- report.py: 결과 출력, JSON 저장, 기준 결과 비교
+"""
@@ -0,0 +1,91 @@
+"""크기별 벤치마크 데이터베이스와 데이터 생성
+
+데이터셋마다 별도의 데이터베이스(SQLite 는 benchmarks/data/memos-<크기>.sqlite3)를
+테스트 DB 와 같은 방식으로 만들어 기본 연결을 잠시 바꿉니다. 큰 데이터셋은 생성에 시간이
+오래 걸리므로 DB 를 지우지 않고 다음 실행에서 다시 사용합니다.
+"""
+import random
+from contextlib import contextmanager
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connection
+from django.utils import timezone
+
+from apps.memos.importer import save_batch
+from apps.memos.models import Memo
+
+
+DATA_DIR = Path(settings.BASE_DIR) / 'benchmarks' / 'data'
+USERNAME = 'benchmark'
+BATCH_SIZE = 5000
+
+WORDS = [
+    '회의', '일정', '프로젝트', '보고서', '아이디어', '할일', '장보기', '운동', '독서', '여행',
+    '예산', '계획', '검토', '배포', '테스트', '디자인', '고객', '미팅', '정리', '공부',
+    'meeting', 'report', 'deploy', 'review', 'budget', 'design', 'backlog', 'sprint', 'release', 'draft',
+    'python', 'django', 'database', 'index', 'query', 'cache', 'server', 'client', 'memo', 'note',
+]
+# 검색 시나리오에서 결과가 적은 검색어로 사용 (약 0.1% 의 메모에만 포함)
+RARE_WORD = '희귀키워드'
+PRIORITIES = ['low', 'normal', 'normal', 'normal', 'high', 'urgent']
+
+
+def database_name(size, data_dir=DATA_DIR):
+    if connection.vendor == 'sqlite':
+        return str(Path(data_dir) / f'memos-{size}.sqlite3')
+    return f"{connection.settings_dict['NAME']}_benchmark_{size}"
+
+
+@contextmanager
+def benchmark_database(size, data_dir=DATA_DIR, rebuild=False):
+    """size 개의 메모가 있는 벤치마크 DB 로 기본 연결을 바꾸고 벤치마크 사용자를 반환합니다."""
+    Path(data_dir).mkdir(parents=True, exist_ok=True)
+    old_name = connection.settings_dict['NAME']
+    connection.settings_dict['TEST']['NAME'] = database_name(size, data_dir)
+    connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=not rebuild, serialize=False)
+    try:
+        existing = Memo.objects.filter(author__username=USERNAME).count()
+        if existing not in (0, size):
+            # 생성이 중간에 중단된 DB 는 새로 만듦
+            connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=False)
+            connection.settings_dict['TEST']['NAME'] = database_name(size, data_dir)
+            connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=False, serialize=False)
+            existing = 0
+        user, _ = User.objects.get_or_create(username=USERNAME)
+        if existing == 0:
+            populate(user, size)
+        yield user
+    finally:
+        connection.creation.destroy_test_db(old_name, verbosity=0, keepdb=True)
+
+
+def make_memo(author, index, rng, now):
+    words = rng.choices(WORDS, k=rng.randint(8, 40))
+    if index % 1000 == 0:
+        words.insert(rng.randrange(len(words)), RARE_WORD)
+    created_at = now - timedelta(seconds=rng.randrange(365 * 24 * 3600))
+    memo = Memo(
+        author=author,
+        title=f"{' '.join(rng.sample(WORDS, 3))} {index}",
+        content=' '.join(words),
+        priority=rng.choice(PRIORITIES),
+        is_pinned=rng.random() < 0.02,
+        created_at=created_at,
+        updated_at=created_at,
+    )
+    memo.update_content_stats()
+    return memo
+
+
+def populate(user, size, seed=0):
+    """최근 1년에 걸친 메모 size 개를 색인, 활동 집계와 함께 생성합니다 (같은 seed 면 같은 데이터)."""
+    rng = random.Random(seed)
+    now = timezone.now()
+    for start in range(0, size, BATCH_SIZE):
+        end = min(size, start + BATCH_SIZE)
+        save_batch([make_memo(user, index, rng, now) for index in range(start, end)])
+        print(f'\r  데이터 생성: {end:,}/{size:,}', end='', flush=True)
+    print()
@@ -0,0 +1,328 @@
+"""실제 서버를 대상으로 한 다중 프로세스 HTTP 부하 테스트
+
+벤치마크 DB 로 로컬 서버(gunicorn/uvicorn 워커 N개, 둘 다 없으면 runserver)를 띄우고,
+여러 클라이언트 프로세스가 각자 로그인한 세션으로 읽기/쓰기가 섞인 요청을 정해진 시간 동안
+연속으로 보냅니다 (closed loop). 테스트 Client 와 달리 서버와 클라이언트가 별도 프로세스라
+GIL 경합이 아닌 서버 처리량을 측정하며, 엔드포인트별 처리량, 지연 시간 백분위, 오류율을
+보고합니다. 클라이언트도 같은 머신의 CPU 를 쓰므로 결과는 상대 비교용입니다.
+"""
+import http.client
+import importlib.util
+import multiprocessing
+import os
+import queue
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import Counter
+from contextlib import contextmanager
+from http.cookies import SimpleCookie
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.db import connection
+from django.db.models import Max
+from django.urls import reverse
+
+from apps.memos.models import Memo
+
+from .dataset import RARE_WORD
+from .timing import summarize
+
+
+SERVERS = ('gunicorn', 'uvicorn', 'runserver')
+DEFAULT_MIX = {'list': 40, 'detail': 25, 'search': 15, 'create': 10, 'update': 10}
+SEARCH_TERMS = ['프로젝트', 'deploy', '회의 일정', RARE_WORD]
+# 상세 조회와 수정 대상 메모 수 (수정한 메모는 끝난 뒤 원래대로 되돌림)
+SAMPLE_SIZE = 200
+PASSWORD = 'benchmark-load-test'
+STARTUP_TIMEOUT = 30
+
+
+class LoadTestError(Exception):
+    pass
+
+
+def parse_mix(value):
+    """'list=40,detail=25,...' 형식의 요청 비율"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if name not in DEFAULT_MIX:
+            raise ValueError(f'알 수 없는 엔드포인트: {name}')
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise ValueError('요청 비율의 합이 0 입니다.')
+    return mix
+
+
+def default_server():
+    for server in ('gunicorn', 'uvicorn'):
+        if importlib.util.find_spec(server):
+            return server
+    return 'runserver'
+
+
+def _free_port():
+    with socket.socket() as sock:
+        sock.bind(('127.0.0.1', 0))
+        return sock.getsockname()[1]
+
+
+def server_command(server, workers, port):
+    if server == 'gunicorn':
+        return [sys.executable, '-m', 'gunicorn', 'memojjang.wsgi:application',
+                '--workers', str(workers), '--bind', f'127.0.0.1:{port}', '--log-level', 'warning']
+    if server == 'uvicorn':
+        return [sys.executable, '-m', 'uvicorn', 'memojjang.asgi:application',
+                '--workers', str(workers), '--host', '127.0.0.1', '--port', str(port), '--log-level', 'warning']
+    # 개발 서버는 워커 프로세스 없이 요청마다 스레드를 사용
+    return [sys.executable, 'manage.py', 'runserver', f'127.0.0.1:{port}', '--noreload', '--skip-checks']
+
+
+@contextmanager
+def run_server(server, workers, database):
+    """벤치마크 DB 를 사용하는 서버를 띄우고 (host, port) 를 반환합니다."""
+    port = _free_port()
+    env = {
+        **os.environ,
+        'DJANGO_SETTINGS_MODULE': 'benchmarks.settings',
+        'BENCHMARK_DATABASE': database,
+        'DEBUG': 'False',
+        'ALLOWED_HOSTS': '127.0.0.1,localhost',
+    }
+    with tempfile.TemporaryFile() as log:
+        process = subprocess.Popen(
+            server_command(server, workers, port), cwd=settings.BASE_DIR, env=env,
+            stdout=log, stderr=subprocess.STDOUT,
+        )
+        try:
+            _wait_ready(process, port, log)
+            yield '127.0.0.1', port
+        finally:
+            process.terminate()
+            try:
+                process.wait(10)
+            except subprocess.TimeoutExpired:
+                process.kill()
+                process.wait()
+
+
+def _wait_ready(process, port, log):
+    deadline = time.monotonic() + STARTUP_TIMEOUT
+    while time.monotonic() < deadline:
+        if process.poll() is not None:
+            log.seek(0)
+            raise LoadTestError('서버가 시작되지 않았습니다:\n' + log.read().decode(errors='replace')[-2000:])
+        try:
+            connection_ = http.client.HTTPConnection('127.0.0.1', port, timeout=1)
+            connection_.request('GET', '/users/login/')
+            if connection_.getresponse().status == 200:
+                return
+        except OSError:
+            pass
+        time.sleep(0.2)
+    raise LoadTestError(f'{STARTUP_TIMEOUT}초 안에 서버가 응답하지 않았습니다.')
+
+
+class HttpSession:
+    """쿠키(세션, CSRF)를 유지하는 keep-alive HTTP 클라이언트 (표준 라이브러리만 사용)"""
+
+    def __init__(self, host, port):
+        self.connection = http.client.HTTPConnection(host, port, timeout=30)
+        self.cookies = {}
+
+    def request(self, method, path, data=None):
+        headers = {}
+        if self.cookies:
+            headers['Cookie'] = '; '.join(f'{name}={value}' for name, value in self.cookies.items())
+        body = None
+        if data is not None:
+            body = urlencode({**data, 'csrfmiddlewaretoken': self.cookies.get('csrftoken', '')})
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+        try:
+            self.connection.request(method, path, body, headers)
+            response = self.connection.getresponse()
+            response.read()
+        except (OSError, http.client.HTTPException):
+            # 다음 요청에서 새로 연결
+            self.connection.close()
+            raise
+        for header in response.msg.get_all('Set-Cookie') or []:
+            for name, morsel in SimpleCookie(header).items():
+                self.cookies[name] = morsel.value
+        return response.status
+
+    def login(self, path, username, password):
+        self.request('GET', path)
+        status = self.request('POST', path, {'username': username, 'password': password})
+        if status != 302 or 'sessionid' not in self.cookies:
+            raise LoadTestError(f'로그인 실패 (응답 코드 {status})')
+
+
+def _next_request(name, config, rng, counter):
+    """엔드포인트 이름으로 (메서드, 경로, 폼 데이터, 예상 응답 코드) 를 만듭니다."""
+    if name == 'list':
+        return 'GET', config['paths']['list'], None, 200
+    if name == 'search':
+        return 'GET', f"{config['paths']['search']}?{urlencode({'q': rng.choice(SEARCH_TERMS)})}", None, 200
+    if name == 'create':
+        return 'POST', config['paths']['create'], {
+            'title': f'부하 테스트 {counter}', 'content': '부하 테스트로 작성한 메모 deploy review', 'priority': 'normal',
+        }, 302
+    detail_path, edit_path, title, priority = rng.choice(config['targets'])
+    if name == 'detail':
+        return 'GET', detail_path, None, 200
+    return 'POST', edit_path, {
+        'title': title, 'content': f'부하 테스트로 수정한 내용 {counter} 회의 일정', 'priority': priority,
+    }, 302
+
+
+def client_process(index, config, barrier, results):
+    """클라이언트 프로세스: 로그인 후 모든 클라이언트가 준비되면 요청을 보냅니다."""
+    rng = random.Random(config['seed'] + index)
+    names, weights = zip(*config['mix'].items())
+    session = HttpSession(config['host'], config['port'])
+    try:
+        session.login(config['paths']['login'], config['username'], config['password'])
+    except Exception:
+        # 다른 클라이언트가 기다리지 않도록
+        barrier.abort()
+        raise
+    barrier.wait()
+
+    stats = {name: {'latencies': [], 'statuses': Counter(), 'errors': 0} for name in names}
+    start = time.monotonic()
+    measure_from = start + config['warmup']
+    end = measure_from + config['duration']
+    counter = 0
+    while (now := time.monotonic()) < end:
+        name = rng.choices(names, weights)[0]
+        method, path, data, expected = _next_request(name, config, rng, f'{index}-{counter}')
+        counter += 1
+        begin = time.perf_counter_ns()
+        try:
+            status = session.request(method, path, data)
+        except (OSError, http.client.HTTPException) as e:
+            status = type(e).__name__
+        elapsed = time.perf_counter_ns() - begin
+        if now < measure_from:
+            continue
+        entry = stats[name]
+        entry['latencies'].append(elapsed)
+        entry['statuses'][status] += 1
+        if status != expected:
+            entry['errors'] += 1
+    results.put(stats)
+
+
+def drive(host, port, config, clients):
+    """클라이언트 프로세스들을 실행하고 엔드포인트별 결과를 합칩니다."""
+    config = {**config, 'host': host, 'port': port}
+    barrier = multiprocessing.Barrier(clients)
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=client_process, args=(index, config, barrier, results))
+        for index in range(clients)
+    ]
+    for process in processes:
+        process.start()
+    merged = {}
+    try:
+        received = 0
+        while received < len(processes):
+            try:
+                stats = results.get(timeout=1)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    raise LoadTestError('클라이언트 프로세스가 실패했습니다 (로그인 실패 또는 연결 오류).')
+                continue
+            received += 1
+            for name, entry in stats.items():
+                target = merged.setdefault(name, {'latencies': [], 'statuses': Counter(), 'errors': 0})
+                target['latencies'].extend(entry['latencies'])
+                target['statuses'].update(entry['statuses'])
+                target['errors'] += entry['errors']
+    finally:
+        for process in processes:
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+    return merged
+
+
+def summarize_load(merged, duration):
+    rows = []
+    total = {'latencies': [], 'statuses': Counter(), 'errors': 0}
+    for name, entry in merged.items():
+        total['latencies'].extend(entry['latencies'])
+        total['statuses'].update(entry['statuses'])
+        total['errors'] += entry['errors']
+    for name, entry in [*merged.items(), ('total', total)]:
+        requests = len(entry['latencies'])
+        if not requests:
+            continue
+        rows.append({
+            'endpoint': name,
+            'requests': requests,
+            'throughput_rps': round(requests / duration, 1),
+            'error_rate': round(entry['errors'] / requests, 4),
+            'statuses': {str(status): count for status, count in entry['statuses'].items()},
+            **summarize(entry['latencies']),
+        })
+    return rows
+
+
+def run_load_test(user, server, workers, clients, duration, warmup, mix, seed=0):
+    """벤치마크 DB 의 사용자로 부하 테스트를 실행하고 엔드포인트별 결과를 반환합니다."""
+    user.set_password(PASSWORD)
+    user.save(update_fields=['password'])
+    originals = list(Memo.objects.filter(author=user).order_by('id')[:SAMPLE_SIZE])
+    last_id = Memo.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    config = {
+        'username': user.username,
+        'password': PASSWORD,
+        'duration': duration,
+        'warmup': warmup,
+        'mix': {name: weight for name, weight in mix.items() if weight},
+        'seed': seed,
+        'paths': {
+            'login': reverse('users:login'),
+            'list': reverse('memos:list'),
+            'search': reverse('memos:search_ajax'),
+            'create': reverse('memos:create'),
+        },
+        'targets': [
+            (reverse('memos:detail', kwargs={'pk': memo.pk}), reverse('memos:edit', kwargs={'pk': memo.pk}),
+             memo.title, memo.priority)
+            for memo in originals
+        ],
+    }
+    database = connection.settings_dict['NAME']
+    # 서버 프로세스가 DB 를 쓰는 동안 이 프로세스의 연결은 닫아 둠
+    connection.close()
+    try:
+        with run_server(server, workers, database) as (host, port):
+            merged = drive(host, port, config, clients)
+    finally:
+        # 다음 실행과 같은 데이터셋이 되도록 작성/수정한 메모를 되돌림
+        Memo.objects.filter(author=user, pk__gt=last_id).delete()
+        for memo in originals:
+            memo.save()
+    return summarize_load(merged, duration)
+
+
+def format_load(rows):
+    lines = [
+        f"{'엔드포인트':<10} {'요청':>8} {'처리량(rps)':>12} {'오류율':>7} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}",
+    ]
+    for row in rows:
+        lines.append(
+            f"{row['endpoint']:<10} {row['requests']:>8,} {row['throughput_rps']:>12.1f} {row['error_rate']:>7.2%} "
+            f"{row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f} {row['p99_ms']:>9.3f}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,115 @@
+"""메모 목록 템플릿 렌더링 시간 비교
+
+DB 조회 없이 메모 목록 화면(memos/memo_list.html)을 카드 수별로 렌더링해 다음을 비교합니다.
+
+- no_loader_cache: cached 템플릿 로더 없이 매번 템플릿을 읽고 파싱, 카드 조각 캐시 없음
+- uncached: cached 로더 사용, 카드 조각 캐시 없음 (조각 캐시 도입 전)
+- cold: 카드 조각 캐시를 매번 비운 상태 (렌더링 + 캐시 저장)
+- warm: 모든 카드가 조각 캐시에 있는 상태
+
+조각 캐시는 현재 기본 캐시(CACHE_BACKEND)를 사용하므로 redis 처럼 원격 캐시면 카드마다
+왕복 시간이 포함됩니다.
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.template import engines
+from django.template.backends.django import DjangoTemplates
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.urls import reverse
+
+from apps.memos.views import MemoListView, _list_queryset
+
+from .timing import measure
+
+
+CARD_COUNTS = (10, 100)
+MODES = ('no_loader_cache', 'uncached', 'cold', 'warm')
+TEMPLATE_NAME = 'memos/memo_list.html'
+# {% cache %} 는 template_fragments 캐시가 있으면 기본 캐시 대신 사용
+NO_FRAGMENT_CACHE = {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}
+
+
+class RenderBenchmarkError(Exception):
+    pass
+
+
+def _uncached_loader_backend():
+    """설정과 같지만 cached 로더로 감싸지 않은 템플릿 엔진"""
+    params = settings.TEMPLATES[0]
+    loaders = ['django.template.loaders.filesystem.Loader']
+    if params.get('APP_DIRS'):
+        loaders.append('django.template.loaders.app_directories.Loader')
+    return DjangoTemplates({
+        'NAME': 'render_benchmark',
+        'DIRS': params.get('DIRS', []),
+        'APP_DIRS': False,
+        'OPTIONS': {**params.get('OPTIONS', {}), 'loaders': loaders},
+    })
+
+
+def _render_page(backend, memos, request):
+    context = {
+        'memos': memos,
+        'object_list': memos,
+        'search_query': '',
+        'cursor_pagination': MemoListView.pagination_mode == 'cursor',
+    }
+    return backend.get_template(TEMPLATE_NAME).render(context, request)
+
+
+def _measure_mode(mode, memos, request, iterations, warmup):
+    backend = _uncached_loader_backend() if mode == 'no_loader_cache' else engines['django']
+    fragment_caches = {**settings.CACHES}
+    if mode in ('no_loader_cache', 'uncached'):
+        fragment_caches['template_fragments'] = NO_FRAGMENT_CACHE
+    with override_settings(CACHES=fragment_caches):
+        cache.clear()
+        html = _render_page(backend, memos, request)
+        result = measure(
+            lambda: _render_page(backend, memos, request), iterations, warmup,
+            before=cache.clear if mode == 'cold' else None,
+        )
+        cache.clear()
+    return html, result
+
+
+def run_render_test(user, card_counts=CARD_COUNTS, iterations=30, warmup=5, modes=MODES):
+    """카드 수와 방식별 렌더링 시간을 재고, 모든 방식의 HTML 이 같은지 확인합니다.
+
+    speedup 은 조각 캐시 도입 전(uncached) p50 대비 배속입니다.
+    """
+    request = RequestFactory().get(reverse('memos:list'))
+    request.user = user
+    rows = []
+    for cards in card_counts:
+        memos = list(_list_queryset(user, '').order_by(*MemoListView.keyset_ordering)[:cards])
+        if len(memos) < cards:
+            raise RenderBenchmarkError(f'메모가 {cards}개보다 적습니다 ({len(memos)}개).')
+        baseline_html, results = None, {}
+        for mode in modes:
+            html, results[mode] = _measure_mode(mode, memos, request, iterations, warmup)
+            if baseline_html is None:
+                baseline_html = html
+            elif html != baseline_html:
+                raise RenderBenchmarkError(f'{mode}: 렌더링 결과가 {modes[0]} 와 다릅니다 (카드 {cards}개).')
+        baseline_ms = results.get('uncached', {}).get('p50_ms')
+        for mode, result in results.items():
+            rows.append({
+                'cards': cards,
+                'mode': mode,
+                **result,
+                'speedup': round(baseline_ms / result['p50_ms'], 2) if baseline_ms and result['p50_ms'] else None,
+            })
+    return rows
+
+
+def format_render(rows):
+    lines = [f"{'카드':>6} {'방식':<16} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'쿼리':>6} {'배속':>7}"]
+    for row in rows:
+        speedup = f"{row['speedup']:>6.2f}x" if row['speedup'] else f"{'-':>7}"
+        lines.append(
+            f"{row['cards']:>6} {row['mode']:<16} {row['p50_ms']:>9.3f} {row['p95_ms']:>9.3f} "
+            f"{row['p99_ms']:>9.3f} {row['queries']:>6} {speedup}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,101 @@
+"""결과 출력, JSON 저장, 기준(baseline) 결과와 비교"""
+import json
+import platform
+import subprocess
+from pathlib import Path
+
+import django
+from django.conf import settings
+from django.db import connection
+from django.utils import timezone
+
+
+# 이 값(ms)보다 작은 차이는 측정 잡음으로 보고 회귀로 판단하지 않음
+MIN_DELTA_MS = 0.5
+COMPARED_METRICS = ('p50_ms', 'p95_ms')
+
+
+def _git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=settings.BASE_DIR,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment(**options):
+    """결과를 비교할 때 확인할 실행 환경과 옵션"""
+    return {
+        'created_at': timezone.now().isoformat(timespec='seconds'),
+        'git_commit': _git_commit(),
+        'python': platform.python_version(),
+        'django': django.get_version(),
+        'platform': platform.platform(),
+        'database': connection.vendor,
+        'conn_max_age': connection.settings_dict['CONN_MAX_AGE'],
+        'search_backend': settings.MEMO_SEARCH_BACKEND,
+        'cache_backend': settings.CACHES['default']['BACKEND'],
+        **options,
+    }
+
+
+def write_report(report, path):
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2), encoding='utf-8')
+
+
+def load_report(path):
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+def _key(result):
+    return result['size'], result['scenario']
+
+
+def compare(report, baseline, threshold):
+    """기준 결과와 비교해 결과별 변화율과 회귀 목록을 반환합니다.
+
+    p50/p95 가 threshold 비율 이상(그리고 MIN_DELTA_MS 이상) 느려지거나
+    쿼리 수가 늘어나면 회귀입니다.
+    """
+    base = {_key(result): result for result in baseline['results']}
+    changes = {}
+    regressions = []
+    for result in report['results']:
+        previous = base.get(_key(result))
+        if previous is None:
+            continue
+        change = {
+            metric: (result[metric] - previous[metric]) / previous[metric] if previous[metric] else 0.0
+            for metric in COMPARED_METRICS
+        }
+        changes[_key(result)] = change
+        name = f"{result['scenario']} ({result['size']:,}개)"
+        for metric in COMPARED_METRICS:
+            if change[metric] > threshold and result[metric] - previous[metric] >= MIN_DELTA_MS:
+                regressions.append(
+                    f'{name}: {metric} {previous[metric]:.3f} → {result[metric]:.3f}ms ({change[metric]:+.0%})'
+                )
+        if result['queries'] > previous['queries']:
+            regressions.append(f"{name}: 쿼리 수 {previous['queries']} → {result['queries']}")
+    return changes, regressions
+
+
+def format_results(report, changes=None):
+    changes = changes or {}
+    lines = [
+        f"{'크기':>10}  {'시나리오':<18} {'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9} {'쿼리':>4} "
+        f"{'연결':>5} {'연결(ms)':>8}  기준 대비(p50/p95)",
+    ]
+    for result in report['results']:
+        change = changes.get(_key(result))
+        delta = f"{change['p50_ms']:+.0%} / {change['p95_ms']:+.0%}" if change else '-'
+        lines.append(
+            f"{result['size']:>10,}  {result['scenario']:<18} {result['p50_ms']:>9.3f} {result['p95_ms']:>9.3f} "
+            f"{result['p99_ms']:>9.3f} {result['queries']:>4} "
+            f"{result.get('connections', 0):>5.2f} {result.get('connect_ms', 0):>8.3f}  {delta}"
+        )
+    return '\n'.join(lines)
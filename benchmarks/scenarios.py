@@ -0,0 +1,146 @@
+"""측정 시나리오
+
+각 시나리오는 BenchmarkContext 를 받아 측정할 함수를 yield 하는 제너레이터입니다.
+yield 앞뒤(준비와 정리)는 측정 시간에 포함되지 않습니다.
+"""
+import itertools
+from contextlib import contextmanager
+from unittest import mock
+
+from django.db import close_old_connections
+from django.db.models import Max
+from django.test import Client
+from django.urls import reverse
+
+from apps.memos.models import Memo
+from apps.memos.pagination import KeysetPaginator
+from apps.memos.views import MemoListView, _list_queryset
+
+from .dataset import RARE_WORD
+
+
+SCENARIOS = {}
+
+
+class BenchmarkError(Exception):
+    pass
+
+
+def scenario(name, description):
+    def decorator(func):
+        SCENARIOS[name] = (description, contextmanager(func))
+        return func
+    return decorator
+
+
+class BenchmarkContext:
+    def __init__(self, user, size):
+        self.user = user
+        self.size = size
+        self.client = Client()
+        self.client.force_login(user)
+
+    def _request(self, method, url, data):
+        # 실제 서버처럼 요청 시작/끝에 오래된 연결을 닫음 (테스트 Client 는 연결을 닫지 않음).
+        # CONN_MAX_AGE 가 0 이면 요청마다 새로 연결합니다.
+        close_old_connections()
+        try:
+            return method(url, data)
+        finally:
+            close_old_connections()
+
+    def _check(self, response, expected):
+        if response.status_code != expected:
+            raise BenchmarkError(f'{response.request["PATH_INFO"]}: 응답 코드 {response.status_code} (예상 {expected})')
+        return response
+
+    def get(self, url, params=None, expected=200):
+        return self._check(self._request(self.client.get, url, params or {}), expected)
+
+    def post(self, url, data, expected=302):
+        return self._check(self._request(self.client.post, url, data), expected)
+
+
+@scenario('list', '메모 목록 첫 페이지')
+def list_first_page(ctx):
+    url = reverse('memos:list')
+    yield lambda: ctx.get(url)
+
+
+@scenario('list_deep_cursor', '메모 목록 90% 깊이 페이지 (커서)')
+def list_deep_cursor(ctx):
+    queryset = _list_queryset(ctx.user, '')
+    ordering = MemoListView.keyset_ordering
+    anchor = queryset.order_by(*ordering)[int(ctx.size * 0.9)]
+    cursor = KeysetPaginator(queryset, MemoListView.paginate_by, ordering).encode_cursor(anchor, 'next')
+    url = reverse('memos:list')
+    with mock.patch.object(MemoListView, 'pagination_mode', 'cursor'):
+        yield lambda: ctx.get(url, {'cursor': cursor})
+
+
+@scenario('list_deep_offset', '메모 목록 마지막 페이지 (번호 페이지네이션)')
+def list_deep_offset(ctx):
+    url = reverse('memos:list')
+    with mock.patch.object(MemoListView, 'pagination_mode', 'offset'):
+        yield lambda: ctx.get(url, {'page': 'last'})
+
+
+@scenario('search', 'AJAX 검색 (결과가 많은 검색어)')
+def search_common(ctx):
+    url = reverse('memos:search_ajax')
+    yield lambda: ctx.get(url, {'q': '프로젝트'})
+
+
+@scenario('search_rare', 'AJAX 검색 (결과가 적은 검색어)')
+def search_rare(ctx):
+    url = reverse('memos:search_ajax')
+    yield lambda: ctx.get(url, {'q': RARE_WORD})
+
+
+@scenario('stats', '통계 화면')
+def stats(ctx):
+    url = reverse('memos:stats')
+    yield lambda: ctx.get(url)
+
+
+@scenario('create', '메모 작성 (POST)')
+def create(ctx):
+    url = reverse('memos:create')
+    last_id = Memo.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    counter = itertools.count()
+
+    def run():
+        ctx.post(url, {
+            'title': f'벤치마크 작성 {next(counter)}',
+            'content': '벤치마크로 작성한 메모 내용입니다. deploy review budget',
+            'priority': 'normal',
+        })
+
+    try:
+        yield run
+    finally:
+        # 다음 실행과 같은 데이터셋이 되도록 작성한 메모 삭제
+        Memo.objects.filter(author=ctx.user, pk__gt=last_id).delete()
+
+
+@scenario('update', '메모 수정 (POST, 내용 변경으로 색인 갱신 포함)')
+def update(ctx):
+    originals = list(Memo.objects.filter(author=ctx.user).order_by('id')[:100])
+    # 메모 수(100)와 서로소인 개수여야 같은 메모에 매번 다른 내용이 들어감
+    contents = itertools.cycle([
+        '수정한 내용 회의 일정 정리', '다시 수정한 내용 sprint backlog review', '세 번째 내용 여행 계획 budget',
+    ])
+    requests = itertools.cycle(originals)
+
+    def run():
+        memo = next(requests)
+        ctx.post(reverse('memos:edit', kwargs={'pk': memo.pk}), {
+            'title': memo.title, 'content': next(contents), 'priority': memo.priority,
+        })
+
+    try:
+        yield run
+    finally:
+        # 다음 실행에서도 내용이 바뀌도록 원래 내용으로 되돌림 (색인도 save() 로 갱신)
+        for memo in originals:
+            memo.save()
@@ -0,0 +1,18 @@
+"""
+부하 테스트 서버용 설정
+
+benchmarks/load.py 가 서버 프로세스를 띄울 때 사용합니다. 기본 설정과 같지만
+BENCHMARK_DATABASE 환경변수의 벤치마크 DB 를 사용합니다.
+"""
+import os
+
+from memojjang.settings import *  # noqa: F401,F403
+from memojjang.settings import DATABASES
+
+
+DATABASES['default']['NAME'] = os.environ['BENCHMARK_DATABASE']
+
+# 측정 중에는 예산 초과를 예외로 만들지 않음 (로그만)
+QUERY_BUDGET_STRICT = False
+# 벤치마크 DB 만 사용 (복제본이 설정되어 있어도 조회를 보내지 않음)
+DATABASE_REPLICA = None
@@ -0,0 +1,200 @@
+"""SQLite 동시 읽기/쓰기 처리량 비교
+
+웹 서버 없이 읽기 프로세스와 쓰기 프로세스가 같은 벤치마크 DB 에 ORM 으로 동시에 접근해,
+SQLite 기본 설정(rollback journal, synchronous=FULL, DEFERRED 트랜잭션)과 현재 설정
+(SQLITE_PRAGMAS, transaction_mode)의 역할별 처리량, 지연 시간, 잠금 오류 수를 비교합니다.
+
+- 읽기: 메모 목록 첫 페이지 + 메모 하나 상세 조회
+- 쓰기: 트랜잭션 안에서 메모를 읽고 내용 수정 (색인 갱신 포함), 네 번에 한 번은 새 메모 작성
+"""
+import multiprocessing
+import queue
+import random
+import time
+
+from django.conf import settings
+from django.db import OperationalError, connection, transaction
+from django.db.models import Max
+
+from apps.memos.models import Memo
+
+from .timing import summarize
+
+
+# SQLite 기본값 (journal_mode 는 DB 파일에 남으므로 명시적으로 되돌림). 잠금 대기는 파이썬
+# sqlite3 모듈의 기본 timeout(5초)이 적용되어 tuned 의 busy_timeout 과 같음
+DEFAULT_PRAGMAS = {'journal_mode': 'DELETE', 'synchronous': 'FULL'}
+CONFIGS = ('default', 'tuned')
+SAMPLE_SIZE = 200
+READ_PAGE_SIZE = 20
+
+
+class ConcurrencyBenchmarkError(Exception):
+    pass
+
+
+def resolve_config(name):
+    """설정 이름을 (PRAGMA, transaction_mode) 로 바꿉니다. 'tuned' 는 현재 설정을 사용합니다."""
+    if name == 'default':
+        return DEFAULT_PRAGMAS, None
+    return dict(settings.SQLITE_PRAGMAS), connection.settings_dict['OPTIONS'].get('transaction_mode')
+
+
+def _apply_config(pragmas, transaction_mode):
+    """이 프로세스의 다음 연결부터 설정을 적용합니다."""
+    connection.close()
+    settings.SQLITE_PRAGMAS = pragmas
+    options = {**connection.settings_dict['OPTIONS'], 'transaction_mode': transaction_mode}
+    connection.settings_dict['OPTIONS'] = options
+
+
+def _read(config, rng):
+    memos = list(Memo.objects.filter(author_id=config['user_id']).order_by('-updated_at')[:READ_PAGE_SIZE])
+    if not memos:
+        raise ConcurrencyBenchmarkError('벤치마크 메모가 없습니다.')
+    Memo.objects.get(pk=rng.choice(config['targets']))
+
+
+def _write(config, rng, index, counter):
+    if counter % 4 == 0:
+        Memo.objects.create(
+            author_id=config['user_id'], title=f'동시성 벤치마크 {index}-{counter}',
+            content='동시성 벤치마크로 작성한 메모 deploy review', priority='normal',
+        )
+        return
+    # 읽은 뒤 쓰는 트랜잭션: DEFERRED 에서는 쓰기 잠금으로 승격하다 실패할 수 있음
+    with transaction.atomic():
+        memo = Memo.objects.get(pk=rng.choice(config['targets']))
+        memo.content = f'동시성 벤치마크로 수정한 내용 {index}-{counter} 회의 일정'
+        memo.save()
+
+
+def worker_process(role, index, config, barrier, results):
+    _apply_config(config['pragmas'], config['transaction_mode'])
+    rng = random.Random(config['seed'] + index)
+    barrier.wait()
+    latencies, errors = [], 0
+    start = time.monotonic()
+    measure_from = start + config['warmup']
+    end = measure_from + config['duration']
+    counter = 0
+    while (now := time.monotonic()) < end:
+        counter += 1
+        begin = time.perf_counter_ns()
+        try:
+            if role == 'read':
+                _read(config, rng)
+            else:
+                _write(config, rng, index, counter)
+            failed = False
+        except OperationalError:
+            # database is locked
+            failed = True
+        elapsed = time.perf_counter_ns() - begin
+        if now < measure_from:
+            continue
+        if failed:
+            errors += 1
+        else:
+            latencies.append(elapsed)
+    connection.close()
+    results.put((role, latencies, errors))
+
+
+def _run_workers(config, readers, writers):
+    roles = ['read'] * readers + ['write'] * writers
+    barrier = multiprocessing.Barrier(len(roles))
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=worker_process, args=(role, index, config, barrier, results))
+        for index, role in enumerate(roles)
+    ]
+    for process in processes:
+        process.start()
+    merged = {role: {'latencies': [], 'errors': 0} for role in set(roles)}
+    try:
+        received = 0
+        while received < len(processes):
+            try:
+                role, latencies, errors = results.get(timeout=1)
+            except queue.Empty:
+                if any(process.exitcode not in (None, 0) for process in processes):
+                    barrier.abort()
+                    raise ConcurrencyBenchmarkError('작업 프로세스가 실패했습니다.')
+                continue
+            received += 1
+            merged[role]['latencies'].extend(latencies)
+            merged[role]['errors'] += errors
+    finally:
+        for process in processes:
+            process.join(5)
+            if process.is_alive():
+                process.terminate()
+    return merged
+
+
+def run_concurrency_test(user, readers, writers, duration, warmup, configs=CONFIGS, seed=0):
+    """설정별로 읽기/쓰기 프로세스를 동시에 실행하고 역할별 결과를 반환합니다."""
+    if connection.vendor != 'sqlite':
+        raise ConcurrencyBenchmarkError('SQLite 데이터베이스에서만 실행할 수 있습니다.')
+    originals = list(Memo.objects.filter(author=user).order_by('id')[:SAMPLE_SIZE])
+    last_id = Memo.objects.aggregate(last_id=Max('id'))['last_id'] or 0
+    saved_pragmas, saved_options = settings.SQLITE_PRAGMAS, connection.settings_dict['OPTIONS']
+    # 실행 중에 설정을 바꾸므로 시작 전에 모두 확정
+    resolved = [(name, *resolve_config(name)) for name in configs]
+    rows = []
+    try:
+        for name, pragmas, transaction_mode in resolved:
+            # journal_mode 는 DB 파일에 저장되고 다른 연결이 없을 때만 바뀌므로 시작 전에 적용
+            _apply_config(pragmas, transaction_mode)
+            connection.ensure_connection()
+            connection.close()
+            config = {
+                'user_id': user.pk,
+                'targets': [memo.pk for memo in originals],
+                'pragmas': pragmas,
+                'transaction_mode': transaction_mode,
+                'duration': duration,
+                'warmup': warmup,
+                'seed': seed,
+            }
+            merged = _run_workers(config, readers, writers)
+            for role in ('read', 'write'):
+                entry = merged.get(role)
+                if entry is None:
+                    continue
+                operations = len(entry['latencies'])
+                attempts = operations + entry['errors']
+                rows.append({
+                    'config': name,
+                    'role': role,
+                    'processes': readers if role == 'read' else writers,
+                    'operations': operations,
+                    'throughput_ops': round(operations / duration, 1),
+                    'errors': entry['errors'],
+                    'error_rate': round(entry['errors'] / attempts, 4) if attempts else 0,
+                    **(summarize(entry['latencies']) if operations else {}),
+                })
+    finally:
+        connection.close()
+        settings.SQLITE_PRAGMAS = saved_pragmas
+        connection.settings_dict['OPTIONS'] = saved_options
+        # 다음 실행과 같은 데이터셋이 되도록 작성/수정한 메모를 되돌림
+        Memo.objects.filter(author=user, pk__gt=last_id).delete()
+        for memo in originals:
+            memo.save()
+    return rows
+
+
+def format_concurrency(rows):
+    lines = [
+        f"{'설정':<8} {'역할':<6} {'프로세스':>8} {'작업':>8} {'처리량(ops)':>12} {'잠금 오류':>9} "
+        f"{'p50(ms)':>9} {'p95(ms)':>9} {'p99(ms)':>9}",
+    ]
+    for row in rows:
+        percentiles = ''.join(f" {row.get(key, float('nan')):>9.3f}" for key in ('p50_ms', 'p95_ms', 'p99_ms'))
+        lines.append(
+            f"{row['config']:<8} {row['role']:<6} {row['processes']:>8} {row['operations']:>8,} "
+            f"{row['throughput_ops']:>12.1f} {row['errors']:>9,}{percentiles}"
+        )
+    return '\n'.join(lines)
@@ -0,0 +1,95 @@
+"""반복 측정과 백분위 계산"""
+import statistics
+import time
+from contextlib import contextmanager
+from unittest import mock
+
+from django.db import connection
+from django.db.backends.base.base import BaseDatabaseWrapper
+
+
+class QueryCounter:
+    """connection.execute_wrapper 로 실행된 쿼리 수를 셉니다 (DEBUG 쿼리 로그 없이)."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class ConnectionTimer:
+    """새로 연 DB 연결 수와 연결 준비 시간을 잽니다.
+
+    connect() 전체(접속, 인증, 세션 초기화, connection_created 의 PRAGMA 등)를 잽니다.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.elapsed_ns = 0
+
+    @contextmanager
+    def install(self):
+        original = BaseDatabaseWrapper.connect
+
+        def connect(wrapper):
+            start = time.perf_counter_ns()
+            try:
+                return original(wrapper)
+            finally:
+                self.count += 1
+                self.elapsed_ns += time.perf_counter_ns() - start
+
+        with mock.patch.object(BaseDatabaseWrapper, 'connect', connect):
+            yield self
+
+
+def summarize(samples_ns):
+    """나노초 측정값 목록을 밀리초 단위 요약으로 변환합니다."""
+    samples = sorted(ns / 1_000_000 for ns in samples_ns)
+    if len(samples) > 1:
+        percentiles = statistics.quantiles(samples, n=100, method='inclusive')
+        p50, p95, p99 = percentiles[49], percentiles[94], percentiles[98]
+    else:
+        p50 = p95 = p99 = samples[0]
+    return {
+        'p50_ms': round(p50, 3),
+        'p95_ms': round(p95, 3),
+        'p99_ms': round(p99, 3),
+        'mean_ms': round(statistics.fmean(samples), 3),
+        'min_ms': round(samples[0], 3),
+        'max_ms': round(samples[-1], 3),
+    }
+
+
+def measure(func, iterations, warmup, before=None):
+    """func 를 warmup 회 실행한 뒤 iterations 회 측정합니다.
+
+    before 는 매 반복 전에 측정 시간 밖에서 호출됩니다 (예: 캐시 비우기).
+    쿼리 수는 측정한 반복 중 가장 많은 값이고, 연결 수와 연결 시간(ms)은 반복당 평균입니다.
+    """
+    for _ in range(warmup):
+        if before:
+            before()
+        func()
+
+    samples = []
+    queries = 0
+    with ConnectionTimer().install() as timer:
+        for _ in range(iterations):
+            if before:
+                before()
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                start = time.perf_counter_ns()
+                func()
+                samples.append(time.perf_counter_ns() - start)
+            queries = max(queries, counter.count)
+    return {
+        **summarize(samples),
+        'iterations': iterations,
+        'queries': queries,
+        'connections': round(timer.count / iterations, 2),
+        'connect_ms': round(timer.elapsed_ns / iterations / 1_000_000, 3),
+    }
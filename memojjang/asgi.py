@@ -12,5 +12,9 @@ import os
 from django.core.asgi import get_asgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'memojjang.settings')
+# 메모 목록/상세/검색은 비동기 ORM 을 사용하는 뷰로 처리
+os.environ.setdefault('ROOT_URLCONF', 'memojjang.urls_asgi')
+# 장고 문서 권고: ASGI 에서는 지속 연결을 끄고 연결 풀 사용 (PostgreSQL 은 DB_POOL)
+os.environ.setdefault('DB_CONN_MAX_AGE', '0')
 
 application = get_asgi_application()
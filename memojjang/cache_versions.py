@@ -0,0 +1,58 @@
+"""
+캐시에 저장하는 버전 번호
+
+캐시 키에 버전 번호를 포함시키고, 데이터가 바뀌면 버전만 올려 그 키로 저장한 캐시를
+한 번에 무효화합니다. 메모 목록/검색 캐시(apps/memos/cache.py)와 인증한 사용자 캐시
+(apps/users/middleware.py)가 사용합니다.
+
+버전도 캐시에 저장하므로 워커끼리 캐시를 공유해야(SHARED_CACHE_BACKENDS) 다른 워커의
+변경이 보입니다.
+"""
+import time
+
+from django.core.cache import cache
+from django.db import transaction
+
+
+def get_version(key):
+    """버전 키의 현재 값을 반환합니다 (없으면 만듦)."""
+    version = cache.get(key)
+    if version is None:
+        # 키가 축출된 뒤 다시 만들어질 때 예전 버전 번호와 겹치지 않도록 시각을 사용
+        cache.add(key, time.time_ns(), None)
+        version = cache.get(key, time.time_ns())
+    return version
+
+
+async def aget_version(key):
+    """get_version() 의 비동기 버전"""
+    version = await cache.aget(key)
+    if version is None:
+        await cache.aadd(key, time.time_ns(), None)
+        version = await cache.aget(key, time.time_ns())
+    return version
+
+
+def incr_version(key):
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.set(key, time.time_ns(), None)
+
+
+def bump_versions(keys):
+    """버전들을 올려 기존 캐시를 무효화합니다.
+
+    커밋 전에 다른 요청이 이전 데이터를 새 버전으로 캐시할 수 있으므로
+    커밋 후에 한 번 더 올립니다.
+    """
+    keys = set(keys)
+    for key in keys:
+        incr_version(key)
+
+    def bump_after_commit():
+        for key in keys:
+            incr_version(key)
+
+    if keys:
+        transaction.on_commit(bump_after_commit)
@@ -0,0 +1,123 @@
+"""
+읽기 전용 복제본(replica) 라우팅
+
+DATABASE_REPLICA 가 설정되어 있으면 읽기 전용으로 표시한 메모 조회 뷰(목록, 상세, 검색, 통계)의
+메모 앱 읽기 쿼리를 복제본으로 보내고, 모든 쓰기는 기본(primary) DB 로 보냅니다. 세션과 사용자
+조회는 항상 기본 DB 를 사용합니다.
+
+    @replica_reads
+    def memo_stats(request): ...
+
+    class MemoListView(ListView):
+        replica_reads = True
+
+복제 지연 때문에 방금 쓴 메모가 보이지 않는 일이 없도록, 요청에서 메모를 쓰면 응답에 쿠키를
+남겨 DATABASE_REPLICA_PIN_SECONDS 동안 그 사용자(브라우저)의 조회도 기본 DB 에서 읽습니다.
+"""
+import contextvars
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS
+
+
+PIN_COOKIE = 'replica_pin'
+# 복제본으로 읽을 앱 (세션/인증은 로그인 직후에도 보이도록 기본 DB)
+REPLICA_APPS = {'memos'}
+SAFE_METHODS = {'GET', 'HEAD'}
+
+
+def replica_reads(view):
+    """함수 뷰의 읽기 쿼리를 복제본으로 보냄 (클래스 뷰는 replica_reads 속성 사용)"""
+    view.replica_reads = True
+    return view
+
+
+def uses_replica(view):
+    if getattr(view, 'replica_reads', False):
+        return True
+    # as_view() 로 만든 함수는 view_class 로 클래스 속성을 찾음
+    return getattr(getattr(view, 'view_class', None), 'replica_reads', False)
+
+
+class RoutingState:
+    __slots__ = ('replica', 'wrote')
+
+    def __init__(self):
+        self.replica = False
+        self.wrote = False
+
+
+# 비동기 뷰의 ORM 호출(sync_to_async)에도 전달되도록 contextvar 사용
+_routing_state = contextvars.ContextVar('memojjang_routing_state', default=None)
+
+
+class ReplicaRouter:
+    def db_for_read(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None and state.replica and model._meta.app_label in REPLICA_APPS:
+            return settings.DATABASE_REPLICA
+        return None
+
+    def db_for_write(self, model, **hints):
+        state = _routing_state.get()
+        if state is not None and model._meta.app_label in REPLICA_APPS:
+            state.wrote = True
+        # 복제본에서 읽은 객체도 기본 DB 에 저장
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # 복제본은 기본 DB 와 같은 데이터이므로 어느 쪽에서 읽은 객체든 연결 가능
+        databases = {DEFAULT_DB_ALIAS, settings.DATABASE_REPLICA}
+        if obj1._state.db in databases and obj2._state.db in databases:
+            return True
+        return None
+
+
+class ReplicaRoutingMiddleware:
+    """복제본으로 읽을 뷰를 표시하고, 메모를 쓴 요청 뒤에는 조회를 잠시 기본 DB 에 고정합니다."""
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        state = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+        return self._pin_writes(response, state)
+
+    async def __acall__(self, request):
+        state = RoutingState()
+        token = _routing_state.set(state)
+        try:
+            response = await self.get_response(request)
+        finally:
+            _routing_state.reset(token)
+        return self._pin_writes(response, state)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        state = _routing_state.get()
+        if state is not None:
+            state.replica = bool(
+                settings.DATABASE_REPLICA
+                and request.method in SAFE_METHODS
+                and PIN_COOKIE not in request.COOKIES
+                and uses_replica(view_func)
+            )
+
+    def _pin_writes(self, response, state):
+        if state.wrote and settings.DATABASE_REPLICA:
+            response.set_cookie(
+                PIN_COOKIE, '1', max_age=settings.DATABASE_REPLICA_PIN_SECONDS,
+                secure=settings.SESSION_COOKIE_SECURE, httponly=True, samesite='Lax',
+            )
+        return response
@@ -0,0 +1,284 @@
+"""
+요청 지표 수집 및 Prometheus 텍스트 형식 노출
+
+MetricsMiddleware 가 요청마다 URL 이름별 응답 시간, DB 쿼리 수와 시간, 응답 크기,
+상태 코드를 기록하고 /metrics 가 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다.
+
+여러 워커 프로세스로 실행할 때는 METRICS_DIR 을 지정합니다. 각 프로세스가 자신의
+지표를 METRICS_DIR/metrics-<pid>.json 에 주기적으로(최대 FLUSH_INTERVAL 초마다) 기록하고,
+/metrics 는 모든 파일을 합산해 응답합니다. 종료된 프로세스의 값도 합산에 남으므로
+서버를 시작하기 전에 디렉터리를 비워야 합니다.
+"""
+import atexit
+import contextvars
+import json
+import os
+import threading
+import time
+from bisect import bisect_left
+from pathlib import Path
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+from django.http import HttpResponse, HttpResponseForbidden
+from django.utils.crypto import constant_time_compare
+
+from .query_budget import check_query_budget
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+SIZE_BUCKETS = (100, 1000, 10_000, 100_000, 1_000_000, 10_000_000)
+
+# 이름: (종류, 설명, 히스토그램 구간)
+METRICS = {
+    'memojjang_http_requests_total': ('counter', 'HTTP 요청 수', None),
+    'memojjang_http_request_duration_seconds': ('histogram', '요청 처리 시간 (초)', LATENCY_BUCKETS),
+    'memojjang_http_request_db_queries': ('histogram', '요청당 DB 쿼리 수', QUERY_BUCKETS),
+    'memojjang_http_request_db_duration_seconds': ('histogram', '요청당 DB 쿼리 시간 (초)', LATENCY_BUCKETS),
+    'memojjang_http_response_size_bytes': ('histogram', '응답 본문 크기 (바이트, 스트리밍 응답 제외)', SIZE_BUCKETS),
+}
+
+FLUSH_INTERVAL = 1.0
+
+# 레이블 값이 무한히 늘어나지 않도록 알려진 메서드만 그대로 기록
+HTTP_METHODS = {'GET', 'HEAD', 'POST', 'PUT', 'PATCH', 'DELETE', 'OPTIONS'}
+
+
+class MetricsRegistry:
+    """프로세스 내 지표 저장소
+
+    카운터는 값 하나, 히스토그램은 [구간별 개수..., +Inf 구간 개수, 합계] 로 저장합니다.
+    구간별 개수는 누적이 아니므로 여러 프로세스의 값을 그대로 더할 수 있습니다.
+    """
+
+    def __init__(self, directory=None):
+        self.directory = Path(directory) if directory else None
+        self._values = {}
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+
+    def inc(self, name, labels, amount=1):
+        key = (name, labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def observe(self, name, labels, value):
+        buckets = METRICS[name][2]
+        key = (name, labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * (len(buckets) + 2)
+            entry[bisect_left(buckets, value)] += 1
+            entry[-1] += value
+
+    def clear(self):
+        with self._lock:
+            self._values.clear()
+
+    def snapshot(self):
+        with self._lock:
+            return [
+                [name, [list(label) for label in labels], list(value) if isinstance(value, list) else value]
+                for (name, labels), value in self._values.items()
+            ]
+
+    def _path(self, pid):
+        return self.directory / f'metrics-{pid}.json'
+
+    def flush(self):
+        """현재 프로세스의 지표를 파일에 기록합니다 (쓰는 도중에 읽히지 않도록 교체 방식)."""
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # preload 후 fork 된 워커도 자신의 파일에 쓰도록 pid 는 매번 확인
+        path = self._path(os.getpid())
+        tmp_path = path.with_suffix('.tmp')
+        tmp_path.write_text(json.dumps(self.snapshot()), encoding='utf-8')
+        os.replace(tmp_path, path)
+        self._last_flush = time.monotonic()
+
+    def maybe_flush(self):
+        if self.directory is not None and time.monotonic() - self._last_flush >= FLUSH_INTERVAL:
+            self.flush()
+
+    def collect(self):
+        """모든 프로세스의 지표를 합산해 {(이름, 레이블): 값} 으로 반환합니다."""
+        samples = [self.snapshot()]
+        if self.directory is not None and self.directory.exists():
+            own = self._path(os.getpid())
+            for path in self.directory.glob('metrics-*.json'):
+                if path != own:
+                    try:
+                        samples.append(json.loads(path.read_text(encoding='utf-8')))
+                    except (OSError, ValueError):
+                        # 다른 프로세스가 파일을 교체하는 중인 경우
+                        continue
+
+        merged = {}
+        for sample in samples:
+            for name, labels, value in sample:
+                if name not in METRICS:
+                    continue
+                key = (name, tuple(tuple(label) for label in labels))
+                if isinstance(value, list):
+                    current = merged.get(key)
+                    merged[key] = value if current is None else [a + b for a, b in zip(current, value)]
+                else:
+                    merged[key] = merged.get(key, 0) + value
+        return merged
+
+    def render(self):
+        """Prometheus 텍스트 형식으로 출력합니다."""
+        merged = self.collect()
+        lines = []
+        for name, (kind, help_text, buckets) in METRICS.items():
+            lines.append(f'# HELP {name} {help_text}')
+            lines.append(f'# TYPE {name} {kind}')
+            for (sample_name, labels), value in sorted(merged.items()):
+                if sample_name != name:
+                    continue
+                if kind == 'counter':
+                    lines.append(f'{name}{_format_labels(labels)} {_format_value(value)}')
+                    continue
+                cumulative = 0
+                for bound, count in zip((*buckets, '+Inf'), value[:-1]):
+                    cumulative += count
+                    le = bound if bound == '+Inf' else _format_value(bound)
+                    lines.append(f'{name}_bucket{_format_labels((*labels, ("le", le)))} {cumulative}')
+                lines.append(f'{name}_sum{_format_labels(labels)} {_format_value(value[-1])}')
+                lines.append(f'{name}_count{_format_labels(labels)} {cumulative}')
+        return '\n'.join(lines) + '\n'
+
+
+def _escape_label_value(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labels):
+    if not labels:
+        return ''
+    return '{' + ','.join(f'{key}="{_escape_label_value(value)}"' for key, value in labels) + '}'
+
+
+def _format_value(value):
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+registry = MetricsRegistry(getattr(settings, 'METRICS_DIR', None))
+if registry.directory is not None:
+    atexit.register(registry.flush)
+
+
+# 요청별 DB 쿼리 수/시간 - 비동기 뷰의 ORM 호출(sync_to_async)에도 전달되도록 contextvar 사용
+class RequestStats:
+    __slots__ = ('queries', 'db_time')
+
+    def __init__(self):
+        self.queries = 0
+        self.db_time = 0.0
+
+
+_request_stats = contextvars.ContextVar('memojjang_request_stats', default=None)
+
+
+def _count_query(execute, sql, params, many, context):
+    stats = _request_stats.get()
+    if stats is None:
+        return execute(sql, params, many, context)
+    start = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        stats.queries += 1
+        stats.db_time += time.perf_counter() - start
+
+
+def install_query_counter(connection, **kwargs):
+    if _count_query not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_count_query)
+
+
+connection_created.connect(install_query_counter, dispatch_uid='memojjang_metrics_query_counter')
+
+
+def record_request(request, response, stats, duration):
+    match = getattr(request, 'resolver_match', None)
+    view = match.view_name if match else '<unmatched>'
+    method = request.method if request.method in HTTP_METHODS else 'other'
+    labels = (('view', view),)
+
+    registry.inc(
+        'memojjang_http_requests_total',
+        (('view', view), ('method', method), ('status', str(response.status_code))),
+    )
+    registry.observe('memojjang_http_request_duration_seconds', labels, duration)
+    registry.observe('memojjang_http_request_db_queries', labels, stats.queries)
+    registry.observe('memojjang_http_request_db_duration_seconds', labels, stats.db_time)
+    if not response.streaming:
+        registry.observe('memojjang_http_response_size_bytes', labels, len(response.content))
+    registry.maybe_flush()
+
+
+class MetricsMiddleware:
+    """요청 지표를 기록하고 뷰별 쿼리 예산을 확인하는 미들웨어
+
+    동기/비동기 모두 지원하며, MIDDLEWARE 맨 앞에 둡니다.
+    """
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+        # 미들웨어가 로드되기 전에 열린 연결에도 쿼리 계측 추가
+        for connection in connections.all(initialized_only=True):
+            install_query_counter(connection)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+        record_request(request, response, stats, time.perf_counter() - start)
+        check_query_budget(request, stats.queries)
+        return response
+
+    async def __acall__(self, request):
+        stats = RequestStats()
+        token = _request_stats.set(stats)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _request_stats.reset(token)
+        record_request(request, response, stats, time.perf_counter() - start)
+        check_query_budget(request, stats.queries)
+        return response
+
+
+def metrics_view(request):
+    """Prometheus 수집 엔드포인트
+
+    METRICS_TOKEN 이 설정되어 있으면 Authorization: Bearer <토큰> 헤더가 필요하며,
+    관리자(staff) 로그인 사용자나 DEBUG 모드에서는 토큰 없이 볼 수 있습니다.
+    """
+    token = settings.METRICS_TOKEN
+    authorized = (
+        (token and constant_time_compare(request.headers.get('Authorization', ''), f'Bearer {token}'))
+        or request.user.is_staff
+        or settings.DEBUG
+    )
+    if not authorized:
+        return HttpResponseForbidden()
+    registry.flush()
+    return HttpResponse(registry.render(), content_type='text/plain; version=0.0.4; charset=utf-8')
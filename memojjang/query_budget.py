@@ -0,0 +1,54 @@
+"""
+뷰별 DB 쿼리 예산
+
+뷰가 요청 한 번에 실행할 수 있는 최대 쿼리 수를 선언합니다. 세션/사용자 조회 같은
+미들웨어의 쿼리와 TemplateResponse 렌더링 중의 쿼리까지 요청 전체를 셉니다
+(MetricsMiddleware 가 측정해 check_query_budget 을 호출). 템플릿 반복문 안의
+memo.author 접근 같은 N+1 쿼리가 생기면 QUERY_BUDGET_STRICT(기본값: DEBUG 또는 테스트
+실행 중)에서는 QueryBudgetExceeded 가 발생하고, 그 외에는 경고 로그만 남깁니다.
+
+    @query_budget(4)
+    def memo_stats(request): ...
+
+    class MemoListView(ListView):
+        query_budget = 5
+
+스트리밍 응답은 본문을 보내기 전까지의 쿼리만 셉니다.
+"""
+import logging
+
+from django.conf import settings
+
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(AssertionError):
+    pass
+
+
+def query_budget(max_queries):
+    """함수 뷰의 쿼리 예산 (클래스 뷰는 query_budget 속성 사용)"""
+    def decorator(view):
+        view.query_budget = max_queries
+        return view
+    return decorator
+
+
+def get_query_budget(view):
+    budget = getattr(view, 'query_budget', None)
+    if budget is None:
+        # as_view() 로 만든 함수는 view_class 로 클래스 속성을 찾음
+        budget = getattr(getattr(view, 'view_class', None), 'query_budget', None)
+    return budget
+
+
+def check_query_budget(request, queries):
+    match = getattr(request, 'resolver_match', None)
+    budget = get_query_budget(match.func) if match else None
+    if budget is None or queries <= budget:
+        return
+    message = f'{match.view_name} 뷰가 쿼리 {queries}개를 실행했습니다 (예산 {budget}개, {request.method} {request.path}).'
+    if settings.QUERY_BUDGET_STRICT:
+        raise QueryBudgetExceeded(message)
+    logger.warning(message)
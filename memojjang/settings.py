@@ -12,11 +12,16 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 
 from pathlib import Path
 import os
+import sys
 from dotenv import load_dotenv
+from django.core.exceptions import ImproperlyConfigured
 
 # Load environment variables
 load_dotenv()
 
+# manage.py test 실행 여부
+TESTING = sys.argv[1:2] == ['test']
+
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
 BASE_DIR = Path(__file__).resolve().parent.parent
 
@@ -53,17 +58,24 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    # 다른 미들웨어의 처리 시간과 쿼리까지 포함하도록 맨 앞에 둠
+    'memojjang.metrics.MetricsMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
-    'django.contrib.auth.middleware.AuthenticationMiddleware',
+    # 세션별로 검증한 사용자를 캐시해 요청마다 auth_user 를 조회하지 않음
+    'apps.users.middleware.CachedAuthenticationMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
+    'memojjang.db_router.ReplicaRoutingMiddleware',
 ]
 
-ROOT_URLCONF = 'memojjang.urls'
+# ASGI 서버는 비동기 조회 뷰를 사용하는 memojjang.urls_asgi 를 사용 (asgi.py 참고)
+ROOT_URLCONF = os.getenv('ROOT_URLCONF', 'memojjang.urls')
 
+# loaders 를 지정하지 않으면 Django 가 cached 로더로 감싸 템플릿을 한 번만 파싱합니다
+# (DEBUG 에서는 파일이 바뀌면 다시 읽음). loaders 를 직접 지정할 때도 cached 로더를 유지하세요.
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -85,12 +97,171 @@ WSGI_APPLICATION = 'memojjang.wsgi.application'
 # Database
 # https://docs.djangoproject.com/en/5.2/ref/settings/#databases
 
+# DB_ENGINE, DB_NAME, DB_USER, DB_PASSWORD, DB_HOST, DB_PORT (기본값: SQLite db/db.sqlite3)
+# 읽기 복제본은 DB_REPLICA_NAME 또는 DB_REPLICA_HOST 를 지정하면 켜지며, 지정하지 않은
+# DB_REPLICA_* 값은 기본 DB 설정을 따릅니다.
+#
+# 연결 재사용 (기본 DB 와 복제본 공통):
+# - DB_CONN_MAX_AGE: 요청이 끝난 뒤 연결을 유지할 시간(초, 기본값 60). 0 이면 요청마다 새로 연결
+# - DB_CONN_HEALTH_CHECKS: 유지한 연결을 요청에서 처음 쓰기 전에 확인 (기본값 True)
+# - DB_POOL: PostgreSQL 연결 풀 사용 (psycopg[pool] 필요, 이때 DB_CONN_MAX_AGE 는 0)
+#   DB_POOL_MIN_SIZE, DB_POOL_MAX_SIZE, DB_POOL_TIMEOUT(연결을 기다리는 최대 초)
+
+DATABASE_KEYS = ('ENGINE', 'NAME', 'USER', 'PASSWORD', 'HOST', 'PORT')
+PRIMARY_DATABASE_ENV = {
+    key: os.getenv(f'DB_{key}', default)
+    for key, default in zip(DATABASE_KEYS, ('django.db.backends.sqlite3', 'db/db.sqlite3', '', '', '', ''))
+}
+
+
+def database_config(env):
+    config = dict(env)
+    config['CONN_MAX_AGE'] = int(os.getenv('DB_CONN_MAX_AGE', '60'))
+    config['CONN_HEALTH_CHECKS'] = os.getenv('DB_CONN_HEALTH_CHECKS', 'True').lower() == 'true'
+    if config['ENGINE'] == 'django.db.backends.sqlite3':
+        # 상대 경로는 프로젝트 기준
+        config['NAME'] = BASE_DIR / config['NAME']
+        config['OPTIONS'] = {
+            # 트랜잭션 시작 시 쓰기 잠금을 잡아, 읽은 뒤 쓰는 트랜잭션이 잠금 승격에 실패하지 않도록 함
+            'transaction_mode': os.getenv('SQLITE_TRANSACTION_MODE', 'IMMEDIATE') or None,
+        }
+    if os.getenv('DB_POOL', 'False').lower() == 'true':
+        if config['ENGINE'] != 'django.db.backends.postgresql':
+            raise ImproperlyConfigured('DB_POOL 은 PostgreSQL 에서만 사용할 수 있습니다.')
+        config['OPTIONS'] = {
+            'pool': {
+                'min_size': int(os.getenv('DB_POOL_MIN_SIZE', '2')),
+                'max_size': int(os.getenv('DB_POOL_MAX_SIZE', '10')),
+                'timeout': float(os.getenv('DB_POOL_TIMEOUT', '10')),
+            },
+        }
+        # 풀이 연결을 관리하므로 요청 사이에 연결을 붙잡아 두지 않음
+        config['CONN_MAX_AGE'] = 0
+    return config
+
+
 DATABASES = {
+    'default': database_config(PRIMARY_DATABASE_ENV),
+}
+if TESTING:
+    # 라우터 테스트용 복제본: 기본 DB 와 별도의 테스트 DB ('replica' 를 사용하는 테스트에서만 생성)
+    DATABASES['replica'] = database_config(PRIMARY_DATABASE_ENV)
+    if DATABASES['replica']['ENGINE'] != 'django.db.backends.sqlite3':
+        DATABASES['replica']['TEST'] = {'NAME': f"test_{PRIMARY_DATABASE_ENV['NAME']}_replica"}
+elif os.getenv('DB_REPLICA_NAME') or os.getenv('DB_REPLICA_HOST'):
+    DATABASES['replica'] = database_config({
+        key: os.getenv(f'DB_REPLICA_{key}', PRIMARY_DATABASE_ENV[key]) for key in DATABASE_KEYS
+    })
+
+# 읽기 전용 메모 조회 뷰를 보낼 복제본 (memojjang/db_router.py). 테스트에서는 라우터 테스트에서만 켭니다.
+DATABASE_ROUTERS = ['memojjang.db_router.ReplicaRouter']
+DATABASE_REPLICA = 'replica' if 'replica' in DATABASES and not TESTING else None
+# 메모를 쓴 뒤 그 사용자의 조회를 기본 DB 에서 읽는 시간 (복제 지연보다 길게)
+DATABASE_REPLICA_PIN_SECONDS = int(os.getenv('DB_REPLICA_PIN_SECONDS', '5'))
+
+# SQLite 연결마다 적용할 PRAGMA (memojjang/sqlite.py). 빈 값이면 SQLite 기본값 사용.
+SQLITE_PRAGMAS = {
+    # WAL: 읽기와 쓰기가 서로 막지 않음 (DB 파일 옆에 -wal, -shm 파일 생성)
+    'journal_mode': os.getenv('SQLITE_JOURNAL_MODE', 'WAL'),
+    # WAL 에서는 NORMAL 도 손상 없이 안전 (전원 장애 시 마지막 커밋만 잃을 수 있음)
+    'synchronous': os.getenv('SQLITE_SYNCHRONOUS', 'NORMAL'),
+    # 잠금을 기다리는 최대 시간 (밀리초)
+    'busy_timeout': os.getenv('SQLITE_BUSY_TIMEOUT', '5000'),
+    # 페이지 캐시 크기 (음수는 KiB 단위, -20000 = 약 20MB)
+    'cache_size': os.getenv('SQLITE_CACHE_SIZE', '-20000'),
+    # 메모리 맵 I/O 크기 (바이트)
+    'mmap_size': os.getenv('SQLITE_MMAP_SIZE', str(128 * 1024 * 1024)),
+    'temp_store': os.getenv('SQLITE_TEMP_STORE', 'MEMORY'),
+}
+
+
+# Cache
+# CACHE_BACKEND: locmem (기본값) | file | redis | dummy
+# 테스트에서는 테스트 간 캐시 공유를 막기 위해 기본값이 dummy 입니다.
+
+CACHE_BACKENDS = {
+    'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+    'file': 'django.core.cache.backends.filebased.FileBasedCache',
+    'redis': 'django.core.cache.backends.redis.RedisCache',
+    'dummy': 'django.core.cache.backends.dummy.DummyCache',
+}
+CACHE_BACKEND = os.getenv('CACHE_BACKEND', 'dummy' if TESTING else 'locmem')
+CACHE_LOCATIONS = {
+    'locmem': 'memojjang',
+    'file': str(BASE_DIR / 'cache'),
+    'redis': 'redis://127.0.0.1:6379/1',
+    'dummy': '',
+}
+
+CACHES = {
     'default': {
-        'ENGINE': 'django.db.backends.sqlite3',
-        'NAME': BASE_DIR / 'db' / 'db.sqlite3',
+        'BACKEND': CACHE_BACKENDS[CACHE_BACKEND],
+        'LOCATION': os.getenv('CACHE_LOCATION', CACHE_LOCATIONS[CACHE_BACKEND]),
+        'KEY_PREFIX': os.getenv('CACHE_KEY_PREFIX', 'memojjang'),
     }
 }
+# 워커끼리 공유하는 캐시 (file 은 같은 서버의 워커끼리)
+SHARED_CACHE_BACKENDS = ('redis', 'file')
+
+
+# Sessions
+# SESSION_BACKEND: cached_db | cache | db (기본값: 공유 캐시면 cached_db, 아니면 db)
+# cached_db 는 캐시에서 읽고 없을 때만 DB 에서 읽고, cache 는 DB 를 전혀 쓰지 않습니다(캐시가 비워지면
+# 로그아웃). 로그아웃해도 세션은 그 워커의 캐시에서만 지워지므로 두 방식 모두 워커끼리 캐시를 공유해야
+# 합니다. locmem 은 워커마다 캐시가 따로라 다른 워커에 로그아웃한 세션이 남으므로, DEBUG 가 꺼져 있으면
+# 캐시 세션을 쓸 수 없습니다.
+
+SESSION_ENGINES = {
+    'cached_db': 'django.contrib.sessions.backends.cached_db',
+    'cache': 'django.contrib.sessions.backends.cache',
+    'db': 'django.contrib.sessions.backends.db',
+}
+
+def session_engine(cache_backend, debug):
+    shared = cache_backend in SHARED_CACHE_BACKENDS
+    backend = os.getenv('SESSION_BACKEND') or ('cached_db' if shared else 'db')
+    if backend != 'db' and not shared and not debug:
+        raise ImproperlyConfigured(
+            f'SESSION_BACKEND={backend} 는 워커끼리 공유하는 캐시(CACHE_BACKEND=redis 또는 file)가 필요합니다.'
+        )
+    return SESSION_ENGINES[backend]
+
+
+SESSION_ENGINE = session_engine(CACHE_BACKEND, DEBUG)
+
+# 메시지는 세션 대신 쿠키에 저장 (메시지를 남길 때 세션을 다시 쓰지 않음)
+MESSAGE_STORAGE = 'django.contrib.messages.storage.cookie.CookieStorage'
+
+# 인증한 사용자 캐시 유지 시간(초). 사용자를 저장/삭제하면 즉시 무효화됩니다.
+USER_CACHE_TIMEOUT = int(os.getenv('USER_CACHE_TIMEOUT', '60'))
+# 인증한 사용자 캐시는 공유 캐시에서만 사용 (locmem 은 다른 워커의 비밀번호 변경/비활성화가
+# 보이지 않아 이전 세션이 USER_CACHE_TIMEOUT 동안 로그인된 채로 남음)
+USER_CACHE_ENABLED = CACHE_BACKEND in SHARED_CACHE_BACKENDS
+
+# 메모 목록/검색 캐시 유지 시간(초). 메모가 바뀌면 사용자 버전이 올라가 즉시 무효화됩니다.
+MEMO_CACHE_TIMEOUT = int(os.getenv('MEMO_CACHE_TIMEOUT', '300'))
+# 목록/검색 캐시는 공유 캐시에서만 사용 (locmem 은 워커마다 버전이 따로라 다른 워커에서 작성한
+# 메모가 MEMO_CACHE_TIMEOUT 동안 보이지 않음)
+MEMO_CACHE_ENABLED = CACHE_BACKEND in SHARED_CACHE_BACKENDS
+
+# 제목 자동완성 색인을 메모리에 유지할 최대 사용자 수 (LRU)
+MEMO_AUTOCOMPLETE_MAX_USERS = int(os.getenv('MEMO_AUTOCOMPLETE_MAX_USERS', '1000'))
+# 제목 자동완성 색인을 다시 만들기까지의 최대 시간(초). 메모가 바뀌면 사용자 버전이 올라가 즉시 다시 만듭니다.
+MEMO_AUTOCOMPLETE_TTL = int(os.getenv('MEMO_AUTOCOMPLETE_TTL', '300'))
+
+# SSE 연결 유지(heartbeat) 및 다른 프로세스의 변경 확인 주기 (초)
+MEMO_EVENTS_HEARTBEAT = int(os.getenv('MEMO_EVENTS_HEARTBEAT', '15'))
+
+# 일괄 처리 API 한 요청당 최대 항목 수
+MEMO_API_BULK_LIMIT = int(os.getenv('MEMO_API_BULK_LIMIT', '500'))
+
+# 요청 지표(/metrics). 여러 워커 프로세스의 값을 합산하려면 METRICS_DIR 을 지정하고
+# 서버 시작 전에 비웁니다. METRICS_TOKEN 을 지정하면 Bearer 토큰으로 수집할 수 있습니다.
+METRICS_DIR = os.getenv('METRICS_DIR') or None
+METRICS_TOKEN = os.getenv('METRICS_TOKEN', '')
+
+# 뷰별 쿼리 예산(memojjang/query_budget.py)을 넘으면 예외 발생. 끄면 경고 로그만 남깁니다.
+QUERY_BUDGET_STRICT = os.getenv('QUERY_BUDGET_STRICT', str(DEBUG or TESTING)).lower() == 'true'
 
 
 # Password validation
@@ -137,6 +308,14 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 CRISPY_ALLOWED_TEMPLATE_PACKS = "bootstrap4"
 CRISPY_TEMPLATE_PACK = "bootstrap4"
 
+# 메모 검색 백엔드: 'ngram' (n-gram 역색인), 'fulltext' (SQLite FTS5 / PostgreSQL), 'icontains'
+# fulltext 의 인덱스(FTS5 테이블과 트리거, GIN 인덱스)는 메모를 쓸 때마다 갱신되므로 fulltext 일 때만
+# 만들어집니다. 바꾼 뒤에는 migrate 를 실행해 인덱스를 만들거나 삭제하세요.
+MEMO_SEARCH_BACKEND = os.getenv('MEMO_SEARCH_BACKEND', 'ngram')
+
+# 메모 목록 페이지네이션: 'cursor' (키셋, COUNT 없음), 'offset' (페이지 번호)
+MEMO_LIST_PAGINATION = os.getenv('MEMO_LIST_PAGINATION', 'cursor')
+
 # Login/Logout redirects
 LOGIN_REDIRECT_URL = '/'
 LOGOUT_REDIRECT_URL = '/'
@@ -204,6 +383,11 @@ LOGGING = {
             'level': 'DEBUG',
             'propagate': True,
         },
+        'memojjang': {
+            'handlers': ['file', 'console'] if DEBUG else ['file'],
+            'level': os.getenv('LOG_LEVEL', 'INFO'),
+            'propagate': True,
+        },
     },
 }
 
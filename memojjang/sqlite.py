@@ -0,0 +1,38 @@
+"""
+SQLite 연결 설정 (PRAGMA)
+
+기본 설정의 SQLite 는 rollback journal 이라 쓰기 중에는 읽기도 막히고, 동시에 쓰면
+'database is locked' 가 발생합니다. 연결이 만들어질 때(connection_created) SQLITE_PRAGMAS
+설정을 적용해 WAL 모드(읽기와 쓰기가 서로 막지 않음)와 busy_timeout(잠금 대기) 등을
+사용합니다. 읽은 뒤 쓰는 트랜잭션의 잠금 충돌은 DATABASES 의 transaction_mode
+(IMMEDIATE) 로 막습니다.
+
+값이 빈 문자열이나 None 인 PRAGMA 는 적용하지 않습니다 (SQLite 기본값 사용).
+"""
+import re
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+
+
+PRAGMA_VALUE = re.compile(r'^-?[A-Za-z0-9_]+$')
+
+
+def pragma_statements(pragmas):
+    statements = []
+    for name, value in pragmas.items():
+        if value is None or value == '':
+            continue
+        if not PRAGMA_VALUE.match(name) or not PRAGMA_VALUE.match(str(value)):
+            raise ImproperlyConfigured(f'잘못된 SQLite PRAGMA 설정: {name}={value!r}')
+        statements.append(f'PRAGMA {name} = {value}')
+    return statements
+
+
+def configure_sqlite(connection, **kwargs):
+    """새 SQLite 연결에 SQLITE_PRAGMAS 를 적용합니다."""
+    if connection.vendor != 'sqlite':
+        return
+    # 요청 지표나 쿼리 예산에 포함되지 않도록 장고 커서를 거치지 않고 실행
+    for statement in pragma_statements(getattr(settings, 'SQLITE_PRAGMAS', {})):
+        connection.connection.execute(statement)
@@ -16,11 +16,12 @@ Including another URLconf
 """
 from django.contrib import admin
 from django.urls import path, include
-from . import views
+from . import metrics, views
 
 urlpatterns = [
     path('admin/', admin.site.urls),
     path('', views.home_view, name='home'),
     path('users/', include('apps.users.urls')),
     path('memos/', include('apps.memos.urls')),
+    path('metrics', metrics.metrics_view, name='metrics'),
 ]
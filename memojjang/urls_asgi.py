@@ -0,0 +1,14 @@
+"""
+ASGI 배포용 URL 설정
+
+memojjang/asgi.py 가 ROOT_URLCONF 기본값으로 사용하며, urls.py 와 같지만
+메모 조회 뷰를 비동기 버전(apps/memos/urls_async.py)으로 연결합니다.
+"""
+from django.urls import include, path
+
+from .urls import urlpatterns as sync_urlpatterns
+
+urlpatterns = [
+    path('memos/', include('apps.memos.urls_async')) if str(pattern.pattern) == 'memos/' else pattern
+    for pattern in sync_urlpatterns
+]
@@ -1,7 +1,10 @@
 from django.shortcuts import render, redirect
 from django.contrib.auth.decorators import login_required
 
+from .query_budget import query_budget
 
+
+@query_budget(2)
 def home_view(request):
     """홈페이지 뷰"""
     if request.user.is_authenticated:
@@ -1,266 +1,285 @@
 #!/usr/bin/env python
 """
-메모짱 성능 테스트 스크립트
+메모짱 성능 테스트 (벤치마크)
+
+데이터셋 크기별로 목록, 깊은 페이지, 검색, 통계, 작성, 수정 시나리오를 측정하고
+결과를 JSON 으로 저장한 뒤 기준 결과와 비교합니다. 기준보다 느려진(회귀) 시나리오가
+있으면 종료 코드 1 을 반환합니다. 세부 구현은 benchmarks/ 패키지를 참고하세요.
+
+    python performance_test.py                          # 1k, 10k 메모
+    python performance_test.py --sizes 1k,10k,100k,1m --iterations 50
+    python performance_test.py --scenarios list,search --baseline benchmarks/baseline.json
+    python performance_test.py --save-baseline          # 현재 결과를 기준 결과로 저장
+
+--load 를 지정하면 실제 서버(gunicorn/uvicorn 워커, 없으면 runserver)를 띄우고 여러 클라이언트
+프로세스로 읽기/쓰기가 섞인 요청을 보내 엔드포인트별 처리량, 지연 시간, 오류율을 측정합니다.
+
+    python performance_test.py --load --sizes 10k --workers 4 --clients 16 --duration 30
+
+--render 를 지정하면 메모 목록 화면을 카드 수별로 렌더링해 템플릿 로더 캐시와 카드 조각 캐시의
+효과를 비교합니다 (데이터셋은 --sizes 중 가장 작은 크기 사용).
+
+    python performance_test.py --render --cards 10,100 --iterations 100
 """
+import argparse
+import logging
 import os
 import sys
+
 import django
-import time
-import statistics
-from concurrent.futures import ThreadPoolExecutor, as_completed
-
-# Django 설정
-os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'memojjang.settings')
-django.setup()
-
-# 테스트를 위해 ALLOWED_HOSTS 설정
-from django.conf import settings
-if 'testserver' not in settings.ALLOWED_HOSTS:
-    settings.ALLOWED_HOSTS.append('testserver')
-
-from django.test import Client
-from django.contrib.auth.models import User
-from apps.memos.models import Memo
-
-
-class PerformanceTester:
-    def __init__(self):
-        self.client = Client()
-        self.setup_test_data()
-        
-    def setup_test_data(self):
-        """테스트 데이터 설정"""
-        # 테스트 사용자 생성
-        self.user, created = User.objects.get_or_create(
-            username='perftest_user',
-            defaults={'password': 'testpass123'}
-        )
-        
-        # 기존 테스트 메모 삭제
-        Memo.objects.filter(author=self.user).delete()
-        
-        # 대량 메모 생성 (성능 테스트용)
-        print("테스트 데이터 생성 중...")
-        memos = []
-        for i in range(1000):
-            memo = Memo(
-                title=f'Performance Test Memo {i+1}',
-                content=f'This is a performance test memo content. ' * 20,
-                author=self.user,
-                priority=['low', 'normal', 'high', 'urgent'][i % 4],
-                is_pinned=(i % 10 == 0)
+
+
+def parse_size(value):
+    units = {'k': 1_000, 'm': 1_000_000}
+    value = value.strip().lower()
+    try:
+        if value[-1:] in units:
+            return int(float(value[:-1]) * units[value[-1]])
+        return int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f'잘못된 데이터셋 크기: {value}')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='메모짱 벤치마크')
+    parser.add_argument('--sizes', default='1k,10k',
+                        help='쉼표로 구분한 데이터셋 메모 수 (예: 1k,10k,100k,1m)')
+    parser.add_argument('--scenarios', help='쉼표로 구분한 시나리오 이름 (기본값: 전체, --list 로 확인)')
+    parser.add_argument('--iterations', type=int, default=30, help='시나리오별 측정 횟수')
+    parser.add_argument('--warmup', type=int, default=5, help='측정 전 실행 횟수')
+    parser.add_argument('--warm-cache', action='store_true',
+                        help='반복마다 캐시를 비우지 않음 (기본값: 매번 비워 DB 조회 비용을 측정)')
+    parser.add_argument('--output', help='결과 JSON 경로 (기본값: benchmarks/results/<시각>.json)')
+    parser.add_argument('--baseline', default='benchmarks/baseline.json', help='비교할 기준 결과 JSON')
+    parser.add_argument('--save-baseline', action='store_true', help='이번 결과를 --baseline 경로에 저장')
+    parser.add_argument('--threshold', type=float, default=0.2,
+                        help='회귀로 판단할 p50/p95 증가 비율 (기본값: 0.2 = 20%%)')
+    parser.add_argument('--rebuild', action='store_true', help='벤치마크 DB 를 지우고 데이터를 다시 생성')
+    parser.add_argument('--conn-max-age', type=int,
+                        help='요청 사이 DB 연결 유지 시간(초, 기본값: DB_CONN_MAX_AGE 설정). 0 이면 요청마다 새로 연결')
+    parser.add_argument('--list', action='store_true', help='시나리오 목록 출력')
+
+    load = parser.add_argument_group('부하 테스트 (--load)')
+    load.add_argument('--load', action='store_true', help='실제 서버를 띄워 다중 프로세스 부하 테스트 실행')
+    load.add_argument('--server', choices=['gunicorn', 'uvicorn', 'runserver'],
+                      help='서버 종류 (기본값: 설치된 gunicorn, uvicorn, runserver 순)')
+    load.add_argument('--workers', type=int, default=os.cpu_count() or 2, help='서버 워커 프로세스 수')
+    load.add_argument('--clients', type=int, default=8, help='클라이언트 프로세스 수 (동시 사용자)')
+    load.add_argument('--duration', type=float, default=20, help='측정 시간 (초)')
+    load.add_argument('--load-warmup', type=float, default=3, help='측정 전 요청을 보내는 시간 (초)')
+    load.add_argument('--mix', default='list=40,detail=25,search=15,create=10,update=10',
+                      help='엔드포인트별 요청 비율')
+
+    sqlite = parser.add_argument_group('SQLite 동시성 (--sqlite-concurrency, --duration/--load-warmup 공용)')
+    sqlite.add_argument('--sqlite-concurrency', action='store_true',
+                        help='SQLite 기본 설정과 현재 설정의 동시 읽기/쓰기 처리량 비교')
+    sqlite.add_argument('--readers', type=int, default=4, help='읽기 프로세스 수')
+    sqlite.add_argument('--writers', type=int, default=4, help='쓰기 프로세스 수')
+
+    render = parser.add_argument_group('템플릿 렌더링 (--render, --iterations/--warmup 공용)')
+    render.add_argument('--render', action='store_true',
+                        help='메모 목록 렌더링 시간을 템플릿 로더/카드 조각 캐시 사용 여부별로 비교')
+    render.add_argument('--cards', default='10,100', help='쉼표로 구분한 한 화면의 카드 수')
+    args = parser.parse_args(argv)
+    args.sizes = [parse_size(size) for size in args.sizes.split(',')]
+    args.cards = [parse_size(cards) for cards in args.cards.split(',')]
+    if args.iterations < 1:
+        parser.error('--iterations 는 1 이상이어야 합니다.')
+    return args
+
+
+def setup_django():
+    os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'memojjang.settings')
+    django.setup()
+
+    from django.conf import settings
+    # 운영과 같은 조건으로 측정 (DEBUG 쿼리 로그 없음, 쿼리 예산 초과는 로그만)
+    settings.DEBUG = False
+    settings.QUERY_BUDGET_STRICT = False
+    # 벤치마크 DB 만 사용 (복제본이 설정되어 있어도 조회를 보내지 않음)
+    settings.DATABASE_REPLICA = None
+    logging.disable(logging.DEBUG)
+    if 'testserver' not in settings.ALLOWED_HOSTS:
+        settings.ALLOWED_HOSTS.append('testserver')
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    setup_django()
+
+    from django.core.cache import cache
+    from django.db import connection
+    from django.utils import timezone
+
+    from benchmarks.dataset import benchmark_database
+    from benchmarks.report import compare, environment, format_results, load_report, write_report
+    from benchmarks.scenarios import SCENARIOS, BenchmarkContext
+    from benchmarks.timing import measure
+
+    if args.conn_max_age is not None:
+        connection.settings_dict['CONN_MAX_AGE'] = args.conn_max_age
+        # --load 의 서버 프로세스에도 적용
+        os.environ['DB_CONN_MAX_AGE'] = str(args.conn_max_age)
+    if args.list:
+        for name, (description, _) in SCENARIOS.items():
+            print(f'{name:<18} {description}')
+        return 0
+    if args.load:
+        return run_load(args)
+    if args.sqlite_concurrency:
+        return run_sqlite_concurrency(args)
+    if args.render:
+        return run_render(args)
+
+    names = args.scenarios.split(',') if args.scenarios else list(SCENARIOS)
+    unknown = set(names) - set(SCENARIOS)
+    if unknown:
+        print(f"알 수 없는 시나리오: {', '.join(sorted(unknown))}", file=sys.stderr)
+        return 2
+
+    results = []
+    for size in args.sizes:
+        print(f'\n📦 메모 {size:,}개')
+        with benchmark_database(size, rebuild=args.rebuild) as user:
+            context = BenchmarkContext(user, size)
+            for name in names:
+                description, run_scenario = SCENARIOS[name]
+                with run_scenario(context) as func:
+                    result = measure(
+                        func, args.iterations, args.warmup, before=None if args.warm_cache else cache.clear,
+                    )
+                results.append({'size': size, 'scenario': name, **result})
+                print(f"  {name:<18} p50 {result['p50_ms']:8.3f}ms  p95 {result['p95_ms']:8.3f}ms  "
+                      f"쿼리 {result['queries']}  연결 {result['connect_ms']:.3f}ms  - {description}")
+
+    report = {
+        'environment': environment(
+            iterations=args.iterations, warmup=args.warmup, warm_cache=args.warm_cache,
+        ),
+        'results': results,
+    }
+    output = args.output or f"benchmarks/results/{timezone.now():%Y%m%d-%H%M%S}.json"
+    write_report(report, output)
+
+    changes, regressions = {}, []
+    if not args.save_baseline and os.path.exists(args.baseline):
+        changes, regressions = compare(report, load_report(args.baseline), args.threshold)
+
+    print('\n' + format_results(report, changes))
+    print(f'\n결과 저장: {output}')
+    if args.save_baseline:
+        write_report(report, args.baseline)
+        print(f'기준 결과 저장: {args.baseline}')
+    elif not os.path.exists(args.baseline):
+        print(f'기준 결과({args.baseline})가 없어 비교하지 않았습니다. --save-baseline 으로 저장하세요.')
+    if regressions:
+        print(f'\n❌ 성능 회귀 {len(regressions)}건 (기준 대비 {args.threshold:.0%} 이상 느려짐 또는 쿼리 증가)')
+        for regression in regressions:
+            print(f'   {regression}')
+        return 1
+    if changes:
+        print('\n✅ 기준 대비 성능 회귀 없음')
+    return 0
+
+
+def run_load(args):
+    from django.utils import timezone
+
+    from benchmarks.dataset import benchmark_database
+    from benchmarks.load import default_server, format_load, parse_mix, run_load_test
+    from benchmarks.report import environment, write_report
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        print(f'--mix: {e}', file=sys.stderr)
+        return 2
+    server = args.server or default_server()
+    if server == 'runserver':
+        print('⚠️  runserver 는 단일 프로세스(요청별 스레드)로 실행되며 --workers 는 무시됩니다. '
+              '실제 처리량은 gunicorn 또는 uvicorn 을 설치해 측정하세요.')
+        args.workers = 1
+    results = []
+    for size in args.sizes:
+        print(f'\n📦 메모 {size:,}개 - {server}, 워커 {args.workers}개, 클라이언트 {args.clients}개, {args.duration:g}초')
+        with benchmark_database(size, rebuild=args.rebuild) as user:
+            rows = run_load_test(
+                user, server, args.workers, args.clients, args.duration, args.load_warmup, mix,
             )
-            memos.append(memo)
-        
-        Memo.objects.bulk_create(memos, batch_size=100)
-        print(f"✅ {len(memos)}개의 테스트 메모 생성 완료")
-        
-    def measure_response_time(self, url, params=None):
-        """응답 시간 측정"""
-        start_time = time.time()
-        response = self.client.get(url, params or {})
-        end_time = time.time()
-        
-        return {
-            'response_time': end_time - start_time,
-            'status_code': response.status_code,
-            'content_length': len(response.content)
-        }
-    
-    def test_memo_list_performance(self, iterations=10):
-        """메모 목록 성능 테스트"""
-        print(f"\n🔍 메모 목록 성능 테스트 ({iterations}회 반복)")
-        
-        # 로그인
-        self.client.force_login(self.user)
-        
-        response_times = []
-        for i in range(iterations):
-            result = self.measure_response_time('/memos/')
-            response_times.append(result['response_time'])
-            print(f"  {i+1:2d}. {result['response_time']:.3f}초 (상태: {result['status_code']})")
-        
-        # 통계 계산
-        avg_time = statistics.mean(response_times)
-        min_time = min(response_times)
-        max_time = max(response_times)
-        
-        print(f"\n📊 메모 목록 성능 결과:")
-        print(f"   평균: {avg_time:.3f}초")
-        print(f"   최소: {min_time:.3f}초")
-        print(f"   최대: {max_time:.3f}초")
-        
-        return {
-            'avg': avg_time,
-            'min': min_time,
-            'max': max_time
-        }
-    
-    def test_search_performance(self, iterations=10):
-        """검색 성능 테스트"""
-        print(f"\n🔍 검색 성능 테스트 ({iterations}회 반복)")
-        
-        search_queries = [
-            'Performance',
-            'Test',
-            'Memo',
-            'content',
-            '1'
-        ]
-        
-        all_times = []
-        
-        for query in search_queries:
-            print(f"\n  검색어: '{query}'")
-            response_times = []
-            
-            for i in range(iterations):
-                result = self.measure_response_time(
-                    '/memos/search/ajax/', 
-                    {'q': query}
-                )
-                response_times.append(result['response_time'])
-                print(f"    {i+1:2d}. {result['response_time']:.3f}초")
-            
-            avg_time = statistics.mean(response_times)
-            all_times.extend(response_times)
-            print(f"    평균: {avg_time:.3f}초")
-        
-        # 전체 통계
-        overall_avg = statistics.mean(all_times)
-        print(f"\n📊 검색 성능 전체 결과:")
-        print(f"   전체 평균: {overall_avg:.3f}초")
-        
-        return overall_avg
-    
-    def test_concurrent_access(self, concurrent_users=5, requests_per_user=5):
-        """동시 접속 성능 테스트"""
-        print(f"\n🚀 동시 접속 테스트 ({concurrent_users}명, 각 {requests_per_user}회 요청)")
-        
-        def make_requests(user_id):
-            """각 사용자가 수행할 요청"""
-            client = Client()
-            client.force_login(self.user)
-            
-            times = []
-            for i in range(requests_per_user):
-                start_time = time.time()
-                response = client.get('/memos/')
-                end_time = time.time()
-                
-                times.append(end_time - start_time)
-            
-            return times
-        
-        # 동시 실행
-        all_times = []
-        start_time = time.time()
-        
-        with ThreadPoolExecutor(max_workers=concurrent_users) as executor:
-            futures = [
-                executor.submit(make_requests, i) 
-                for i in range(concurrent_users)
-            ]
-            
-            for future in as_completed(futures):
-                user_times = future.result()
-                all_times.extend(user_times)
-        
-        end_time = time.time()
-        total_time = end_time - start_time
-        
-        # 결과 분석
-        avg_response_time = statistics.mean(all_times)
-        total_requests = concurrent_users * requests_per_user
-        requests_per_second = total_requests / total_time
-        
-        print(f"\n📊 동시 접속 테스트 결과:")
-        print(f"   총 요청 수: {total_requests}")
-        print(f"   총 소요 시간: {total_time:.3f}초")
-        print(f"   평균 응답 시간: {avg_response_time:.3f}초")
-        print(f"   초당 요청 수: {requests_per_second:.1f} RPS")
-        
-        return {
-            'total_requests': total_requests,
-            'total_time': total_time,
-            'avg_response_time': avg_response_time,
-            'requests_per_second': requests_per_second
-        }
-    
-    def test_database_queries(self):
-        """데이터베이스 쿼리 성능 테스트"""
-        print(f"\n💾 데이터베이스 쿼리 성능 테스트")
-        
-        from django.db import connection
-        from django.test.utils import override_settings
-        
-        # 쿼리 로깅 활성화
-        with override_settings(DEBUG=True):
-            connection.queries_log.clear()
-            
-            # 메모 목록 페이지 요청
-            self.client.force_login(self.user)
-            response = self.client.get('/memos/')
-            
-            # 쿼리 분석
-            queries = connection.queries
-            total_time = sum(float(q['time']) for q in queries)
-            
-            print(f"   실행된 쿼리 수: {len(queries)}")
-            print(f"   총 쿼리 시간: {total_time:.3f}초")
-            if len(queries) > 0:
-                print(f"   평균 쿼리 시간: {total_time/len(queries):.3f}초")
-            else:
-                print("   쿼리가 실행되지 않았습니다.")
-            
-            # 느린 쿼리 찾기
-            slow_queries = [q for q in queries if float(q['time']) > 0.01]
-            if slow_queries:
-                print(f"   느린 쿼리 ({len(slow_queries)}개):")
-                for q in slow_queries[:3]:  # 상위 3개만 표시
-                    print(f"     {float(q['time']):.3f}초: {q['sql'][:100]}...")
-        
-        return {
-            'query_count': len(queries),
-            'total_time': total_time,
-            'slow_queries': len(slow_queries) if 'slow_queries' in locals() else 0
-        }
-    
-    def run_all_tests(self):
-        """모든 성능 테스트 실행"""
-        print("🎯 메모짱 성능 테스트 시작")
-        print("=" * 50)
-        
-        # 각 테스트 실행
-        list_results = self.test_memo_list_performance()
-        search_results = self.test_search_performance()
-        concurrent_results = self.test_concurrent_access()
-        db_results = self.test_database_queries()
-        
-        # 종합 결과
-        print("\n" + "=" * 50)
-        print("📊 종합 성능 테스트 결과")
-        print("=" * 50)
-        
-        print(f"메모 목록 평균 응답시간: {list_results['avg']:.3f}초")
-        print(f"검색 평균 응답시간: {search_results:.3f}초")
-        print(f"동시 접속 처리량: {concurrent_results['requests_per_second']:.1f} RPS")
-        print(f"데이터베이스 쿼리 수: {db_results['query_count']}개")
-        
-        # 성능 등급 판정
-        if list_results['avg'] < 0.5:
-            print("✅ 성능 등급: 우수")
-        elif list_results['avg'] < 1.0:
-            print("⚠️  성능 등급: 보통")
-        else:
-            print("❌ 성능 등급: 개선 필요")
-        
-        # 정리
-        print(f"\n🧹 테스트 데이터 정리...")
-        Memo.objects.filter(author=self.user).delete()
-        print("✅ 정리 완료")
+        print(format_load(rows))
+        results.extend({'size': size, **row} for row in rows)
+
+    report = {
+        'environment': environment(
+            mode='load', server=server, workers=args.workers, clients=args.clients,
+            duration=args.duration, warmup=args.load_warmup, mix=mix,
+        ),
+        'results': results,
+    }
+    output = args.output or f"benchmarks/results/load-{timezone.now():%Y%m%d-%H%M%S}.json"
+    write_report(report, output)
+    print(f'\n결과 저장: {output}')
+    return 1 if any(row['error_rate'] for row in results) else 0
+
+
+def run_sqlite_concurrency(args):
+    from django.db import connection
+    from django.utils import timezone
+
+    from benchmarks.dataset import benchmark_database
+    from benchmarks.report import environment, write_report
+    from benchmarks.sqlite_concurrency import format_concurrency, run_concurrency_test
+
+    if connection.vendor != 'sqlite':
+        print('--sqlite-concurrency 는 SQLite 데이터베이스에서만 실행할 수 있습니다.', file=sys.stderr)
+        return 2
+    results = []
+    for size in args.sizes:
+        print(f'\n📦 메모 {size:,}개 - 읽기 {args.readers}개, 쓰기 {args.writers}개 프로세스, {args.duration:g}초')
+        with benchmark_database(size, rebuild=args.rebuild) as user:
+            rows = run_concurrency_test(user, args.readers, args.writers, args.duration, args.load_warmup)
+        print(format_concurrency(rows))
+        results.extend({'size': size, **row} for row in rows)
+
+    report = {
+        'environment': environment(
+            mode='sqlite_concurrency', readers=args.readers, writers=args.writers,
+            duration=args.duration, warmup=args.load_warmup,
+        ),
+        'results': results,
+    }
+    output = args.output or f"benchmarks/results/sqlite-{timezone.now():%Y%m%d-%H%M%S}.json"
+    write_report(report, output)
+    print(f'\n결과 저장: {output}')
+    return 0
+
+
+
+def run_render(args):
+    from django.utils import timezone
+
+    from benchmarks.dataset import benchmark_database
+    from benchmarks.report import environment, write_report
+    from benchmarks.rendering import format_render, run_render_test
+
+    # 렌더링 시간은 데이터셋 크기와 관계없으므로 가장 작은 데이터셋 사용
+    size = min(args.sizes)
+    if size < max(args.cards):
+        print(f'--sizes 의 가장 작은 크기({size:,})가 --cards 보다 작습니다.', file=sys.stderr)
+        return 2
+    print(f'\n📦 메모 {size:,}개 - 카드 {", ".join(map(str, args.cards))}개, {args.iterations}회')
+    with benchmark_database(size, rebuild=args.rebuild) as user:
+        rows = run_render_test(user, args.cards, args.iterations, args.warmup)
+    print(format_render(rows))
 
+    report = {
+        'environment': environment(mode='render', size=size, iterations=args.iterations, warmup=args.warmup),
+        'results': rows,
+    }
+    output = args.output or f"benchmarks/results/render-{timezone.now():%Y%m%d-%H%M%S}.json"
+    write_report(report, output)
+    print(f'\n결과 저장: {output}')
+    return 0
 
 if __name__ == '__main__':
-    tester = PerformanceTester()
-    tester.run_all_tests()
+    sys.exit(main())
@@ -17,17 +17,19 @@ document.addEventListener('DOMContentLoaded', function() {
         }, 5000); // 5초 후 자동 숨김
     });
     
-    // 확인 대화상자
-    const deleteButtons = document.querySelectorAll('.btn-delete, [href*="delete"]');
-    deleteButtons.forEach(function(button) {
-        button.addEventListener('click', function(e) {
-            const message = button.dataset.confirm || '정말로 삭제하시겠습니까?';
-            if (!confirm(message)) {
-                e.preventDefault();
-            }
-        });
+    // 확인 대화상자 (실시간으로 추가된 카드에도 적용되도록 이벤트 위임)
+    document.addEventListener('click', function(e) {
+        const button = e.target.closest('.btn-delete, [href*="delete"]');
+        if (!button) return;
+        const message = button.dataset.confirm || '정말로 삭제하시겠습니까?';
+        if (!confirm(message)) {
+            e.preventDefault();
+        }
     });
     
+    // 메모 변경 실시간 반영
+    MemoLive.connect(document.getElementById('memo-list'));
+    
     // 폼 제출 시 버튼 비활성화 (중복 제출 방지)
     const forms = document.querySelectorAll('form');
     forms.forEach(function(form) {
@@ -215,6 +217,68 @@ const MemoUtils = {
 // 전역 객체로 노출
 window.MemoUtils = MemoUtils;
 
+// 메모 변경 실시간 반영 (Server-Sent Events)
+// 다른 탭에서 작성/수정/삭제한 메모를 페이지를 다시 불러오지 않고 목록에 반영합니다.
+const MemoLive = {
+    connect: function(list) {
+        if (!list || !list.dataset.eventsUrl || !window.EventSource) return;
+        
+        const source = new EventSource(list.dataset.eventsUrl);
+        ['created', 'updated', 'deleted', 'resync'].forEach(function(type) {
+            source.addEventListener(type, function(e) {
+                MemoLive.apply(list, type, JSON.parse(e.data));
+            });
+        });
+    },
+    
+    apply: function(list, type, data) {
+        if (type === 'resync') {
+            this.notifyStale();
+            return;
+        }
+        
+        const card = list.querySelector('[data-memo-id="' + data.id + '"]');
+        if (type === 'deleted') {
+            if (card) card.remove();
+            this.toggleEmpty(list);
+            return;
+        }
+        
+        const template = document.createElement('template');
+        template.innerHTML = data.html.trim();
+        const newCard = template.content.firstElementChild;
+        
+        if (card && card.hasAttribute('data-pinned') === data.is_pinned) {
+            card.replaceWith(newCard);
+        } else if (card || (type === 'created' && list.hasAttribute('data-live-insert'))) {
+            // 고정 여부가 바뀌었거나 새 메모면 정렬 위치(고정 메모 다음 또는 맨 앞)에 삽입
+            if (card) card.remove();
+            this.insert(list, newCard, data.is_pinned);
+            this.toggleEmpty(list);
+        }
+    },
+    
+    // 메모가 없을 때의 안내는 목록에 카드가 없을 때만 표시
+    toggleEmpty: function(list) {
+        const empty = document.getElementById('memo-list-empty');
+        if (empty) empty.hidden = list.children.length > 0;
+    },
+    
+    insert: function(list, card, pinned) {
+        const cards = Array.from(list.children);
+        const firstUnpinned = cards.find(function(el) { return !el.hasAttribute('data-pinned'); });
+        list.insertBefore(card, pinned ? list.firstElementChild : (firstUnpinned || null));
+    },
+    
+    notifyStale: function() {
+        if (this.staleNotified) return;
+        this.staleNotified = true;
+        MemoUtils.showToast('다른 곳에서 메모가 변경되었습니다. <a href="" class="text-white fw-bold">새로고침</a>', 'info');
+    }
+};
+
+window.MemoLive = MemoLive;
+
 // 페이지 성능 모니터링
 if ('performance' in window) {
     window.addEventListener('load', function() {